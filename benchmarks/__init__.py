@@ -0,0 +1 @@
+"""오프라인 벤치마크 모음"""
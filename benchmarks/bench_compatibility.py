@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+사주 궁합 점수 벤치마크
+
+한 사용자를 후보 10만 명과 비교하는 비용을 측정합니다.
+(후보 사주 일괄 계산, 점수 계산, 페이지 정렬)
+
+사용법:
+    python benchmarks/bench_compatibility.py
+    python benchmarks/bench_compatibility.py --check
+    python benchmarks/bench_compatibility.py --update-baseline
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from benchmarks.bench_four_pillars import (  # noqa: E402
+    random_birth_dates_array,
+)
+from benchmarks.harness import Case, main_guard  # noqa: E402
+from src.four_pillars.domain.services.batch import (  # noqa: E402
+    calculate_four_pillars_batch,
+)
+from src.four_pillars.domain.services.calculator import (  # noqa: E402
+    FourPillarsCalculator,
+)
+from src.four_pillars.domain.services.compatibility import (  # noqa: E402
+    rank_compatibility,
+    score_compatibility,
+)
+
+CANDIDATES = 100_000
+
+
+def build_cases() -> list[Case]:
+    user = FourPillarsCalculator().calculate_four_pillar_codes(
+        datetime(1990, 5, 5, 13, 30)
+    )
+    birth_dates = random_birth_dates_array(CANDIDATES)
+    candidates = calculate_four_pillars_batch(birth_dates)
+    scores = score_compatibility(user, candidates)
+
+    def end_to_end():
+        batch = calculate_four_pillars_batch(birth_dates)
+        rank_compatibility(score_compatibility(user, batch), skip=0, limit=20)
+
+    return [
+        Case(
+            "compatibility_100k.score",
+            lambda: score_compatibility(user, candidates),
+            ops=CANDIDATES,
+        ),
+        Case(
+            "compatibility_100k.rank",
+            lambda: rank_compatibility(scores, skip=0, limit=20),
+            ops=CANDIDATES,
+        ),
+        Case(
+            "compatibility_100k.batch_score_rank",
+            end_to_end,
+            ops=CANDIDATES,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main_guard("compatibility", build_cases)
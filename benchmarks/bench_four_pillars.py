@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+four_pillars 도메인 서비스 벤치마크
+
+FourPillarsCalculator, FiveElementsAnalyzer, TenGodsAnalyzer,
+FourPillarsDataLoader의 단건 호출과 1만/100만 건 일괄 계산,
+데이터 로더 초기화(콜드 스타트) 비용을 측정합니다.
+
+사용법:
+    python benchmarks/bench_four_pillars.py                    # 측정 + JSON 저장
+    python benchmarks/bench_four_pillars.py --check            # 기준값 대비 회귀 검사
+    python benchmarks/bench_four_pillars.py --update-baseline  # 기준값 갱신
+    python benchmarks/bench_four_pillars.py --filter batch     # 일부 항목만 실행
+"""
+
+import asyncio
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import numpy as np  # noqa: E402
+
+from benchmarks.harness import Case, main_guard  # noqa: E402
+from src.four_pillars.domain.services.analyzer import (  # noqa: E402
+    FiveElementsAnalyzer,
+    TenGodsAnalyzer,
+)
+from src.four_pillars.domain.services.batch import (  # noqa: E402
+    calculate_four_pillars_batch,
+)
+from src.four_pillars.domain.services.calculator import (  # noqa: E402
+    FourPillarsCalculator,
+)
+from src.four_pillars.domain.services.data_loader import (  # noqa: E402
+    FourPillarsDataLoader,
+)
+from src.four_pillars.domain.services.pillar_table import (  # noqa: E402
+    PILLAR_TABLE_FILE,
+    PillarTable,
+)
+
+SEED = 20240101
+SMALL_BATCH = 10_000
+LARGE_BATCH = 1_000_000
+
+
+def random_birth_dates(size: int, seed: int = SEED) -> list[datetime]:
+    """1940~2010년 사이 생년월일시 (30%는 시간 미입력)"""
+    rng = random.Random(seed)
+    start = datetime(1940, 1, 1)
+    days = (datetime(2010, 12, 31) - start).days
+    birth_dates = []
+    for _ in range(size):
+        birth_date = start + timedelta(days=rng.randrange(days))
+        if rng.random() < 0.7:
+            birth_date += timedelta(minutes=rng.randrange(1, 24 * 60))
+        birth_dates.append(birth_date)
+    return birth_dates
+
+
+def random_birth_dates_array(size: int, seed: int = SEED) -> np.ndarray:
+    """random_birth_dates와 같은 분포의 datetime64[m] 배열"""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("1940-01-01", "m").astype(np.int64)
+    days = rng.integers(0, 25567, size)
+    minutes = np.where(
+        rng.random(size) < 0.7, rng.integers(1, 24 * 60, size), 0
+    )
+    return (start + days * 24 * 60 + minutes).astype("datetime64[m]")
+
+
+def load_data_loader_cold() -> FourPillarsDataLoader:
+    """싱글톤을 비우고 solar_terms.txt부터 다시 로드"""
+    previous = FourPillarsDataLoader._instance
+    FourPillarsDataLoader._instance = None
+    try:
+        return FourPillarsDataLoader()
+    finally:
+        FourPillarsDataLoader._instance = previous
+
+
+def build_cases() -> list[Case]:
+    calculator = FourPillarsCalculator()
+    five_elements = FiveElementsAnalyzer()
+    ten_gods = TenGodsAnalyzer()
+    data_loader = FourPillarsDataLoader()
+
+    birth_date = datetime(1990, 5, 5, 13, 30)
+    codes = calculator.calculate_four_pillar_codes(birth_date)
+    day_stem = codes.day % 10
+
+    small = random_birth_dates(SMALL_BATCH)
+    small_array = np.array(small, dtype="datetime64[m]")
+    large_array = random_birth_dates_array(LARGE_BATCH)
+
+    loop = asyncio.new_event_loop()
+
+    def codes_loop():
+        for value in small:
+            calculator.calculate_four_pillar_codes(value)
+
+    def detailed_loop():
+        for value in small:
+            pillars = calculator.calculate_four_pillar_codes(value)
+            five_elements.analyze(pillars)
+
+    return [
+        # 단건 호출
+        Case(
+            "calculator.four_pillar_codes",
+            lambda: calculator.calculate_four_pillar_codes(birth_date),
+        ),
+        Case(
+            "calculator.four_pillars",
+            lambda: calculator.calculate_four_pillars(birth_date),
+        ),
+        Case(
+            "calculator.four_pillars_detailed",
+            lambda: loop.run_until_complete(
+                calculator.calculate_four_pillars_detailed(birth_date)
+            ),
+        ),
+        Case(
+            "calculator.kanshi_indices",
+            lambda: calculator.calculate_kanshi_indices(1990, 5, 5, 13, 30),
+        ),
+        Case(
+            "five_elements.analyze",
+            lambda: five_elements.analyze(codes),
+        ),
+        Case(
+            "ten_gods.pillar_ten_gods",
+            lambda: ten_gods.get_pillar_ten_gods(codes.month, day_stem),
+        ),
+        Case(
+            "data_loader.get_setsuiri",
+            lambda: data_loader.get_setsuiri(1990, 5),
+        ),
+        Case(
+            "data_loader.get_kanshi",
+            lambda: data_loader.get_kanshi(codes.day),
+        ),
+        # 일괄 계산
+        Case(
+            "batch_10k.scalar_codes",
+            codes_loop,
+            ops=SMALL_BATCH,
+            repeat=3,
+        ),
+        Case(
+            "batch_10k.scalar_codes_and_elements",
+            detailed_loop,
+            ops=SMALL_BATCH,
+            repeat=3,
+        ),
+        Case(
+            "batch_10k.numpy",
+            lambda: calculate_four_pillars_batch(small_array),
+            ops=SMALL_BATCH,
+        ),
+        Case(
+            "batch_1m.numpy",
+            lambda: calculate_four_pillars_batch(large_array),
+            ops=LARGE_BATCH,
+            repeat=3,
+        ),
+        # 콜드 스타트
+        Case(
+            "cold_start.data_loader",
+            load_data_loader_cold,
+            repeat=3,
+        ),
+        Case(
+            "cold_start.pillar_table",
+            lambda: PillarTable.load(PILLAR_TABLE_FILE),
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main_guard("four_pillars", build_cases)
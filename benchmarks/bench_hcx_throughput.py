@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+HCX 의존 엔드포인트 처리량 벤치마크
+
+로컬 HCX 대역 서버(benchmarks/fake_hcx.py)를 같은 프로세스에서 띄우고
+HCXClient와 HCX를 호출하는 세 서비스(사주 설명, 로또 추천, 오늘의 운세)를
+동시 요청 수를 늘려 가며 호출합니다. 동시 요청 수별 처리량(req/s)과
+지연 시간 백분위수(p50/p90/p99), 실패 수를 출력하고
+benchmarks/results/hcx_throughput.json에 저장합니다.
+
+DB 대신 메모리 리포지토리를 사용하고 응답 캐시(HCX_CACHE_ENABLED)는 끕니다.
+요청마다 프롬프트가 달라 single-flight로 합쳐지지 않으며,
+HCXClient의 동시 호출 제한(HCX_MAX_CONCURRENCY)은 그대로 적용됩니다.
+
+사용법:
+    python benchmarks/bench_hcx_throughput.py
+    python benchmarks/bench_hcx_throughput.py --concurrency 1 8 32 --requests 200
+    python benchmarks/bench_hcx_throughput.py --targets lotto --latency-median 1.0 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Awaitable, Callable, Dict, List
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from benchmarks.fake_hcx import FakeHCXConfig, serve_in_background  # noqa: E402
+from benchmarks.harness import RESULTS_DIR, environment_info, log  # noqa: E402
+from src.common.logger import logger  # noqa: E402
+from src.config.config import hcx_config  # noqa: E402
+from src.fortune.application.service import FortuneService  # noqa: E402
+from src.four_pillars.domain.constants import JIKKAN, JYUNISHI  # noqa: E402
+from src.four_pillars.domain.entities.enums import FiveElements  # noqa: E402
+from src.four_pillars.infrastructure.description_cache import (  # noqa: E402
+    FourPillarDescriptionCache,
+)
+from src.four_pillars.infrastructure.description_generator import (  # noqa: E402
+    FourPillarDescriptionGenerator,
+)
+from src.hcx_client.client import HCXClient  # noqa: E402
+from src.hcx_client.metrics import HCXMetrics  # noqa: E402
+from src.lotto.application.service import LottoService  # noqa: E402
+
+TARGETS = ("client", "four_pillar", "lotto", "daily_fortune")
+
+
+class MemoryUserRepository:
+    """사용자 조회만 지원하는 메모리 리포지토리"""
+
+    def __init__(self):
+        self.users: Dict[str, SimpleNamespace] = {}
+
+    def add_random_user(self, rng: random.Random) -> str:
+        user_id = f"bench-{len(self.users)}"
+        elements = rng.sample([e.value for e in FiveElements], 2)
+        self.users[user_id] = SimpleNamespace(
+            id=user_id,
+            four_pillar={
+                **random_four_pillar(rng),
+                "strong_element": elements[0],
+                "weak_element": elements[1],
+            },
+        )
+        return user_id
+
+    async def get_user_by_id(self, user_id: str):
+        return self.users.get(user_id)
+
+
+class MemoryLottoRepository:
+    """로또 추천 생성에 필요한 메서드만 지원하는 메모리 리포지토리"""
+
+    async def get_latest_round(self) -> int:
+        return 1180
+
+    async def get_lotto_statistics_version(self) -> datetime:
+        return datetime(2025, 7, 19)
+
+    async def get_lotto_statistics(self, sort_type=None, include_bonus=True):
+        # 번호별 통계 45행 (통계 스냅샷이 frequent/excluded 번호를 계산)
+        return [
+            SimpleNamespace(
+                num=num,
+                main_count=100 + (num * 7) % 45,
+                bonus_count=num % 5,
+                total_count=100 + (num * 7) % 45 + num % 5,
+                last_round=1180 - (num * 11) % 30,
+            )
+            for num in range(1, 46)
+        ]
+
+    async def create_lotto_recommendation(
+        self, user_id: str, round: int, content: dict
+    ):
+        return SimpleNamespace(
+            user_id=user_id, round=round, content=content, is_finished=False
+        )
+
+
+class MemoryFortuneRepository:
+    """오늘의 운세 상세 생성에 필요한 메서드만 지원하는 메모리 리포지토리"""
+
+    def __init__(self):
+        self.next_id = 1
+
+    async def get_user_daily_fortune_detail(
+        self, user_id: str, fortune_date: date
+    ):
+        return None
+
+    async def create_user_daily_fortune_detail(self, **kwargs):
+        model = SimpleNamespace(id=self.next_id, **kwargs)
+        self.next_id += 1
+        return model
+
+
+def random_four_pillar(rng: random.Random) -> Dict[str, str]:
+    def pillar() -> str:
+        return rng.choice(JIKKAN) + rng.choice(JYUNISHI)
+
+    return {
+        "year_pillar": pillar(),
+        "month_pillar": pillar(),
+        "day_pillar": pillar(),
+        "time_pillar": pillar(),
+    }
+
+
+def build_target(
+    name: str, rng: random.Random
+) -> Callable[[int], Awaitable[object]]:
+    """요청 번호를 받아 한 건을 처리하는 코루틴 함수"""
+    if name == "client":
+
+        async def call_client(index: int):
+            return await HCXClient().call_completion(
+                system_prompt="너는 벤치마크용 대역이오.",
+                user_prompt=f"요청 {index}",
+                use_cache=False,
+            )
+
+        return call_client
+
+    if name == "four_pillar":
+        generator = FourPillarDescriptionGenerator()
+
+        async def call_four_pillar(index: int):
+            # 메모리 캐시에 적중하지 않도록 매번 비움
+            FourPillarDescriptionCache().clear()
+            return await generator.generate_for(
+                random_four_pillar(rng), rng.choice(list(FiveElements))
+            )
+
+        return call_four_pillar
+
+    users = MemoryUserRepository()
+    if name == "lotto":
+        service = LottoService(MemoryLottoRepository(), users)
+
+        async def call_lotto(index: int):
+            return await service.create_lotto_recommendation(
+                users.add_random_user(rng)
+            )
+
+        return call_lotto
+
+    if name == "daily_fortune":
+        service = FortuneService(MemoryFortuneRepository(), users)
+        today = datetime.now().date()
+
+        async def call_daily_fortune(index: int):
+            return await service.get_user_daily_fortune_detail(
+                users.add_random_user(rng), today
+            )
+
+        return call_daily_fortune
+
+    raise ValueError(f"알 수 없는 대상: {name}")
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(int(len(ordered) * q), len(ordered) - 1)
+    return ordered[index]
+
+
+async def run_level(
+    call: Callable[[int], Awaitable[object]], concurrency: int, requests: int
+) -> Dict[str, object]:
+    """concurrency개의 작업자가 requests건을 나눠 처리합니다."""
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for index in counter:
+            start = time.perf_counter()
+            try:
+                await call(index)
+            except Exception as e:
+                name = type(e).__name__
+                errors[name] = errors.get(name, 0) + 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "succeeded": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2)
+        if elapsed
+        else 0.0,
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 0.9) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 1)
+        if latencies
+        else 0.0,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, object]:
+    config = FakeHCXConfig(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    rng = random.Random(args.seed)
+    # 응답 캐시가 켜져 있으면 HCX 호출 비용이 아닌 캐시 적중을 측정하게 됨
+    hcx_config.HCX_CACHE_ENABLED = False
+
+    results: Dict[str, List[Dict[str, object]]] = {}
+    async with serve_in_background(config) as url:
+        # 대역 서버 시작 시 로그 레벨이 재설정되므로 그 뒤에 적용
+        if not args.verbose:
+            logger.setLevel(logging.ERROR)
+        client = HCXClient()
+        client.url = url
+        client.open()
+        try:
+            for name in args.targets:
+                call = build_target(name, rng)
+                log(f"\n[{name}]")
+                log(
+                    f"{'동시':>6} {'성공':>6} {'실패':>6} {'req/s':>9} "
+                    f"{'p50':>9} {'p90':>9} {'p99':>9}"
+                )
+                results[name] = []
+                for concurrency in args.concurrency:
+                    HCXMetrics().clear()
+                    level = await run_level(call, concurrency, args.requests)
+                    level["hcx_statuses"] = {
+                        key: m["statuses"]
+                        for key, m in HCXMetrics().snapshot().items()
+                    }
+                    results[name].append(level)
+                    failed = sum(level["errors"].values())
+                    log(
+                        f"{concurrency:>6} {level['succeeded']:>6} {failed:>6} "
+                        f"{level['throughput_rps']:>9} "
+                        f"{level['p50_ms']:>7}ms {level['p90_ms']:>7}ms "
+                        f"{level['p99_ms']:>7}ms"
+                    )
+            pool = client.pool_stats()
+        finally:
+            await client.close()
+
+    return {
+        "suite": "hcx_throughput",
+        "environment": environment_info(),
+        "fake_hcx": {
+            "latency_median": config.latency_median,
+            "latency_sigma": config.latency_sigma,
+            "error_rate": config.error_rate,
+        },
+        "max_concurrency": hcx_config.HCX_MAX_CONCURRENCY,
+        "client": pool,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HCX 처리량 벤치마크")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16, 64]
+    )
+    parser.add_argument(
+        "--requests", type=int, default=100, help="동시 요청 수별 요청 건수"
+    )
+    parser.add_argument(
+        "--targets", nargs="+", choices=TARGETS, default=list(TARGETS)
+    )
+    parser.add_argument("--latency-median", type=float, default=0.2)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--verbose", action="store_true", help="서비스 로그(재시도 등) 출력"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / "hcx_throughput.json"
+    output.write_text(
+        json.dumps(report, ensure_ascii=False, indent=2, default=str),
+        encoding="utf-8",
+    )
+    log(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
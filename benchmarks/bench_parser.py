@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+HCX 응답 JSON 파싱 벤치마크
+
+benchmarks/data/hcx_responses.json의 응답 모음(코드 블록, 앞뒤 문장, 끝의 쉼표,
+잘린 응답 등)을 기존 정규식 방식과 Parser.parse_json으로 파싱하는 비용을 비교하고,
+응답 종류별 복구 경로와 실패 여부를 출력합니다.
+
+사용법:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --check
+    python benchmarks/bench_parser.py --update-baseline
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from benchmarks.harness import (  # noqa: E402
+    BENCHMARKS_DIR,
+    Case,
+    log,
+    main_guard,
+)
+from src.hcx_client.common.parser import Parser  # noqa: E402
+
+CORPUS_PATH = BENCHMARKS_DIR / "data" / "hcx_responses.json"
+
+
+def load_corpus() -> list[dict]:
+    return json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+
+
+def legacy_parse_json(content: str):
+    """정규식 두 번 + json.loads로 파싱하던 이전 방식 (비교용)"""
+    json_match = re.search(r"```json\s*(\{.*?\})\s*```", content, re.DOTALL)
+    if json_match:
+        return json.loads(json_match.group(1))
+    code_match = re.search(r"```\s*(\{.*?\})\s*```", content, re.DOTALL)
+    if code_match:
+        return json.loads(code_match.group(1))
+    return json.loads(content)
+
+
+def parse_all(parse, contents: list[str]) -> int:
+    """파싱에 실패한 응답 수"""
+    failures = 0
+    for content in contents:
+        try:
+            parse(content)
+        except ValueError:
+            failures += 1
+    return failures
+
+
+def report_paths(corpus: list[dict]) -> None:
+    log(f"{'종류':<30} {'기존':>8} {'현재':>24}")
+    for entry in corpus:
+        try:
+            legacy_parse_json(entry["content"])
+            legacy = "성공"
+        except ValueError:
+            legacy = "실패"
+        try:
+            _, path = Parser._extract(entry["content"])
+        except ValueError:
+            path = "실패"
+        name = f"{entry['prompt_key']}.{entry['kind']}"
+        log(f"{name:<30} {legacy:>8} {path:>24}")
+
+
+def build_cases() -> list[Case]:
+    corpus = load_corpus()
+    contents = [entry["content"] for entry in corpus]
+    # 기존 방식도 파싱할 수 있는 응답 (같은 조건 비교용)
+    valid = [
+        content
+        for content in contents
+        if parse_all(legacy_parse_json, [content]) == 0
+    ]
+    report_paths(corpus)
+
+    return [
+        Case(
+            "parser.legacy_regex",
+            lambda: parse_all(legacy_parse_json, contents),
+            ops=len(contents),
+        ),
+        Case(
+            "parser.parse_json",
+            lambda: parse_all(Parser.parse_json, contents),
+            ops=len(contents),
+        ),
+        Case(
+            "parser.legacy_regex.valid",
+            lambda: parse_all(legacy_parse_json, valid),
+            ops=len(valid),
+        ),
+        Case(
+            "parser.parse_json.valid",
+            lambda: parse_all(Parser.parse_json, valid),
+            ops=len(valid),
+        ),
+        Case(
+            "parser.extract",
+            lambda: parse_all(Parser._extract, contents),
+            ops=len(contents),
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main_guard("parser", build_cases)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+로컬 HCX 대역 서버
+
+HCXClient가 사용하는 chat completion 계약(상태 코드 봉투, SSE 스트리밍)을 그대로
+흉내 내는 서버입니다. 지연 시간 분포(로그 정규), 오류 비율, fortune.yaml의
+프롬프트별 고정 응답을 설정할 수 있어 HCX 없이 LLM 엔드포인트를 측정할 수 있습니다.
+
+프롬프트 종류는 system 프롬프트가 fortune.yaml의 어느 프롬프트로 시작하는지로
+판별합니다.
+
+사용법:
+    python benchmarks/fake_hcx.py --port 8090
+    python benchmarks/fake_hcx.py --latency-median 1.5 --latency-sigma 0.6 --error-rate 0.05
+    HCX_URL=http://127.0.0.1:8090/v1/chat-completions/HCX-003 uvicorn src.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
+
+from src.hcx_client.common.prompt_registry import PromptRegistry  # noqa: E402
+
+PROMPT_FILE = "fortune.yaml"
+
+# 프롬프트별 고정 응답 (각 서비스의 파서가 기대하는 형식)
+CANNED_RESPONSES: Dict[str, str] = {
+    "four_pillar": "큰 산처럼 듬직하여 어려움 속에서도 흔들림 없이 길을 가는 사주요",
+    "lotto": (
+        "```json\n"
+        + json.dumps(
+            {
+                "reason": "목의 기운이 강하니 3과 8이 힘을 보태고, "
+                "재물의 흐름은 5와 10에 머무르오.",
+                "num1": 3,
+                "num2": 8,
+                "num3": 5,
+                "num4": 10,
+                "num5": 27,
+                "num6": 34,
+                "cold_nums": [1, 2],
+            },
+            ensure_ascii=False,
+        )
+        + "\n```"
+    ),
+    "daily_fortune": (
+        "```json\n"
+        + json.dumps(
+            {
+                "score": 78,
+                "comment": "작은 기회가 큰 결실로 이어지는 날이오",
+                "money_fortune": "들어오는 돈이 나가는 돈보다 많으니 서두르지 마시오.",
+                "job_fortune": "윗사람의 도움으로 막힌 일이 풀리겠소.",
+                "love_fortune": "오래된 인연에게서 반가운 소식이 오겠소.",
+            },
+            ensure_ascii=False,
+        )
+        + "\n```"
+    ),
+}
+UNKNOWN_RESPONSE = "알 수 없는 프롬프트요"
+
+
+@dataclass
+class FakeHCXConfig:
+    """대역 서버 설정
+
+    지연 시간은 중앙값 latency_median초, 로그 표준편차 latency_sigma의
+    로그 정규 분포를 따릅니다. 스트리밍은 같은 지연 시간을 조각 수로 나눠 보냅니다.
+    """
+
+    latency_median: float = 0.5
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    # 오류 중 429(요청 한도 초과)의 비율, 나머지는 500
+    rate_limit_share: float = 0.5
+    stream_chunk_chars: int = 8
+    seed: Optional[int] = None
+    responses: Dict[str, str] = field(
+        default_factory=lambda: dict(CANNED_RESPONSES)
+    )
+
+
+def _system_prompt_prefixes() -> Dict[str, str]:
+    """프롬프트 키 -> system 프롬프트의 고정 앞부분 (첫 placeholder 전까지)"""
+    registry = PromptRegistry()
+    prefixes = {}
+    for prompt_key in CANNED_RESPONSES:
+        template = registry.get(PROMPT_FILE, prompt_key)
+        if template is not None:
+            prefixes[prompt_key] = template.system_prompt.split("{", 1)[
+                0
+            ].strip()
+    return prefixes
+
+
+def _envelope(code: str, message: str, result: Optional[dict] = None) -> dict:
+    body = {"status": {"code": code, "message": message}}
+    if result is not None:
+        body["result"] = result
+    return body
+
+
+def create_app(config: FakeHCXConfig) -> FastAPI:
+    """대역 서버 앱"""
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+    rng = random.Random(config.seed)
+    prefixes = _system_prompt_prefixes()
+    app.state.requests = 0
+
+    def detect_prompt_key(system_prompt: str) -> Optional[str]:
+        for prompt_key, prefix in prefixes.items():
+            if prefix and system_prompt.strip().startswith(prefix):
+                return prompt_key
+        return None
+
+    def sample_latency() -> float:
+        return config.latency_median * math.exp(
+            rng.gauss(0.0, config.latency_sigma)
+        )
+
+    @app.post("/{path:path}")
+    async def completion(request: Request, path: str):
+        app.state.requests += 1
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            return JSONResponse(
+                _envelope("40100", "Unauthorized"), status_code=401
+            )
+
+        try:
+            body = await request.json()
+            messages = body["messages"]
+            system_prompt = next(
+                (m["content"] for m in messages if m["role"] == "system"), ""
+            )
+            user_prompt = next(
+                (m["content"] for m in messages if m["role"] == "user"), ""
+            )
+        except (ValueError, KeyError, TypeError, StopIteration):
+            return JSONResponse(
+                _envelope("40000", "Bad Request"), status_code=400
+            )
+
+        latency = sample_latency()
+        if rng.random() < config.error_rate:
+            await asyncio.sleep(latency / 2)
+            if rng.random() < config.rate_limit_share:
+                return JSONResponse(
+                    _envelope("42901", "Too Many Requests"), status_code=429
+                )
+            return JSONResponse(
+                _envelope("50000", "Internal Server Error"), status_code=500
+            )
+
+        prompt_key = detect_prompt_key(system_prompt)
+        content = config.responses.get(prompt_key, UNKNOWN_RESPONSE)
+        usage = {
+            "inputLength": len(system_prompt) + len(user_prompt),
+            "outputLength": len(content),
+        }
+
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                _stream(content, usage, latency, config.stream_chunk_chars),
+                media_type="text/event-stream",
+            )
+
+        await asyncio.sleep(latency)
+        return JSONResponse(
+            _envelope(
+                "20000",
+                "OK",
+                {
+                    "message": {"role": "assistant", "content": content},
+                    "stopReason": "stop_before",
+                    **usage,
+                },
+            )
+        )
+
+    return app
+
+
+async def _stream(
+    content: str, usage: dict, latency: float, chunk_chars: int
+) -> AsyncIterator[bytes]:
+    chunks = [
+        content[i : i + chunk_chars]
+        for i in range(0, len(content), chunk_chars)
+    ] or [""]
+    delay = latency / len(chunks)
+    for index, chunk in enumerate(chunks):
+        await asyncio.sleep(delay)
+        data = {"message": {"role": "assistant", "content": chunk}}
+        yield _sse(f"{index}", "token", data)
+    data = {"message": {"role": "assistant", "content": content}, **usage}
+    yield _sse(f"{len(chunks)}", "result", data)
+    yield _sse(f"{len(chunks) + 1}", "signal", {"data": "[DONE]"})
+
+
+def _sse(event_id: str, event: str, data: dict) -> bytes:
+    body = json.dumps(data, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event}\ndata: {body}\n\n".encode("utf-8")
+
+
+@asynccontextmanager
+async def serve_in_background(
+    config: FakeHCXConfig, host: str = "127.0.0.1", port: int = 0
+) -> AsyncIterator[str]:
+    """현재 이벤트 루프에서 대역 서버를 실행하고 completion URL을 반환합니다."""
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(config),
+            host=host,
+            port=port,
+            log_level="warning",
+            access_log=False,
+            # 대량 동시 접속 측정 시 기본 backlog(2048)로 부족하지 않도록
+            backlog=4096,
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if task.done():
+                task.result()
+            await asyncio.sleep(0.01)
+        bound_port = server.servers[0].sockets[0].getsockname()[1]
+        yield f"http://{host}:{bound_port}/v1/chat-completions/HCX-003"
+    finally:
+        server.should_exit = True
+        await task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 HCX 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument(
+        "--latency-median",
+        type=float,
+        default=0.5,
+        help="지연 시간 중앙값 (초)",
+    )
+    parser.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0.5,
+        help="지연 시간 로그 표준편차",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeHCXConfig(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(
+        f"HCX_URL=http://{args.host}:{args.port}/v1/chat-completions/HCX-003",
+        flush=True,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""벤치마크 공통 실행기
+
+각 벤치마크 파일은 측정 항목(Case) 목록을 만들고 run_suite()에 넘깁니다.
+
+- 시간: timeit으로 반복 횟수를 자동 보정한 뒤 여러 번 측정하여 중앙값 사용
+- 메모리: tracemalloc으로 한 번 실행하는 동안의 최대 추가 할당량(peak) 측정
+- 결과: benchmarks/results/<suite>.json (기계 판독용)
+- 회귀 검사: benchmarks/baselines/<suite>.json의 기준값보다
+  허용 비율 이상 느려진 항목이 있으면 실패 (종료 코드 1)
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+BENCHMARKS_DIR = Path(__file__).parent
+RESULTS_DIR = BENCHMARKS_DIR / "results"
+BASELINES_DIR = BENCHMARKS_DIR / "baselines"
+
+# 기준값 대비 허용하는 속도 저하 비율 (기본 50%)
+DEFAULT_TOLERANCE = 0.5
+
+
+@dataclass
+class Case:
+    """측정 항목
+
+    func 한 번 호출이 ops개의 작업을 처리하면 ns_per_op는 ops로 나눈 값입니다.
+    measure가 주어지면 timeit 대신 직접 측정한 초 단위 시간 목록을 사용합니다.
+    """
+
+    name: str
+    func: Optional[Callable[[], object]] = None
+    ops: int = 1
+    repeat: int = 5
+    measure: Optional[Callable[[], Sequence[float]]] = None
+    track_memory: bool = True
+
+
+@dataclass
+class Result:
+    name: str
+    ops: int
+    calls: int
+    ns_per_op: float
+    min_ns_per_op: float
+    ops_per_sec: float
+    peak_bytes: Optional[int]
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+def measure_peak_bytes(func: Callable[[], object]) -> int:
+    """func 한 번 실행하는 동안 추가로 할당된 최대 메모리"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - start, 0)
+
+
+def run_case(case: Case) -> Result:
+    if case.measure is not None:
+        seconds = list(case.measure())
+        calls = len(seconds)
+    else:
+        timer = timeit.Timer(case.func)
+        number, _ = timer.autorange()
+        seconds = [t / number for t in timer.repeat(case.repeat, number)]
+        calls = number * case.repeat
+
+    ns_per_op = statistics.median(seconds) * 1e9 / case.ops
+    min_ns_per_op = min(seconds) * 1e9 / case.ops
+    peak_bytes = (
+        measure_peak_bytes(case.func)
+        if case.track_memory and case.func is not None
+        else None
+    )
+    return Result(
+        name=case.name,
+        ops=case.ops,
+        calls=calls,
+        ns_per_op=round(ns_per_op, 1),
+        min_ns_per_op=round(min_ns_per_op, 1),
+        ops_per_sec=round(1e9 / ns_per_op, 1) if ns_per_op else 0.0,
+        peak_bytes=peak_bytes,
+    )
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def check_regressions(
+    results: Sequence[Result], baseline_path: Path
+) -> list[str]:
+    """기준값보다 허용 비율 이상 느려진 항목의 메시지 목록"""
+    if not baseline_path.exists():
+        return [f"기준 파일이 없습니다: {baseline_path}"]
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    failures = []
+    for result in results:
+        entry = baseline.get("benchmarks", {}).get(result.name)
+        if entry is None:
+            continue
+        limit = entry["ns_per_op"] * (1 + entry.get("tolerance", tolerance))
+        if result.ns_per_op > limit:
+            failures.append(
+                f"{result.name}: {format_ns(result.ns_per_op)}/op "
+                f"> 기준 {format_ns(entry['ns_per_op'])}/op "
+                f"(허용 {format_ns(limit)})"
+            )
+    return failures
+
+
+def write_baseline(results: Sequence[Result], baseline_path: Path) -> None:
+    """현재 결과를 기준값으로 저장 (항목별 tolerance는 유지)"""
+    baseline = {"tolerance": DEFAULT_TOLERANCE, "benchmarks": {}}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    entries = baseline.setdefault("benchmarks", {})
+    for result in results:
+        entry = entries.setdefault(result.name, {})
+        entry["ns_per_op"] = result.ns_per_op
+
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(
+        json.dumps(baseline, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def environment_info() -> dict:
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    try:
+        import numpy
+
+        info["numpy"] = numpy.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def run_suite(
+    suite: str,
+    cases: Sequence[Case],
+    argv: Optional[Sequence[str]] = None,
+) -> int:
+    """측정 항목을 실행하고 JSON 저장/회귀 검사를 수행합니다."""
+    parser = argparse.ArgumentParser(description=f"{suite} 벤치마크")
+    parser.add_argument(
+        "--output", type=Path, default=RESULTS_DIR / f"{suite}.json"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINES_DIR / f"{suite}.json"
+    )
+    parser.add_argument(
+        "--filter", default=None, help="이름에 이 문자열이 포함된 항목만 실행"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="기준값 대비 회귀 시 실패"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="현재 결과를 기준값으로 저장",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        case for case in cases if not args.filter or args.filter in case.name
+    ]
+    results = []
+    for case in selected:
+        result = run_case(case)
+        results.append(result)
+        peak = (
+            f", peak {result.peak_bytes / 1024:.1f}KiB"
+            if result.peak_bytes is not None
+            else ""
+        )
+        log(
+            f"{result.name:<45} {format_ns(result.ns_per_op):>10}/op "
+            f"({result.ops_per_sec:,.0f} ops/s{peak})"
+        )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {
+                "suite": suite,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "environment": environment_info(),
+                "results": [asdict(result) for result in results],
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    log(f"결과 저장: {args.output}")
+
+    if args.update_baseline:
+        write_baseline(results, args.baseline)
+        log(f"기준값 저장: {args.baseline}")
+
+    if args.check:
+        failures = check_regressions(results, args.baseline)
+        for failure in failures:
+            log(f"회귀: {failure}")
+        if failures:
+            return 1
+        log("회귀 없음")
+    return 0
+
+
+def main_guard(suite: str, cases_factory: Callable[[], Sequence[Case]]) -> None:
+    """벤치마크 파일의 __main__ 진입점"""
+    sys.exit(run_suite(suite, cases_factory()))
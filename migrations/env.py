@@ -29,10 +29,11 @@ from src.config.database import Base
 
 # 모든 도메인 모델을 import하여 메타데이터에 포함해야 함
 from src.users.domain.entities.models import User
-from src.lotto.domain.entities.models import LottoStatistics, LottoDraws, LottoRecommendations
+from src.lotto.domain.entities.models import LottoStatistics, LottoStatisticsRound, LottoDraws, LottoRecommendations
 from src.fortune.domain.entities.models import DailyFortuneResource, UserDailyFortuneSummary, UserDailyFortuneDetail
 from src.lotto_stores.domain.entities.models import LottoStore, LottoStoreWinning
 from src.atm.domain.entities.models import Atm
+from src.four_pillars.domain.entities.models import FourPillarDescription
 
 # 모델 메타데이터 설정
 target_metadata = Base.metadata
@@ -27,7 +27,8 @@ load_dotenv()
 
 from src.config.database import Mysql
 from src.config.config import db_config
-from src.lotto.domain.entities.models import LottoDraws, LottoStatistics
+from src.lotto.domain.entities.models import LottoDraws
+from src.lotto.infrastructure.repository import LottoRepository
 from src.users.domain.entities.models import User  # relationship 초기화용
 
 
@@ -107,44 +108,13 @@ class LottoDataImporter:
     ) -> None:
         """로또 통계 데이터를 업데이트합니다."""
         try:
-            # 메인 번호들 (1-6번)
-            main_numbers = [
-                lotto_data["num1"],
-                lotto_data["num2"],
-                lotto_data["num3"],
-                lotto_data["num4"],
-                lotto_data["num5"],
-                lotto_data["num6"],
-            ]
-            bonus_number = lotto_data["bonus_num"]
-
-            # 각 번호에 대한 통계 업데이트
-            for num in range(1, 46):
-                # 기존 통계 조회
-                stat = await db_session.execute(
-                    select(LottoStatistics).where(LottoStatistics.num == num)
-                )
-                stat = stat.scalar_one_or_none()
-
-                if not stat:
-                    # 새로운 통계 생성
-                    stat = LottoStatistics(
-                        num=num, main_count=0, bonus_count=0, total_count=0
-                    )
-                    db_session.add(stat)
-
-                # 카운트 업데이트
-                if num in main_numbers:
-                    stat.main_count += 1
-                    stat.total_count += 1
-                elif num == bonus_number:
-                    stat.bonus_count += 1
-                    stat.total_count += 1
-
-                # 마지막 출현 정보 업데이트
-                if num in main_numbers or num == bonus_number:
-                    stat.last_round = lotto_data["round"]
-                    stat.last_date = lotto_data["draw_date"]
+            # 반영 회차를 기록하여 같은 회차를 두 번 더하지 않음
+            applied = await LottoRepository(
+                db_session
+            ).update_lotto_statistics(lotto_data)
+            if not applied:
+                print(f"회차 {lotto_data['round']}: 이미 통계에 반영됨")
+                return
 
             await db_session.commit()
             print(f"회차 {lotto_data['round']}: 통계 업데이트 완료")
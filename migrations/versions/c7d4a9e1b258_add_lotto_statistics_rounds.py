@@ -0,0 +1,38 @@
+"""add lotto statistics rounds
+
+Revision ID: c7d4a9e1b258
+Revises: 3b8e1f2c9d47
+Create Date: 2026-10-17 15:40:12.284913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d4a9e1b258'
+down_revision: Union[str, Sequence[str], None] = '3b8e1f2c9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('lotto_statistics_rounds',
+    sa.Column('round', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('round')
+    )
+    # 기존 lotto_statistics는 저장된 모든 회차를 반영하고 있으므로 처리 완료로 표시
+    op.execute(
+        "INSERT INTO lotto_statistics_rounds (round, created_at, updated_at) "
+        "SELECT round, NOW(), NOW() FROM lotto_draws"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('lotto_statistics_rounds')
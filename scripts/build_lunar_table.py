@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+음력 변환 테이블(lunar_table.bin) 생성 스크립트
+
+korean_lunar_calendar(한국천문연구원 기준)로 음력 연도별 설날, 윤달,
+월 시작일을 계산하여 static 폴더에 저장합니다. 서버는 생성된 테이블만 읽으므로
+korean_lunar_calendar는 개발 의존성입니다.
+
+사용법:
+    python scripts/build_lunar_table.py           # 생성
+    python scripts/build_lunar_table.py --verify  # 생성 후 모든 날짜를 라이브러리와 비교
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from korean_lunar_calendar import KoreanLunarCalendar
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.four_pillars.domain.services.lunar_table import (  # noqa: E402
+    LUNAR_TABLE_FILE,
+    LunarTable,
+    write_lunar_table,
+)
+
+# 사주 조회 테이블(solar_terms.txt)과 같은 시작 연도
+FIRST_YEAR = 1873
+LAST_YEAR = 2049
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+def lunar_new_year(calendar: KoreanLunarCalendar, lunar_year: int) -> date:
+    calendar.setLunarDate(lunar_year, 1, 1, False)
+    return date.fromisoformat(calendar.SolarIsoFormat())
+
+
+def to_lunar(calendar: KoreanLunarCalendar, target: date) -> tuple:
+    calendar.setSolarDate(target.year, target.month, target.day)
+    return (
+        calendar.lunarYear,
+        calendar.lunarMonth,
+        calendar.lunarDay,
+        bool(calendar.isIntercalation),
+    )
+
+
+def iter_records(calendar: KoreanLunarCalendar, first: int, last: int):
+    """음력 연도별 (설날 ordinal, 윤달, 월 시작 일수) 생성"""
+    for lunar_year in range(first, last + 1):
+        new_year = lunar_new_year(calendar, lunar_year)
+        next_new_year = lunar_new_year(calendar, lunar_year + 1)
+
+        leap_month = 0
+        month_starts = []
+        current = new_year
+        while current < next_new_year:
+            _, month, day, is_leap = to_lunar(calendar, current)
+            if day == 1:
+                month_starts.append((current - new_year).days)
+                if is_leap:
+                    leap_month = month
+            current += timedelta(days=1)
+        month_starts.append((next_new_year - new_year).days)
+
+        yield new_year.toordinal(), leap_month, month_starts
+
+
+def verify(calendar: KoreanLunarCalendar, table: LunarTable) -> int:
+    """테이블 범위의 모든 양력 날짜에 대해 양방향 변환을 라이브러리와 비교"""
+    mismatches = 0
+    current = lunar_new_year(calendar, table.first_year)
+    last = lunar_new_year(calendar, table.last_year + 1)
+    while current < last:
+        expected = to_lunar(calendar, current)
+        actual = table.to_lunar(current)
+        solar = table.to_solar(*expected)
+        if expected != actual or solar != current:
+            mismatches += 1
+            log(f"불일치 {current} {expected} != {actual}, {solar}")
+        current += timedelta(days=1)
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="음력 변환 테이블 생성")
+    parser.add_argument("--output", type=Path, default=LUNAR_TABLE_FILE)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    calendar = KoreanLunarCalendar()
+    count = write_lunar_table(
+        args.output, FIRST_YEAR, iter_records(calendar, FIRST_YEAR, LAST_YEAR)
+    )
+    log(
+        f"{args.output}: 음력 {FIRST_YEAR} ~ {LAST_YEAR}년, {count}개 연도 저장 완료"
+    )
+
+    if args.verify:
+        mismatches = verify(calendar, LunarTable.load(args.output))
+        log(f"검증 완료: 불일치 {mismatches}건")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
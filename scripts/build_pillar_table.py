@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+사주 조회 테이블(pillar_table.bin) 생성 스크립트
+
+solar_terms.txt가 포함하는 모든 연도의 날짜에 대해 년주/월주/일주 인덱스와
+절입 시각, 시주 테이블을 미리 계산하여 static 폴더에 저장합니다.
+solar_terms.txt를 수정한 경우 다시 실행해야 합니다.
+
+사용법:
+    python scripts/build_pillar_table.py           # 생성
+    python scripts/build_pillar_table.py --verify  # 생성 후 직접 계산 결과와 비교
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.four_pillars.domain.services.calculator import (  # noqa: E402
+    FourPillarsCalculator,
+)
+from src.four_pillars.domain.services.pillar_table import (  # noqa: E402
+    FLAG_YEAR_TERM,
+    NO_TERM,
+    PILLAR_TABLE_FILE,
+    PillarTable,
+    write_pillar_table,
+)
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+def build_hour_table() -> list[int]:
+    """[일간 % 5][시지] -> 시주 60간지 인덱스"""
+    table = []
+    for stem_group in range(5):
+        for branch in range(12):
+            stem = (stem_group * 2 + branch) % 10
+            table.append(
+                next(i for i in range(branch, 60, 12) if i % 10 == stem)
+            )
+    return table
+
+
+def iter_records(calculator: FourPillarsCalculator, first: date, last: date):
+    """날짜별 레코드 (year, month, day, flags, term_minute) 생성"""
+    current = first
+    while current <= last:
+        year, month, day = current.year, current.month, current.day
+        before = calculator.calculate_kanshi_indices(year, month, day)
+
+        setsuiri_day, setsuiri_hour, setsuiri_minute = (
+            calculator.data_loader.get_setsuiri(year, month)
+        )
+        flags = 0
+        term_minute = NO_TERM
+        if day == setsuiri_day:
+            term_minute = setsuiri_hour * 60 + setsuiri_minute
+            after = calculator.calculate_kanshi_indices(
+                year, month, day, 23, 59
+            )
+            if after[0] != before[0]:
+                flags |= FLAG_YEAR_TERM
+
+        yield before[0], before[1], before[2], flags, term_minute
+        current += timedelta(days=1)
+
+
+def verify(
+    calculator: FourPillarsCalculator, table: PillarTable, first: date
+) -> int:
+    """모든 날짜/시간에 대해 테이블 조회 결과와 직접 계산 결과를 비교"""
+    mismatches = 0
+    current = first
+    last = table.last_date
+    while current <= last:
+        year, month, day = current.year, current.month, current.day
+        setsuiri_day, setsuiri_hour, setsuiri_minute = (
+            calculator.data_loader.get_setsuiri(year, month)
+        )
+        times = [(hour, minute) for hour in range(24) for minute in (0, 59)]
+        if day == setsuiri_day:
+            term = setsuiri_hour * 60 + setsuiri_minute
+            for m in (term - 1, term, term + 1):
+                if 0 <= m < 24 * 60:
+                    times.append(divmod(m, 60))
+
+        cases = [(None, None)] + [t for t in times if t != (0, 0)]
+        for hour, minute in cases:
+            expected = calculator.calculate_kanshi_indices(
+                year, month, day, hour, minute
+            )
+            actual = table.lookup(
+                current, None if hour is None else hour * 60 + minute
+            )
+            if tuple(expected) != actual:
+                mismatches += 1
+                log(f"불일치 {current} {hour}:{minute} {expected} != {actual}")
+        current += timedelta(days=1)
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="사주 조회 테이블 생성")
+    parser.add_argument("--output", type=Path, default=PILLAR_TABLE_FILE)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    calculator = FourPillarsCalculator()
+    years = sorted({key // 100 for key in calculator.data_loader.setsuiri_data})
+    first, last = date(years[0], 1, 1), date(years[-1], 12, 31)
+
+    count = write_pillar_table(
+        args.output,
+        first,
+        build_hour_table(),
+        iter_records(calculator, first, last),
+    )
+    log(f"{args.output}: {first} ~ {last}, {count}개 날짜 저장 완료")
+
+    if args.verify:
+        mismatches = verify(calculator, PillarTable.load(args.output), first)
+        log(f"검증 완료: 불일치 {mismatches}건")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+로또 통계(lotto_statistics) 관리 스크립트
+
+- verify: 저장된 통계를 lotto_draws에서 다시 집계한 값과 비교하고, 통계에
+  반영되지 않은 회차를 출력합니다 (차이가 있으면 종료 코드 1).
+- rebuild: lotto_draws 전체를 한 번의 집계 쿼리로 다시 계산하여 통계와 반영 회차
+  기록(lotto_statistics_rounds)을 교체합니다.
+- apply: 회차(기본값: 반영되지 않은 모든 회차)의 출현 횟수를 더합니다.
+  이미 반영된 회차는 건너뛰므로 여러 번 실행해도 같은 결과입니다.
+
+rebuild/apply는 통계 행의 updated_at을 갱신합니다. 실행 중인 서버 워커는 통계
+스냅샷을 쓸 때마다 lotto_statistics의 max(updated_at)을 확인하므로, 커밋 후 각
+워커의 다음 요청에서 재시작 없이 바뀐 통계가 반영됩니다.
+
+사용법:
+    python scripts/lotto_statistics.py verify
+    python scripts/lotto_statistics.py rebuild
+    python scripts/lotto_statistics.py rebuild --dry-run
+    python scripts/lotto_statistics.py apply
+    python scripts/lotto_statistics.py apply 1190 1191
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.config.config import db_config  # noqa: E402
+from src.config.database import Mysql  # noqa: E402
+from src.lotto.application.service import LottoService  # noqa: E402
+from src.lotto.infrastructure.repository import LottoRepository  # noqa: E402
+from src.users.infrastructure.repository import UserRepository  # noqa: E402
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+def report(result: dict) -> int:
+    """verify 결과를 출력하고 차이(불일치, 미반영 회차) 수를 반환합니다."""
+    for mismatch in result["mismatches"]:
+        log(
+            f"  번호 {mismatch['num']:>2} {mismatch['field']}: "
+            f"저장 {mismatch['stored']} / 집계 {mismatch['expected']}"
+        )
+    unprocessed = result["unprocessed_rounds"]
+    if unprocessed:
+        log(f"  반영되지 않은 회차 {len(unprocessed)}개: {unprocessed[:20]}")
+    log(
+        f"불일치 {len(result['mismatches'])}건, 미반영 회차 {len(unprocessed)}개"
+    )
+    return len(result["mismatches"]) + len(unprocessed)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="로또 통계 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("verify", help="저장된 통계와 다시 집계한 값 비교")
+    rebuild = subparsers.add_parser("rebuild", help="lotto_draws로 통계 재계산")
+    rebuild.add_argument(
+        "--dry-run", action="store_true", help="커밋하지 않고 변경 내용만 출력"
+    )
+    apply = subparsers.add_parser("apply", help="회차의 출현 횟수 반영")
+    apply.add_argument(
+        "rounds", type=int, nargs="*", help="반영할 회차 (기본값: 미반영 회차)"
+    )
+    args = parser.parse_args()
+
+    db = Mysql(db_config)
+    try:
+        async with db.session() as session:
+            service = LottoService(
+                lotto_repository=LottoRepository(session),
+                user_repository=UserRepository(session),
+            )
+
+            if args.command == "verify":
+                return (
+                    1 if report(await service.verify_lotto_statistics()) else 0
+                )
+
+            if args.command == "rebuild":
+                log("재계산 전:")
+                report(await service.verify_lotto_statistics())
+                rounds = await service.rebuild_lotto_statistics()
+                log(f"{rounds}개 회차로 통계 재계산 후:")
+                remaining = report(await service.verify_lotto_statistics())
+                if args.dry_run:
+                    await session.rollback()
+                    log("--dry-run: 롤백")
+                else:
+                    await session.commit()
+                return 1 if remaining else 0
+
+            applied = await service.apply_lotto_statistics(args.rounds or None)
+            await session.commit()
+            log(f"새로 반영한 회차 {len(applied)}개: {applied}")
+            return 0
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
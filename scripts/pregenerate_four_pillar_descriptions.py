@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+사주 설명 사전 생성 스크립트
+
+가입한 사용자들의 사주에서 가장 많이 나온 조합(네 기둥 + 강한 오행)을 집계하여,
+four_pillar_descriptions 테이블에 아직 없는 조합의 설명을 미리 생성합니다.
+이후 같은 사주로 가입/수정하는 사용자는 HCX를 호출하지 않습니다.
+
+사용법:
+    python scripts/pregenerate_four_pillar_descriptions.py
+    python scripts/pregenerate_four_pillar_descriptions.py --limit 1000 --min-count 2
+    python scripts/pregenerate_four_pillar_descriptions.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from sqlalchemy import select  # noqa: E402
+
+from src.config.config import db_config  # noqa: E402
+from src.config.database import Mysql  # noqa: E402
+from src.four_pillars import (  # noqa: E402
+    FiveElements,
+    FourPillarDescriptionGenerator,
+    FourPillarDetail,
+)
+from src.four_pillars.infrastructure.repository import (  # noqa: E402
+    FourPillarDescriptionRepository,
+)
+from src.hcx_client.client import HCXClient  # noqa: E402
+from src.hcx_client.entities.enums import Lane  # noqa: E402
+from src.users.domain.entities.models import User  # noqa: E402
+
+# 커밋 단위 (생성한 설명 수)
+COMMIT_EVERY = 20
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+async def count_signatures(session) -> tuple[Counter, dict]:
+    """활성 사용자 사주의 signature별 사용자 수 집계"""
+    counts: Counter = Counter()
+    pillars: dict = {}
+
+    result = await session.stream_scalars(
+        select(User.four_pillar).where(
+            User.is_active, User.four_pillar.isnot(None)
+        )
+    )
+    async for four_pillar_dict in result:
+        try:
+            detail = FourPillarDetail.model_validate(four_pillar_dict)
+        except ValueError:
+            continue
+        if detail.day_pillar_detail is None:
+            continue
+
+        four_pillar = FourPillarDescriptionGenerator.to_four_pillar(detail)
+        strong_element = FiveElements(detail.strong_element)
+        signature = FourPillarDescriptionGenerator.make_signature(
+            four_pillar, strong_element.value
+        )
+        counts[signature] += 1
+        pillars[signature] = (four_pillar, strong_element)
+
+    return counts, pillars
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="사주 설명 사전 생성")
+    parser.add_argument(
+        "--limit", type=int, default=500, help="생성할 최대 조합 수"
+    )
+    parser.add_argument(
+        "--min-count", type=int, default=2, help="최소 사용자 수"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="생성하지 않고 대상만 출력"
+    )
+    args = parser.parse_args()
+
+    db = Mysql(db_config)
+    try:
+        async with db.session() as session:
+            counts, pillars = await count_signatures(session)
+            log(f"사용자 사주 조합 {len(counts)}개 집계 완료")
+
+            candidates = [
+                signature
+                for signature, count in counts.most_common()
+                if count >= args.min_count
+            ]
+            repository = FourPillarDescriptionRepository(session)
+            existing = set()
+            for i in range(0, len(candidates), 500):
+                existing |= await repository.get_existing_signatures(
+                    candidates[i : i + 500]
+                )
+            targets = [s for s in candidates if s not in existing][: args.limit]
+            log(
+                f"대상 {len(candidates)}개 중 저장됨 {len(existing)}개, "
+                f"생성 예정 {len(targets)}개"
+            )
+
+            if args.dry_run:
+                for signature in targets:
+                    log(f"  {signature}: {counts[signature]}명")
+                return 0
+
+            # 사용자 요청이 먼저 처리되도록 bulk 레인으로 호출
+            generator = FourPillarDescriptionGenerator(
+                repository=repository, lane=Lane.BULK
+            )
+            for index, signature in enumerate(targets, start=1):
+                four_pillar, strong_element = pillars[signature]
+                await generator.generate_for(four_pillar, strong_element)
+                if index % COMMIT_EVERY == 0:
+                    await session.commit()
+                    log(f"  {index}/{len(targets)} 생성")
+            await session.commit()
+
+            stats = generator.cache.stats()
+            log(
+                f"완료: HCX 호출 {stats['misses']}회, "
+                f"실패 {stats['failures']}회"
+            )
+            return 1 if stats["failures"] else 0
+    finally:
+        await HCXClient().close()
+        await db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
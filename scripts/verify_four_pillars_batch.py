@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+사주 일괄 계산 검증 스크립트
+
+calculate_four_pillars_batch 결과가 FourPillarsCalculator와
+FiveElementsAnalyzer를 한 건씩 호출한 결과와 같은지 조회 테이블의 전체 날짜
+범위(및 범위 밖 일부 날짜)에 대해 비교합니다.
+
+각 날짜마다 시간 미입력, 매 시각의 정각/59분, 절입 시각 전후 1분을 확인합니다.
+
+사용법:
+    python scripts/verify_four_pillars_batch.py
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.four_pillars.domain.services.analyzer import (  # noqa: E402
+    FiveElementsAnalyzer,
+)
+from src.four_pillars.domain.services.batch import (  # noqa: E402
+    calculate_four_pillars_batch,
+)
+from src.four_pillars.domain.services.calculator import (  # noqa: E402
+    FourPillarsCalculator,
+)
+from src.four_pillars.domain.services.pillar_table import (  # noqa: E402
+    PillarTable,
+)
+
+
+def log(message: str) -> None:
+    """즉시 출력되는 로그 함수"""
+    print(message, flush=True)
+
+
+def iter_birth_dates(
+    calculator: FourPillarsCalculator, first: date, last: date
+):
+    """검증할 생년월일시 생성"""
+    current = first
+    while current <= last:
+        base = datetime(current.year, current.month, current.day)
+        yield base
+        for hour in range(24):
+            for minute in (0, 59):
+                if hour or minute:
+                    yield base.replace(hour=hour, minute=minute)
+
+        setsuiri_day, setsuiri_hour, setsuiri_minute = (
+            calculator.data_loader.get_setsuiri(current.year, current.month)
+        )
+        if current.day == setsuiri_day:
+            term = setsuiri_hour * 60 + setsuiri_minute
+            for m in (term - 1, term, term + 1):
+                if 0 < m < 24 * 60:
+                    yield base + timedelta(minutes=m)
+        current += timedelta(days=1)
+
+
+def verify(birth_dates: list[datetime]) -> int:
+    """일괄 계산 결과와 한 건씩 계산한 결과 비교"""
+    calculator = FourPillarsCalculator()
+    analyzer = FiveElementsAnalyzer()
+    result = calculate_four_pillars_batch(birth_dates)
+
+    mismatches = 0
+    for index, birth_date in enumerate(birth_dates):
+        codes = calculator.calculate_four_pillar_codes(birth_date)
+        expected = (*codes, *analyzer.analyze(codes))
+        actual = (
+            *result.codes(index),
+            int(result.strong_element[index]),
+            int(result.weak_element[index]),
+        )
+        if expected != actual:
+            mismatches += 1
+            log(f"불일치 {birth_date} {expected} != {actual}")
+    return mismatches
+
+
+def main() -> int:
+    table = PillarTable()
+    if not table.available:
+        log(
+            "조회 테이블이 없습니다. scripts/build_pillar_table.py를 먼저 실행하세요."
+        )
+        return 1
+
+    calculator = FourPillarsCalculator()
+    first, last = table.first_date, table.last_date
+
+    # 테이블 범위 밖 날짜(직접 계산 경로)도 함께 확인
+    birth_dates = list(
+        iter_birth_dates(
+            calculator, first - timedelta(days=40), last + timedelta(days=40)
+        )
+    )
+    log(
+        f"{first - timedelta(days=40)} ~ {last + timedelta(days=40)}: "
+        f"{len(birth_dates)}건 검증 중..."
+    )
+
+    mismatches = verify(birth_dates)
+    log(f"검증 완료: 불일치 {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.fortune.application.service import FortuneService
 from src.fortune.domain.interfaces import IFortuneRepository
 from src.fortune.infrastructure.repository import FortuneRepository
+from src.four_pillars.application.service import CalendarService
+from src.four_pillars.domain.interfaces import IFourPillarDescriptionRepository
+from src.four_pillars.infrastructure.repository import (
+    FourPillarDescriptionRepository,
+)
 from src.lotto.application.service import LottoService
 from src.lotto.domain.interfaces import ILottoRepository
 from src.lotto.infrastructure.repository import LottoRepository
@@ -52,7 +57,18 @@ def get_user_service(
 ) -> UserService:
     """사용자 서비스 의존성 주입 함수"""
     user_repository: IUserRepository = UserRepository(session=session)
-    return UserService(user_repository=user_repository)
+    description_repository: IFourPillarDescriptionRepository = (
+        FourPillarDescriptionRepository(session=session)
+    )
+    return UserService(
+        user_repository=user_repository,
+        description_repository=description_repository,
+    )
+
+
+def get_calendar_service() -> CalendarService:
+    """만세력 서비스 의존성 주입 함수"""
+    return CalendarService()
 
 
 def get_lotto_store_service(
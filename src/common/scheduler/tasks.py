@@ -1,8 +1,16 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.common.logger import logger
 from src.config.config import db_config
 from src.config.database import Mysql
 from src.lotto.application.service import LottoService
+from src.lotto.infrastructure.analytics_cache import LottoAnalyticsCache
+from src.lotto.infrastructure.draw_snapshot import LottoDrawSnapshot
+from src.lotto.infrastructure.frequency_index import LottoFrequencyIndex
 from src.lotto.infrastructure.repository import LottoRepository
+from src.lotto.infrastructure.statistics_snapshot import (
+    LottoStatisticsSnapshot,
+)
 from src.users.infrastructure.repository import UserRepository
 
 
@@ -19,13 +27,33 @@ async def update_next_lotto_draw():
                 user_repository=user_repository,
             )
             success = await lotto_service.update_next_lotto_draw()
-            await session.commit()
             if success:
+                await session.commit()
                 logger.info("로또 데이터 업데이트가 성공적으로 완료되었습니다.")
             else:
+                # 다른 워커가 먼저 저장했거나(IntegrityError) API 오류로 실패한 트랜잭션
+                await session.rollback()
                 logger.warning("로또 데이터 업데이트가 실패했습니다.")
 
     except Exception as e:
         logger.error(f"로또 데이터 업데이트 중 오류 발생: {e}")
+
+    try:
+        # 성공/실패와 관계없이 새 세션으로 다시 로드
+        # (이 워커가 실패해도 다른 워커가 같은 회차를 저장했을 수 있음)
+        async with db.session() as session:
+            await reload_lotto_snapshots(session)
+    except Exception as e:
+        logger.error(f"로또 회차 스냅샷 다시 로드 중 오류 발생: {e}")
     finally:
         await db.close()
+
+
+async def reload_lotto_snapshots(session: AsyncSession) -> None:
+    """DB의 lotto_draws로 회차 스냅샷을 다시 로드하고 회차 기반 캐시를 무효화합니다."""
+    snapshot = LottoDrawSnapshot()
+    await snapshot.load(session)
+    # 누적 출현 인덱스에는 새 회차의 행만 추가됨
+    LottoFrequencyIndex().sync(snapshot.rounds, snapshot.numbers)
+    LottoStatisticsSnapshot().invalidate()
+    LottoAnalyticsCache().invalidate()
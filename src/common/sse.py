@@ -0,0 +1,97 @@
+"""Server-Sent Events 응답
+
+서비스의 스트리밍 메서드가 반환하는 (이벤트, 데이터)를 SSE로 전송합니다.
+
+- delta: {"content": "응답 조각"}
+- result: 저장된 결과 (응답 모델 JSON)
+- error: {"status_code": int, "detail": str}
+
+스트리밍 응답은 DBMiddleware가 세션을 커밋하고 닫은 뒤에도 계속 전송되므로,
+요청 세션 대신 스트림 전용 세션을 열어 result를 보내기 직전에 커밋합니다.
+"""
+
+import json
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.logger import logger
+
+Event = Tuple[str, Any]
+
+
+def format_sse(event: str, data: Any) -> bytes:
+    """SSE 이벤트 한 건"""
+    if isinstance(data, BaseModel):
+        body = data.model_dump_json()
+    else:
+        body = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {body}\n\n".encode("utf-8")
+
+
+async def sse_response(
+    request: Request,
+    build_events: Callable[[AsyncSession], AsyncIterator[Event]],
+) -> StreamingResponse:
+    """스트림 전용 DB 세션으로 이벤트를 만들어 SSE 응답을 반환합니다.
+
+    첫 이벤트까지는 응답을 시작하기 전에 처리하므로, 그 전에 발생한
+    HTTPException(사용자 없음 등)은 일반 오류 응답으로 반환됩니다.
+    """
+    stack = AsyncExitStack()
+    session = await stack.enter_async_context(request.app.state.mysql.session())
+    events = build_events(session)
+    try:
+        first = await anext(events)
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await session.rollback()
+        await stack.aclose()
+        raise
+
+    return StreamingResponse(
+        _stream(session, stack, events, first),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream(
+    session: AsyncSession,
+    stack: AsyncExitStack,
+    events: AsyncIterator[Event],
+    first: Optional[Event],
+) -> AsyncIterator[bytes]:
+    try:
+        if first is not None:
+            yield await _encode(session, *first)
+        async for event in events:
+            yield await _encode(session, *event)
+    except HTTPException as e:
+        await session.rollback()
+        yield format_sse(
+            "error", {"status_code": e.status_code, "detail": e.detail}
+        )
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"스트리밍 응답 처리 실패: {e}")
+        yield format_sse(
+            "error", {"status_code": 500, "detail": "스트리밍 처리 중 오류"}
+        )
+    finally:
+        await events.aclose()
+        await stack.aclose()
+
+
+async def _encode(session: AsyncSession, event: str, data: Any) -> bytes:
+    if event == "result":
+        # 클라이언트가 결과를 받은 뒤 다시 조회해도 보이도록 먼저 커밋
+        await session.commit()
+    elif event == "delta":
+        data = {"content": data}
+    return format_sse(event, data)
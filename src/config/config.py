@@ -17,6 +17,40 @@ class DBConfig(BaseSettings):
 class HcxConfig(BaseSettings):
     HCX_KEY: str = Field(...)
     HCX_URL: str = Field(...)
+    # 커넥션 풀 (워커 프로세스당)
+    HCX_MAX_CONNECTIONS: int = Field(default=20)
+    HCX_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=10)
+    HCX_KEEPALIVE_EXPIRY: float = Field(default=30.0)
+    HCX_HTTP2: bool = Field(default=True)
+    # 타임아웃 (초)
+    HCX_CONNECT_TIMEOUT: float = Field(default=5.0)
+    HCX_READ_TIMEOUT: float = Field(default=60.0)
+    HCX_WRITE_TIMEOUT: float = Field(default=10.0)
+    HCX_POOL_TIMEOUT: float = Field(default=10.0)
+    # 동시 호출 수 제한 (워커 프로세스당, 모든 레인 공유)
+    HCX_MAX_CONCURRENCY: int = Field(default=10)
+    # background/bulk 레인이 사용할 수 없는 interactive 전용 슬롯 수
+    HCX_INTERACTIVE_RESERVED_SLOTS: int = Field(default=2)
+    # 레인별 초당 호출 수 제한 (0이면 제한 없음)
+    HCX_INTERACTIVE_RATE_LIMIT: float = Field(default=0.0)
+    HCX_BACKGROUND_RATE_LIMIT: float = Field(default=5.0)
+    HCX_BULK_RATE_LIMIT: float = Field(default=2.0)
+    # 재시도, 지연 예산(초), 서킷 브레이커
+    HCX_MAX_RETRIES: int = Field(default=2)
+    HCX_RETRY_BACKOFF: float = Field(default=0.2)
+    HCX_DEFAULT_LATENCY_BUDGET: float = Field(default=20.0)
+    HCX_BREAKER_FAILURE_THRESHOLD: int = Field(default=5)
+    HCX_BREAKER_RESET_TIMEOUT: float = Field(default=30.0)
+    # 헤지 요청 (hedge=True 호출만)
+    HCX_HEDGE_DELAY: float = Field(default=3.0)
+    HCX_HEDGE_PERCENTILE: float = Field(default=90.0)
+    HCX_HEDGE_WINDOW: int = Field(default=200)
+    HCX_HEDGE_MAX_RATE: float = Field(default=0.1)
+    # 응답 캐시 (HCX_CACHE_PATH가 비어 있으면 메모리에만 보관)
+    HCX_CACHE_ENABLED: bool = Field(default=True)
+    HCX_CACHE_MAX_ENTRIES: int = Field(default=4096)
+    HCX_CACHE_DEFAULT_TTL: float = Field(default=3600.0)
+    HCX_CACHE_PATH: str = Field(default=".cache/hcx_completions.sqlite3")
 
 
 app_config = AppConfig()
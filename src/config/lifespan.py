@@ -2,10 +2,22 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from src.common.logger import start_logging
+from src.common.logger import logger, start_logging
 from src.common.scheduler.scheduler import scheduler
 from src.config.config import db_config
 from src.config.database import Mysql
+from src.four_pillars.domain.services.data_loader import FourPillarsDataLoader
+from src.four_pillars.domain.services.lunar_table import LunarTable
+from src.four_pillars.domain.services.pillar_table import PillarTable
+from src.four_pillars.infrastructure.description_cache import (
+    FourPillarDescriptionCache,
+)
+from src.hcx_client.client import HCXClient
+from src.hcx_client.common.prompt_registry import PromptRegistry
+from src.hcx_client.completion_cache import CompletionCache
+from src.hcx_client.metrics import HCXMetrics
+from src.lotto.infrastructure.draw_snapshot import LottoDrawSnapshot
+from src.lotto.infrastructure.frequency_index import LottoFrequencyIndex
 
 
 @asynccontextmanager
@@ -14,6 +26,37 @@ async def lifespan(app: FastAPI):
         scheduler.start()
         app.state.log_processor_task = await start_logging()
         app.state.mysql = Mysql(db_config)
+
+        # HCX 커넥션 풀 (워커 프로세스당 하나)
+        HCXClient().open()
+        CompletionCache().open()
+        # 프롬프트 파일 파싱 및 placeholder 검증 (형식 오류면 기동 실패)
+        PromptRegistry()
+
+        # 사주 데이터는 프로세스당 한 번만 로드하여 공유
+        FourPillarsDataLoader()
+        logger.info(
+            "사주 데이터 로드 완료 (solar_terms.txt 읽기 "
+            f"{FourPillarsDataLoader.file_read_count}회)"
+        )
+
+        # 사주 조회 테이블 매핑 (없으면 직접 계산으로 동작)
+        if not PillarTable().available:
+            logger.warning("사주 조회 테이블을 찾을 수 없어 직접 계산합니다.")
+
+        # 음력 변환 테이블 (없으면 음력 생년월일 입력이 거부됨)
+        if not LunarTable().available:
+            logger.warning("음력 변환 테이블을 찾을 수 없습니다.")
+
+        # 로또 회차 스냅샷 (실패하면 회차 조회가 DB로 동작)
+        try:
+            async with app.state.mysql.session() as session:
+                await LottoDrawSnapshot().load(session)
+            snapshot = LottoDrawSnapshot()
+            LottoFrequencyIndex().sync(snapshot.rounds, snapshot.numbers)
+            logger.info(f"로또 회차 스냅샷 로드 완료: {snapshot.stats()}")
+        except Exception as e:
+            logger.warning(f"로또 회차 스냅샷 로드 실패, DB 조회 사용: {e}")
         yield
 
     finally:
@@ -23,5 +66,11 @@ async def lifespan(app: FastAPI):
                 await app.state.log_processor_task
             except Exception:
                 pass  # Ignore exceptions during task cancellation
+        logger.info(
+            f"사주 설명 캐시 통계: {FourPillarDescriptionCache().stats()}"
+        )
+        await HCXClient().close()
+        logger.info(f"HCX 응답 캐시 통계: {CompletionCache().stats()}")
+        logger.info(f"HCX 프롬프트별 지표: {HCXMetrics().snapshot()}")
+        CompletionCache().close()
         await app.state.mysql.close()
-
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Tuple
 
 from fastapi import HTTPException, status
 
@@ -18,7 +18,7 @@ from src.fortune.domain.entities.enums import FortuneDetailType, FortuneType
 from src.fortune.domain.interfaces import IFortuneRepository
 from src.hcx_client.client import HCXClient
 from src.hcx_client.common.parser import Parser
-from src.hcx_client.common.utils import HCXUtils
+from src.hcx_client.common.prompt_registry import PromptRegistry
 from src.users.domain.interfaces import IUserRepository
 
 
@@ -142,6 +142,90 @@ class FortuneService:
         self, user_id: str, fortune_date: date
     ) -> UserDailyFortuneDetail:
         """HCX API를 호출하여 운세 상세 정보를 생성합니다."""
+        # 1~2. 사용자 사주 정보로 프롬프트 구성
+        system_prompt, user_prompt = await self._build_daily_fortune_prompts(
+            user_id
+        )
+
+        # HCX API 호출 및 fallback 처리
+        fortune_data = None
+        try:
+            response_content = await HCXClient().call_completion(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_key="daily_fortune",
+                cache_scope=fortune_date.isoformat(),
+            )
+
+            # 3. 응답 파싱
+            fortune_data = Parser.parse_json(
+                response_content, prompt_key="daily_fortune"
+            )
+            logger.info(
+                f"HCX API 호출 성공: 사용자 {user_id}의 운세 데이터 생성 완료"
+            )
+
+        except Exception as e:
+            logger.warning(
+                f"HCX API 호출 또는 파싱 실패, fallback 데이터 사용: {str(e)}"
+            )
+            # fallback 데이터 사용
+            fortune_data = DAILY_FORTUNE_FALLBACK_DATA
+
+        return await self._save_daily_fortune_detail(
+            user_id, fortune_date, fortune_data
+        )
+
+    async def stream_user_daily_fortune_detail(
+        self, user_id: str, fortune_date: date
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """운세 상세 정보를 생성하며 ("delta", 응답 조각)을 차례로 반환하고,
+        저장이 끝나면 ("result", UserDailyFortuneDetail)을 반환합니다.
+
+        이미 생성된 운세가 있으면 결과만 반환합니다.
+        """
+        existing_detail = await self.repository.get_user_daily_fortune_detail(
+            user_id, fortune_date
+        )
+        if existing_detail:
+            yield "result", UserDailyFortuneDetail.model_validate(existing_detail)
+            return
+
+        system_prompt, user_prompt = await self._build_daily_fortune_prompts(
+            user_id
+        )
+
+        chunks = []
+        fortune_data = None
+        try:
+            async for chunk in HCXClient().call_completion_stream(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_key="daily_fortune",
+                cache_scope=fortune_date.isoformat(),
+            ):
+                chunks.append(chunk)
+                yield "delta", chunk
+
+            fortune_data = Parser.parse_json(
+                "".join(chunks), prompt_key="daily_fortune"
+            )
+            logger.info(
+                f"HCX API 호출 성공: 사용자 {user_id}의 운세 데이터 생성 완료"
+            )
+
+        except Exception as e:
+            logger.warning(
+                f"HCX API 호출 또는 파싱 실패, fallback 데이터 사용: {str(e)}"
+            )
+            fortune_data = DAILY_FORTUNE_FALLBACK_DATA
+
+        yield "result", await self._save_daily_fortune_detail(
+            user_id, fortune_date, fortune_data
+        )
+
+    async def _build_daily_fortune_prompts(self, user_id: str) -> Tuple[str, str]:
+        """사용자 사주 정보로 운세 프롬프트 (system, user)를 구성합니다."""
         # 1. 사용자 정보 조회 (사주 정보 포함)
         user = await self.user_repository.get_user_by_id(user_id)
         if not user:
@@ -154,10 +238,7 @@ class FortuneService:
                 status_code=400, detail="사용자의 사주 정보가 없습니다."
             )
 
-        # 2. HCX API 호출
-        hcx_client = HCXClient()
-
-        # 사용자 사주 정보 사용
+        # 2. 사용자 사주 정보 사용
         four_pillar = user.four_pillar
         fortune_prompt_data = {
             "year_pillar": four_pillar.get("year_pillar"),
@@ -168,33 +249,14 @@ class FortuneService:
             "weak_element": four_pillar.get("weak_element"),
         }
 
-        # HCXUtils를 사용하여 프롬프트 가져오기
-        system_prompt, user_prompt_template = HCXUtils.get_prompt_pair(
-            "fortune.yaml", "daily_fortune"
+        return PromptRegistry().render(
+            "fortune.yaml", "daily_fortune", **fortune_prompt_data
         )
 
-        user_prompt = user_prompt_template.format(**fortune_prompt_data)
-
-        # HCX API 호출 및 fallback 처리
-        fortune_data = None
-        try:
-            response_content = await hcx_client.call_completion(
-                system_prompt=system_prompt, user_prompt=user_prompt
-            )
-
-            # 3. 응답 파싱
-            fortune_data = Parser.parse_json(response_content)
-            logger.info(
-                f"HCX API 호출 성공: 사용자 {user_id}의 운세 데이터 생성 완료"
-            )
-
-        except Exception as e:
-            logger.warning(
-                f"HCX API 호출 또는 파싱 실패, fallback 데이터 사용: {str(e)}"
-            )
-            # fallback 데이터 사용
-            fortune_data = DAILY_FORTUNE_FALLBACK_DATA
-
+    async def _save_daily_fortune_detail(
+        self, user_id: str, fortune_date: date, fortune_data: dict
+    ) -> UserDailyFortuneDetail:
+        """HCX 응답(또는 fallback) 데이터로 운세 상세 정보를 저장합니다."""
         # 4. fortune_details 구성
         fortune_details = [
             FortuneDetailItem(
@@ -4,19 +4,35 @@ from src.four_pillars.api.schemas import FourPillarDetail
 from src.four_pillars.domain.entities.enums import FiveElements, TenGods
 from src.four_pillars.domain.entities.models import (
     FourPillar,
+    FourPillarCodes,
     PillarInfo,
 )
+from src.four_pillars.domain.services.batch import (
+    FourPillarsBatchResult,
+    calculate_four_pillars_batch,
+)
 from src.four_pillars.domain.services.calculator import FourPillarsCalculator
+from src.four_pillars.domain.services.compatibility import (
+    rank_compatibility,
+    score_compatibility,
+)
+from src.four_pillars.domain.services.lunar_table import LunarTable
 from src.four_pillars.infrastructure.description_generator import (
     FourPillarDescriptionGenerator,
 )
 
 __all__ = [
     "FourPillarsCalculator",
+    "FourPillarsBatchResult",
+    "calculate_four_pillars_batch",
+    "LunarTable",
+    "score_compatibility",
+    "rank_compatibility",
     "FourPillarDescriptionGenerator",
     "FiveElements",
     "TenGods",
     "FourPillar",
+    "FourPillarCodes",
     "FourPillarDetail",
     "PillarInfo",
 ]
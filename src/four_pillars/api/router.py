@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Header, Path, Response
+
+from src.common.dependencies import get_calendar_service
+from src.four_pillars.api.schemas import CalendarMonth
+from src.four_pillars.application.service import CalendarService
+
+calendar_router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+# 지난 달과 앞으로의 달 모두 간지가 바뀌지 않으므로 1년간 캐시
+CALENDAR_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@calendar_router.get(
+    "/{year}/{month}",
+    response_model=CalendarMonth,
+    summary="만세력 월별 조회",
+)
+async def get_calendar_month(
+    year: int = Path(..., description="연도"),
+    month: int = Path(..., ge=1, le=12, description="월"),
+    if_none_match: str | None = Header(None),
+    calendar_service: CalendarService = Depends(get_calendar_service),
+):
+    """해당 월의 날짜별 년주/월주/일주(일진)와 절입 정보를 조회합니다."""
+    body, etag = calendar_service.get_month_json(year, month)
+    headers = {"Cache-Control": CALENDAR_CACHE_CONTROL, "ETag": etag}
+
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
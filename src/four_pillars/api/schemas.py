@@ -1,10 +1,15 @@
-from typing import Optional
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
 
 from pydantic import field_validator
 
 from src.config.schemas import CommonBase
-from src.four_pillars.domain.entities.enums import FiveElements
-from src.four_pillars.domain.entities.models import PillarInfo
+from src.four_pillars.domain.constants import JIKKAN, JYUNISHI
+from src.four_pillars.domain.entities.enums import FiveElements, TenGods
+from src.four_pillars.domain.entities.models import FourPillarCodes, PillarInfo
+
+_FIVE_ELEMENTS = tuple(FiveElements)
+_TEN_GODS = tuple(TenGods)
 
 
 class FourPillarDetail(CommonBase):
@@ -38,3 +43,66 @@ class FourPillarDetail(CommonBase):
                 return normalized
 
         return v
+
+    @classmethod
+    def from_codes(
+        cls,
+        pillars: FourPillarCodes,
+        ten_gods: Sequence[Optional[Tuple[int, int]]],
+        strong_element: int,
+        weak_element: int,
+        description: str = "",
+    ) -> "FourPillarDetail":
+        """정수 코드로 계산된 사주를 응답 스키마로 변환
+
+        ten_gods는 기둥 순서(년/월/일/시)별 (천간 십신, 지지 십신)이며,
+        시주가 없으면 None 입니다.
+        """
+        details = [
+            PillarInfo(
+                stem=JIKKAN[pillar % 10],
+                branch=JYUNISHI[pillar % 12],
+                stem_ten_god=_TEN_GODS[gods[0]],
+                branch_ten_god=_TEN_GODS[gods[1]],
+            )
+            if pillar >= 0 and gods is not None
+            else None
+            for pillar, gods in zip(pillars, ten_gods)
+        ]
+
+        return cls(
+            strong_element=_FIVE_ELEMENTS[strong_element],
+            weak_element=_FIVE_ELEMENTS[weak_element],
+            description=description,
+            year_pillar_detail=details[0],
+            month_pillar_detail=details[1],
+            day_pillar_detail=details[2],
+            time_pillar_detail=details[3],
+        )
+
+
+class SolarTerm(CommonBase):
+    """절입 정보 (절입 시각 이후 바뀌는 간지 포함)"""
+
+    name: str  # 절기 이름 (예: 입춘)
+    time: str  # 절입 시각 (HH:MM)
+    year_pillar: str  # 절입 이후 년주
+    month_pillar: str  # 절입 이후 월주
+
+
+class CalendarDay(CommonBase):
+    """만세력 하루 정보"""
+
+    date: date
+    year_pillar: str  # 년주 (절입 전 기준)
+    month_pillar: str  # 월주 (절입 전 기준)
+    day_pillar: str  # 일주 (일진)
+    solar_term: Optional[SolarTerm] = None  # 절입일인 경우 절입 정보
+
+
+class CalendarMonth(CommonBase):
+    """만세력 월별 응답"""
+
+    year: int
+    month: int
+    days: List[CalendarDay]
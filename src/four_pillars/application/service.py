@@ -0,0 +1,110 @@
+import calendar
+import hashlib
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.four_pillars.api.schemas import CalendarDay, CalendarMonth, SolarTerm
+from src.four_pillars.domain.constants import SOLAR_TERM_NAMES
+from src.four_pillars.domain.services.calculator import FourPillarsCalculator
+from src.four_pillars.domain.services.pillar_table import (
+    FLAG_YEAR_TERM,
+    NO_TERM,
+)
+
+# 메모리에 유지할 월별 응답 수 (약 20년치)
+CALENDAR_CACHE_SIZE = 240
+
+
+class CalendarService:
+    """만세력(일진 달력) 서비스
+
+    사전 계산된 사주 조회 테이블로 월별 간지를 만들고, 직렬화한 응답을
+    월 단위로 캐시합니다. 날짜별 간지는 바뀌지 않으므로 캐시를 비울 필요가 없습니다.
+    """
+
+    def __init__(self) -> None:
+        self.calculator = FourPillarsCalculator()
+
+    def is_supported(self, year: int, month: int) -> bool:
+        """절입 데이터(solar_terms.txt)가 있는 월인지 여부"""
+        return year * 100 + month in self.calculator.data_loader.setsuiri_data
+
+    def get_month_json(self, year: int, month: int) -> Tuple[bytes, str]:
+        """월별 만세력 응답 (직렬화된 JSON, ETag)"""
+        if not 1 <= month <= 12 or not self.is_supported(year, month):
+            raise HTTPException(
+                status_code=404, detail="Calendar month not supported"
+            )
+        return _render_month(year, month)
+
+    def build_month(self, year: int, month: int) -> CalendarMonth:
+        """월별 만세력 계산 (캐시 미사용)"""
+        data_loader = self.calculator.data_loader
+        pillar_table = self.calculator.pillar_table
+        term_name = SOLAR_TERM_NAMES[month - 1]
+
+        days: List[CalendarDay] = []
+        current = date(year, month, 1)
+        for _ in range(calendar.monthrange(year, month)[1]):
+            record = pillar_table.read_record(current)
+            if record is None:
+                record = self._calculate_record(current)
+            year_idx, month_idx, day_idx, flags, term_minute = record
+
+            solar_term: Optional[SolarTerm] = None
+            if term_minute != NO_TERM:
+                hour, minute = divmod(term_minute, 60)
+                solar_term = SolarTerm(
+                    name=term_name,
+                    time=f"{hour:02d}:{minute:02d}",
+                    year_pillar=data_loader.get_kanshi(
+                        year_idx + (1 if flags & FLAG_YEAR_TERM else 0)
+                    ),
+                    month_pillar=data_loader.get_kanshi(month_idx + 1),
+                )
+
+            days.append(
+                CalendarDay(
+                    date=current,
+                    year_pillar=data_loader.get_kanshi(year_idx),
+                    month_pillar=data_loader.get_kanshi(month_idx),
+                    day_pillar=data_loader.get_kanshi(day_idx),
+                    solar_term=solar_term,
+                )
+            )
+            current += timedelta(days=1)
+
+        return CalendarMonth(year=year, month=month, days=days)
+
+    def _calculate_record(self, target: date) -> tuple:
+        """조회 테이블이 없을 때 테이블 레코드와 같은 형식으로 직접 계산"""
+        year, month, day = target.year, target.month, target.day
+        before = self.calculator.calculate_kanshi_indices(year, month, day)
+
+        setsuiri_day, setsuiri_hour, setsuiri_minute = (
+            self.calculator.data_loader.get_setsuiri(year, month)
+        )
+        if day != setsuiri_day:
+            return before[0], before[1], before[2], 0, NO_TERM
+
+        after = self.calculator.calculate_kanshi_indices(
+            year, month, day, 23, 59
+        )
+        flags = FLAG_YEAR_TERM if after[0] != before[0] else 0
+        return (
+            before[0],
+            before[1],
+            before[2],
+            flags,
+            setsuiri_hour * 60 + setsuiri_minute,
+        )
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _render_month(year: int, month: int) -> Tuple[bytes, str]:
+    """월별 만세력을 계산하여 JSON으로 직렬화 (프로세스별 캐시)"""
+    body = CalendarService().build_month(year, month).model_dump_json().encode()
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
@@ -22,3 +22,53 @@ JYUNISHI = [
 # 기준 연도 (1864년)
 BASE_YEAR = 1864
 
+# 월별 절입 절기 (solar_terms.txt의 각 월 절입일에 해당하는 절기)
+SOLAR_TERM_NAMES = [
+    "소한",
+    "입춘",
+    "경칩",
+    "청명",
+    "입하",
+    "망종",
+    "소서",
+    "입추",
+    "백로",
+    "한로",
+    "입동",
+    "대설",
+]
+
+
+# 아래 테이블은 천간(0-9), 지지(0-11), 오행(FiveElements 순서 0-4),
+# 십신(TenGods 순서 0-9)을 정수 코드로 다룹니다.
+
+# 천간별 오행
+STEM_ELEMENTS = (0, 0, 1, 1, 2, 2, 3, 3, 4, 4)
+
+# 지지별 오행
+BRANCH_ELEMENTS = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+
+# 지지별 숨겨진 천간 (장간)
+HIDDEN_STEMS = (9, 5, 0, 1, 4, 2, 3, 5, 6, 7, 4, 8)
+
+# 십신 테이블: [일간 * 10 + 대상 천간] -> 십신
+TEN_GODS_TABLE = (
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,  # 甲
+    1, 0, 3, 2, 5, 4, 7, 6, 9, 8,  # 乙
+    8, 9, 0, 1, 2, 3, 4, 5, 6, 7,  # 丙
+    9, 8, 1, 0, 3, 2, 5, 4, 7, 6,  # 丁
+    6, 7, 8, 9, 0, 1, 2, 3, 4, 5,  # 戊
+    7, 6, 9, 8, 1, 0, 3, 2, 5, 4,  # 己
+    5, 4, 6, 7, 8, 9, 0, 1, 2, 3,  # 庚
+    4, 5, 7, 6, 9, 8, 1, 0, 3, 2,  # 辛
+    2, 3, 4, 5, 6, 7, 8, 9, 0, 1,  # 壬
+    3, 2, 5, 4, 7, 6, 9, 8, 1, 0,  # 癸
+)  # fmt: skip
+
+# 60간지별 오행 개수 (오행마다 4비트씩 묶은 값)
+ELEMENT_COUNT_BITS = 4
+KANSHI_ELEMENT_COUNTS = tuple(
+    (1 << ELEMENT_COUNT_BITS * STEM_ELEMENTS[i % 10])
+    + (1 << ELEMENT_COUNT_BITS * BRANCH_ELEMENTS[i % 12])
+    for i in range(60)
+)
@@ -1,14 +1,16 @@
 """도메인 모델 정의
 
-Note: 이 모듈은 SQLAlchemy ORM 모델이 아닌 도메인 모델을 정의합니다.
-four_pillars 모듈은 별도의 DB 테이블이 없으며, User 테이블의 JSON 컬럼에 저장됩니다.
+Note: 사주 계산 결과는 별도의 DB 테이블이 없으며, User 테이블의 JSON 컬럼에 저장됩니다.
+HCX로 생성한 사주 설명만 FourPillarDescription 테이블에 캐시합니다.
 """
 
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from pydantic import BaseModel
+from sqlalchemy import Column, String, Text
 from typing_extensions import TypedDict
 
+from src.config.database import Base
 from src.four_pillars.domain.entities.enums import TenGods
 
 
@@ -24,6 +26,19 @@ class FourPillar(TypedDict, total=False):
     time_pillar: Optional[str]  # 시주
 
 
+class FourPillarCodes(NamedTuple):
+    """정수 코드로 표현한 사주 (내부 계산용 도메인 모델)
+
+    각 기둥은 60간지 인덱스(0-59)이며, 천간은 index % 10, 지지는 index % 12 입니다.
+    시주가 없으면 time은 -1 입니다.
+    """
+
+    year: int  # 년주
+    month: int  # 월주
+    day: int  # 일주
+    time: int  # 시주
+
+
 class PillarInfo(BaseModel):
     """기둥(주) 상세 정보 (도메인 모델)"""
 
@@ -32,3 +47,21 @@ class PillarInfo(BaseModel):
     stem_ten_god: TenGods  # 천간의 십신
     branch_ten_god: TenGods  # 지지의 십신
 
+
+class FourPillarDescription(Base):
+    """사주 설명 캐시 테이블
+
+    설명은 네 기둥과 가장 강한 오행에만 의존하므로 이 조합(signature)을
+    키로 HCX 생성 결과를 저장합니다.
+    """
+
+    __tablename__ = "four_pillar_descriptions"
+
+    # 년주+월주+일주+시주+강한 오행 (예: "甲子乙丑丙寅丁卯木")
+    signature = Column(String(16), primary_key=True)
+    year_pillar = Column(String(2), nullable=False)
+    month_pillar = Column(String(2), nullable=False)
+    day_pillar = Column(String(2), nullable=False)
+    time_pillar = Column(String(2), nullable=True)
+    strong_element = Column(String(1), nullable=False)
+    description = Column(Text, nullable=False)
@@ -0,0 +1,25 @@
+from typing import Optional, Protocol
+
+from src.four_pillars.domain.entities.models import FourPillar
+
+
+class IFourPillarDescriptionRepository(Protocol):
+    """사주 설명 캐시 리포지토리 인터페이스"""
+
+    async def get_description(self, signature: str) -> Optional[str]:
+        """signature에 해당하는 저장된 설명을 조회합니다."""
+        ...
+
+    async def save_description(
+        self,
+        signature: str,
+        four_pillar: FourPillar,
+        strong_element: str,
+        description: str,
+    ) -> None:
+        """생성한 설명을 저장합니다. 이미 있으면 덮어씁니다."""
+        ...
+
+    async def get_existing_signatures(self, signatures: list[str]) -> set[str]:
+        """주어진 signature 중 이미 저장된 것을 조회합니다."""
+        ...
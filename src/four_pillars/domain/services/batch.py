@@ -0,0 +1,175 @@
+"""사주 일괄 계산
+
+야간 작업이나 전체 사용자 재분석처럼 많은 생년월일시를 한 번에 계산할 때
+사용합니다. 사전 계산된 조회 테이블(pillar_table.bin)을 NumPy 배열로 읽어
+년주/월주/일주/시주와 가장 강한/약한 오행을 벡터 연산으로 구합니다.
+결과는 FourPillarsCalculator.calculate_four_pillar_codes와
+FiveElementsAnalyzer.analyze를 한 건씩 호출한 결과와 같습니다.
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Sequence, Union
+
+import numpy as np
+
+from src.four_pillars.domain.constants import (
+    ELEMENT_COUNT_BITS,
+    KANSHI_ELEMENT_COUNTS,
+)
+from src.four_pillars.domain.entities.models import FourPillarCodes
+from src.four_pillars.domain.services.calculator import FourPillarsCalculator
+from src.four_pillars.domain.services.pillar_table import (
+    FLAG_YEAR_TERM,
+    RECORDS_OFFSET,
+    PillarTable,
+)
+
+# pillar_table.bin 레코드 구조 (pillar_table.RECORD와 동일)
+RECORD_DTYPE = np.dtype(
+    [
+        ("year", "u1"),
+        ("month", "u1"),
+        ("day", "u1"),
+        ("flags", "u1"),
+        ("term_minute", "<u2"),
+    ]
+)
+
+# 1970-01-01의 ordinal (datetime64 일수 -> date.toordinal 변환용)
+_EPOCH_ORDINAL = 719163
+_MINUTES_PER_DAY = 24 * 60
+
+# [60간지] -> [오행별 개수]
+_KANSHI_ELEMENT_COUNTS = np.array(
+    [
+        [
+            (counts >> ELEMENT_COUNT_BITS * element)
+            & ((1 << ELEMENT_COUNT_BITS) - 1)
+            for element in range(5)
+        ]
+        for counts in KANSHI_ELEMENT_COUNTS
+    ],
+    dtype=np.int8,
+)
+
+
+class FourPillarsBatchResult(NamedTuple):
+    """일괄 계산 결과 (모든 배열의 길이는 입력과 같음)
+
+    각 기둥은 60간지 인덱스이며 시간을 입력하지 않은 경우 time은 -1입니다.
+    오행은 FiveElements 순서의 코드입니다.
+    """
+
+    year: np.ndarray
+    month: np.ndarray
+    day: np.ndarray
+    time: np.ndarray
+    strong_element: np.ndarray
+    weak_element: np.ndarray
+
+    def codes(self, index: int) -> FourPillarCodes:
+        """index 번째 결과를 FourPillarCodes로 반환"""
+        return FourPillarCodes(
+            int(self.year[index]),
+            int(self.month[index]),
+            int(self.day[index]),
+            int(self.time[index]),
+        )
+
+
+def count_elements_batch(
+    year: np.ndarray, month: np.ndarray, day: np.ndarray, time: np.ndarray
+) -> np.ndarray:
+    """기둥별 60간지 인덱스 배열의 오행 개수 (N x 5, FiveElements 순서)
+
+    시주가 없으면(-1) 시주의 오행은 세지 않습니다.
+    """
+    counts: np.ndarray = (
+        _KANSHI_ELEMENT_COUNTS[year]
+        + _KANSHI_ELEMENT_COUNTS[month]
+        + _KANSHI_ELEMENT_COUNTS[day]
+    )
+    counts += np.where(
+        (time >= 0)[:, None], _KANSHI_ELEMENT_COUNTS[time], 0
+    ).astype(np.int8)
+    return counts
+
+
+def calculate_four_pillars_batch(
+    birth_dates: Union[Sequence[datetime], np.ndarray],
+) -> FourPillarsBatchResult:
+    """생년월일시 배열의 사주와 강한/약한 오행을 한 번에 계산
+
+    birth_dates는 datetime 목록 또는 datetime64 배열입니다.
+    00:00은 시간을 입력하지 않은 것으로 간주합니다.
+    조회 테이블 범위를 벗어난 날짜는 한 건씩 직접 계산합니다.
+    """
+    minutes = np.asarray(birth_dates, dtype="datetime64[m]").astype(np.int64)
+    minutes = minutes.reshape(-1)
+    days, minute_of_day = np.divmod(minutes, _MINUTES_PER_DAY)
+    has_time = minute_of_day != 0
+
+    size = len(minutes)
+    year = np.zeros(size, dtype=np.int8)
+    month = np.zeros(size, dtype=np.int8)
+    day = np.zeros(size, dtype=np.int8)
+    time = np.full(size, -1, dtype=np.int8)
+
+    table = PillarTable()
+    offsets = days + (_EPOCH_ORDINAL - table.first_ordinal)
+    in_range = (offsets >= 0) & (offsets < table.count)
+
+    buffer = table.buffer
+    if buffer is not None and in_range.any():
+        records = np.frombuffer(
+            buffer,
+            dtype=RECORD_DTYPE,
+            count=table.count,
+            offset=RECORDS_OFFSET,
+        )[offsets[in_range]]
+        hour_table = np.frombuffer(table.hour_table, dtype=np.int8)
+
+        row_has_time = has_time[in_range]
+        row_minute = minute_of_day[in_range]
+
+        # 절입일의 절입 시각 이후에는 다음 절기의 간지를 사용
+        after_term = row_has_time & (row_minute >= records["term_minute"])
+        year_term = after_term & (records["flags"] & FLAG_YEAR_TERM != 0)
+        year[in_range] = (records["year"] + year_term) % 60
+        month[in_range] = (records["month"] + after_term) % 60
+        day[in_range] = records["day"]
+
+        # 시지: 23시는 자시, 그 외에는 (hour + 1) // 2
+        hour_branch = (row_minute // 60 + 1) // 2 % 12
+        row_time = hour_table[records["day"] % 10 % 5 * 12 + hour_branch]
+        time[in_range] = np.where(row_has_time, row_time, -1)
+    else:
+        in_range[:] = False
+
+    # 테이블 범위 밖이거나 테이블이 없으면 직접 계산
+    outside = np.flatnonzero(~in_range)
+    if len(outside):
+        calculator = FourPillarsCalculator()
+        birth_datetimes = minutes[outside].astype("datetime64[m]").tolist()
+        for index, birth_date in zip(outside, birth_datetimes):
+            year[index], month[index], day[index], time[index] = (
+                calculator.calculate_kanshi_indices(
+                    birth_date.year,
+                    birth_date.month,
+                    birth_date.day,
+                    birth_date.hour if has_time[index] else None,
+                    birth_date.minute if has_time[index] else None,
+                )
+            )
+
+    # 개수가 같으면 FiveElements 순서상 앞선 오행
+    counts = count_elements_batch(year, month, day, time)
+
+    return FourPillarsBatchResult(
+        year=year,
+        month=month,
+        day=day,
+        time=time,
+        strong_element=counts.argmax(axis=1).astype(np.int8),
+        weak_element=counts.argmin(axis=1).astype(np.int8),
+    )
@@ -1,15 +1,21 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from src.four_pillars.api.schemas import FourPillarDetail
-from src.four_pillars.domain.constants import BASE_YEAR, JIKKAN, JYUNISHI
+from src.four_pillars.domain.constants import BASE_YEAR
 from src.four_pillars.domain.entities.enums import FiveElements
-from src.four_pillars.domain.entities.models import FourPillar
+from src.four_pillars.domain.entities.models import FourPillar, FourPillarCodes
 from src.four_pillars.domain.services.analyzer import (
     FiveElementsAnalyzer,
     TenGodsAnalyzer,
 )
 from src.four_pillars.domain.services.data_loader import FourPillarsDataLoader
+from src.four_pillars.domain.services.pillar_table import (
+    PillarTable,
+    get_hour_branch,
+)
+
+_FIVE_ELEMENTS = tuple(FiveElements)
 
 
 class FourPillarsCalculator:
@@ -21,29 +27,42 @@ class FourPillarsCalculator:
             description_generator: 설명 생성기 (선택적). 제공되면 calculate_four_pillars_detailed에서 설명 생성
         """
         self.data_loader = FourPillarsDataLoader()
+        self.pillar_table = PillarTable()
         self.five_elements_analyzer = FiveElementsAnalyzer()
         self.ten_gods_analyzer = TenGodsAnalyzer()
         self.description_generator = description_generator
 
-    def calculate_four_pillars(self, birth_date: datetime) -> FourPillar:
-        """사주 계산 메인 함수"""
-        year = birth_date.year
-        month = birth_date.month
-        day = birth_date.day
+    def calculate_four_pillar_codes(self, birth_date: datetime) -> FourPillarCodes:
+        """사주를 60간지 인덱스로 계산
 
+        00:00은 시간을 입력하지 않은 것으로 간주하여 시주를 계산하지 않습니다.
+        """
+        hour: Optional[int] = None
+        minute: Optional[int] = None
+        minute_of_day: Optional[int] = None
         if birth_date.hour != 0 or birth_date.minute != 0:
             hour = birth_date.hour
             minute = birth_date.minute
-        else:
-            hour = None
-            minute = None
+            minute_of_day = hour * 60 + minute
 
-        pillars = self._calculate_kanshi(year, month, day, hour, minute)
+        # 사전 계산된 테이블 조회, 범위를 벗어나면 직접 계산
+        indices = self.pillar_table.lookup(birth_date, minute_of_day)
+        if indices is None:
+            indices = self.calculate_kanshi_indices(
+                birth_date.year, birth_date.month, birth_date.day, hour, minute
+            )
+
+        return FourPillarCodes(*indices)
+
+    def calculate_four_pillars(self, birth_date: datetime) -> FourPillar:
+        """사주 계산 메인 함수"""
+        year, month, day, time = self.calculate_four_pillar_codes(birth_date)
+        get_kanshi = self.data_loader.get_kanshi
         result: FourPillar = {
-            "year_pillar": pillars[0],  # 년주
-            "month_pillar": pillars[1],  # 월주
-            "day_pillar": pillars[2],  # 일주
-            "time_pillar": pillars[3],  # 시주
+            "year_pillar": get_kanshi(year),  # 년주
+            "month_pillar": get_kanshi(month),  # 월주
+            "day_pillar": get_kanshi(day),  # 일주
+            "time_pillar": get_kanshi(time) if time >= 0 else None,  # 시주
         }
 
         return result
@@ -57,78 +76,48 @@ class FourPillarsCalculator:
         그렇지 않으면 description은 빈 문자열입니다.
         """
         # 기본 사주 계산
-        basic_result = self.calculate_four_pillars(birth_date)
+        pillars = self.calculate_four_pillar_codes(birth_date)
 
-        # 일간 추출 (일주의 천간)
-        day_stem = (
-            basic_result["day_pillar"][0]
-            if basic_result["day_pillar"]
-            else "甲"
-        )
-
-        # 각 기둥의 상세 정보 생성
-        year_pillar_detail = self.ten_gods_analyzer.get_pillar_detail(
-            basic_result["year_pillar"], day_stem
-        )
-        month_pillar_detail = self.ten_gods_analyzer.get_pillar_detail(
-            basic_result["month_pillar"], day_stem
-        )
-        day_pillar_detail = self.ten_gods_analyzer.get_pillar_detail(
-            basic_result["day_pillar"], day_stem
-        )
-        time_pillar_detail = (
-            self.ten_gods_analyzer.get_pillar_detail(
-                basic_result["time_pillar"], day_stem
-            )
-            if basic_result["time_pillar"]
+        # 일간 (일주의 천간) 기준 각 기둥의 십신
+        day_stem = pillars.day % 10
+        ten_gods = [
+            self.ten_gods_analyzer.get_pillar_ten_gods(pillar, day_stem)
+            if pillar >= 0
             else None
-        )
+            for pillar in pillars
+        ]
 
         # 가장 강한 오행과 약한 오행
-        strong_elements, weak_elements = self.five_elements_analyzer.analyze(
-            [
-                basic_result["year_pillar"],
-                basic_result["month_pillar"],
-                basic_result["day_pillar"],
-                basic_result["time_pillar"],
-            ]
+        strong_element, weak_element = self.five_elements_analyzer.analyze(
+            pillars
         )
 
-        # 기본값 설정
-        strong_element = (
-            strong_elements[0] if strong_elements else FiveElements.EARTH
-        )
-        weak_element = weak_elements[0] if weak_elements else FiveElements.WOOD
-
-        # FourPillarDetail 객체 생성
-        result = FourPillarDetail(
-            strong_element=strong_element,
-            weak_element=weak_element,
-            description="",  # 기본값
-            year_pillar_detail=year_pillar_detail,
-            month_pillar_detail=month_pillar_detail,
-            day_pillar_detail=day_pillar_detail,
-            time_pillar_detail=time_pillar_detail,
+        # 응답 스키마로 변환 (문자열은 여기서만 생성)
+        result = FourPillarDetail.from_codes(
+            pillars, ten_gods, strong_element, weak_element
         )
 
         # description_generator가 있으면 설명 생성
         if self.description_generator:
             description = await self.description_generator.generate(
-                result, strong_element
+                result, _FIVE_ELEMENTS[strong_element]
             )
             result.description = description
 
         return result
 
-    def _calculate_kanshi(
+    def calculate_kanshi_indices(
         self,
         year: int,
         month: int,
         day: int,
         hour: Optional[int] = None,
         minute: Optional[int] = None,
-    ) -> List[str]:
-        """간지 계산"""
+    ) -> Tuple[int, int, int, int]:
+        """절입 데이터로 간지 인덱스를 직접 계산 (시주가 없으면 -1)
+
+        조회 테이블 생성과 테이블 범위 밖의 날짜 계산에 사용됩니다.
+        """
         # 절입일 계산
         setsuiri_day, setsuiri_hour, setsuiri_minute = (
             self.data_loader.get_setsuiri(year, month)
@@ -147,7 +136,6 @@ class FourPillarsCalculator:
             )
         ):
             yd -= 1
-        year_pillar = self.data_loader.get_kanshi(yd)
 
         # 월주 계산
         md = (year - 1863) * 12 + (month - 12)
@@ -156,23 +144,20 @@ class FourPillarsCalculator:
             and (hour is None or hour * 60 + (minute or 0) < setsuiri_time)
         ):
             md -= 1
-        month_pillar = self.data_loader.get_kanshi(md)
 
         # 일주 계산
         dd = (date(year, month, day) - date(1863, 12, 31)).days
-        day_pillar = self.data_loader.get_kanshi(dd)
 
+        # 시주 계산
         if hour is not None and minute is not None:
-            if hour == 23:
-                jyunishi_idx = 0
-            else:
-                jyunishi_idx = (hour + 1) // 2
-
-            jikkan_idx = (
-                (JIKKAN.index(day_pillar[0]) % 5) * 2 + jyunishi_idx
-            ) % 10
-            time_pillar = JIKKAN[jikkan_idx] + JYUNISHI[jyunishi_idx]
+            jyunishi_idx = get_hour_branch(hour)
+            jikkan_idx = ((dd % 10 % 5) * 2 + jyunishi_idx) % 10
+            td = next(
+                i
+                for i in range(jyunishi_idx, 60, 12)
+                if i % 10 == jikkan_idx
+            )
         else:
-            time_pillar = None
+            td = -1
 
-        return [year_pillar, month_pillar, day_pillar, time_pillar]
+        return yd % 60, md % 60, dd % 60, td
@@ -0,0 +1,100 @@
+"""사주 궁합 점수 계산
+
+한 사용자의 사주를 N명의 후보와 한 번의 벡터 연산으로 비교합니다.
+후보의 사주는 calculate_four_pillars_batch 결과(60간지 인덱스 배열)를 사용합니다.
+
+점수 (0~100, 기본 50점):
+- 일간 관계: 천간합 +20, 오행 상생 +10, 오행 상극 -10
+- 일지 관계: 육합 +20, 삼합 +15, 같은 지지 +5, 충 -20
+- 년지(띠) 관계: 일지 관계 점수의 절반
+- 오행 균형: 두 사람의 오행을 합쳤을 때 고르게 분포할수록 최대 +10, 치우칠수록 최대 -10
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from src.four_pillars.domain.constants import STEM_ELEMENTS
+from src.four_pillars.domain.entities.models import FourPillarCodes
+from src.four_pillars.domain.services.batch import (
+    FourPillarsBatchResult,
+    count_elements_batch,
+)
+
+BASE_SCORE = 50
+
+
+def _build_stem_relations() -> np.ndarray:
+    """[천간 a][천간 b] -> 일간 관계 점수"""
+    table = np.zeros((10, 10), dtype=np.int16)
+    for a in range(10):
+        for b in range(10):
+            ea, eb = STEM_ELEMENTS[a], STEM_ELEMENTS[b]
+            if (a - b) % 10 == 5:  # 천간합 (甲己, 乙庚, 丙辛, 丁壬, 戊癸)
+                table[a, b] = 20
+            elif (ea + 1) % 5 == eb or (eb + 1) % 5 == ea:  # 상생
+                table[a, b] = 10
+            elif (ea + 2) % 5 == eb or (eb + 2) % 5 == ea:  # 상극
+                table[a, b] = -10
+    return table
+
+
+def _build_branch_relations() -> np.ndarray:
+    """[지지 a][지지 b] -> 지지 관계 점수"""
+    table = np.zeros((12, 12), dtype=np.int16)
+    for a in range(12):
+        for b in range(12):
+            if (a + b) % 12 == 1:  # 육합 (子丑, 寅亥, 卯戌, 辰酉, 巳申, 午未)
+                table[a, b] = 20
+            elif (a - b) % 12 == 6:  # 충
+                table[a, b] = -20
+            elif a == b:
+                table[a, b] = 5
+            elif a % 4 == b % 4:  # 삼합 (申子辰, 亥卯未, 寅午戌, 巳酉丑)
+                table[a, b] = 15
+    return table
+
+
+STEM_RELATIONS = _build_stem_relations()
+BRANCH_RELATIONS = _build_branch_relations()
+
+
+def score_compatibility(
+    user: FourPillarCodes, candidates: FourPillarsBatchResult
+) -> np.ndarray:
+    """사용자와 후보들의 궁합 점수 (후보 순서의 0~100 정수 배열)"""
+    day = candidates.day.astype(np.int16)
+    year = candidates.year.astype(np.int16)
+
+    score = (
+        BASE_SCORE
+        + STEM_RELATIONS[user.day % 10, day % 10]
+        + BRANCH_RELATIONS[user.day % 12, day % 12]
+        + BRANCH_RELATIONS[user.year % 12, year % 12] // 2
+    ).astype(np.float32)
+
+    # 오행 균형: 합친 오행 개수의 변동계수(표준편차 / 평균)가 작을수록 높음
+    user_counts = count_elements_batch(
+        np.array([user.year]),
+        np.array([user.month]),
+        np.array([user.day]),
+        np.array([user.time]),
+    )
+    combined = count_elements_batch(
+        candidates.year, candidates.month, candidates.day, candidates.time
+    ).astype(np.float32)
+    combined += user_counts
+    mean = combined.sum(axis=1) / 5
+    variation = combined.std(axis=1) / mean
+    # 변동계수 0 -> +10, 1 이상 -> -10
+    score += 10 - 20 * np.minimum(variation, 1.0)
+
+    return np.clip(np.rint(score), 0, 100).astype(np.int16)
+
+
+def rank_compatibility(
+    scores: np.ndarray, skip: int = 0, limit: int = 20
+) -> Tuple[np.ndarray, int]:
+    """점수 내림차순 (같으면 후보 순서) 페이지의 후보 인덱스와 전체 수"""
+    order = np.argsort(-scores, kind="stable")
+    return order[skip : skip + limit], len(scores)
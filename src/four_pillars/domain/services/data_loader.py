@@ -1,34 +1,49 @@
 from pathlib import Path
-from typing import Tuple
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 from src.four_pillars.domain.constants import JIKKAN, JYUNISHI
 
 
 class FourPillarsDataLoader:
-    """사주 계산에 필요한 데이터를 로드하는 클래스"""
+    """사주 계산에 필요한 데이터를 로드하는 클래스 (싱글톤)
 
-    def __init__(self):
-        self.kanshi_array: list[str] = []
-        self.setsuiri_data: dict[int, Tuple[int, int]] = {}
-        self._init_kanshi_data()
-        self._init_setsuiri_data()
+    solar_terms.txt는 프로세스당 한 번만 읽으며, 로드된 데이터는
+    읽기 전용으로 계산기/분석기/서비스가 함께 사용합니다.
+    """
 
-    def _init_kanshi_data(self):
+    _instance = None
+
+    # solar_terms.txt를 읽은 횟수 (프로세스당 1회 로드 확인용)
+    file_read_count = 0
+
+    kanshi_array: Tuple[str, ...]
+    setsuiri_data: Mapping[int, Tuple[int, int]]
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            instance = super().__new__(cls)
+            instance.kanshi_array = cls._init_kanshi_data()
+            instance.setsuiri_data = cls._init_setsuiri_data()
+            cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def _init_kanshi_data() -> Tuple[str, ...]:
         """60간지 배열 초기화"""
-        self.kanshi_array = []
-        for i in range(60):
-            j1 = JIKKAN[i % 10]
-            j2 = JYUNISHI[i % 12]
-            self.kanshi_array.append(j1 + j2)
-    def _init_setsuiri_data(self):
+        return tuple(JIKKAN[i % 10] + JYUNISHI[i % 12] for i in range(60))
+
+    @classmethod
+    def _init_setsuiri_data(cls) -> Mapping[int, Tuple[int, int]]:
         """절입 데이터 초기화"""
-        self.setsuiri_data = {}
+        setsuiri_data = {}
 
         # four_pillars 패키지의 static 폴더에서 파일 읽기
         package_dir = Path(__file__).parent.parent.parent
         setsuiri_file = package_dir / "static" / "solar_terms.txt"
 
         with open(setsuiri_file, "r", encoding="utf-8") as f:
+            cls.file_read_count += 1
             for line in f:
                 line = line.strip()
                 if line and not line.startswith("#"):
@@ -41,7 +56,9 @@ class FourPillarsDataLoader:
                         minute = int(parts[4])
 
                         key = year * 100 + month
-                        self.setsuiri_data[key] = (day, hour * 60 + minute)
+                        setsuiri_data[key] = (day, hour * 60 + minute)
+
+        return MappingProxyType(setsuiri_data)
 
     def get_setsuiri(self, year: int, month: int) -> Tuple[int, int, int]:
         """절입일과 절입시 계산"""
@@ -59,4 +76,3 @@ class FourPillarsDataLoader:
     def get_kanshi(self, index: int) -> str:
         """간지 배열에서 인덱스로 간지 가져오기"""
         return self.kanshi_array[index % 60]
-
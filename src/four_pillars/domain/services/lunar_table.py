@@ -0,0 +1,179 @@
+"""사전 계산된 음력 <-> 양력 변환 테이블
+
+`scripts/build_lunar_table.py`로 생성한 바이너리 파일을 읽어, 음력 날짜를
+양력으로(또는 그 반대로) 연도별 고정 크기 레코드 한 건 조회로 변환합니다.
+런타임에 천문 계산을 하지 않습니다.
+
+파일 구조 (little-endian):
+- 헤더 (12 bytes): 매직, 버전, 레코드 크기, 시작 음력 연도, 연도 수
+- 레코드 (34 bytes x 연도 수): 음력 연도 순서대로 저장
+  - new_year: 음력 1월 1일의 양력 ordinal
+  - leap_month: 윤달이 있는 달 (없으면 0)
+  - month_starts: 월 시작일의 설날 기준 일수 (윤달 포함 순서, 마지막은 다음 설날)
+"""
+
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+LUNAR_TABLE_FILE = (
+    Path(__file__).parent.parent.parent / "static" / "lunar_table.bin"
+)
+
+MAGIC = b"SJLT"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHHH")
+# new_year, leap_month, (예약), month_starts[14]
+RECORD = struct.Struct("<IBB14H")
+MONTH_SLOTS = 14
+
+
+class LunarTable:
+    """음력 변환 테이블 (싱글톤)"""
+
+    _instance: Optional["LunarTable"] = None
+
+    path: Path
+    _buffer: Optional[bytes]
+    first_year: int
+    count: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LunarTable":
+        if not cls._instance:
+            cls._instance = cls.load(LUNAR_TABLE_FILE)
+        return cls._instance
+
+    @classmethod
+    def load(cls, path: Path) -> "LunarTable":
+        """지정한 경로의 테이블을 엽니다. 파일이 없거나 형식이 다르면 비활성 상태입니다."""
+        table = super().__new__(cls)
+        table.path = path
+        table._buffer = None
+        table.first_year = 0
+        table.count = 0
+        table._open(path)
+        return table
+
+    def _open(self, path: Path) -> None:
+        try:
+            buffer = path.read_bytes()
+        except OSError:
+            return
+
+        if len(buffer) < HEADER.size:
+            return
+
+        magic, version, record_size, first_year, count = HEADER.unpack_from(
+            buffer, 0
+        )
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or record_size != RECORD.size
+            or len(buffer) < HEADER.size + count * RECORD.size
+        ):
+            return
+
+        self._buffer = buffer
+        self.first_year = first_year
+        self.count = count
+
+    @property
+    def available(self) -> bool:
+        return self._buffer is not None
+
+    @property
+    def last_year(self) -> int:
+        return self.first_year + self.count - 1
+
+    def read_year(self, lunar_year: int) -> Optional[Tuple[int, int, tuple]]:
+        """음력 연도의 (설날 ordinal, 윤달, 월 시작 일수)"""
+        offset = lunar_year - self.first_year
+        if self._buffer is None or not 0 <= offset < self.count:
+            return None
+        new_year, leap_month, _, *month_starts = RECORD.unpack_from(
+            self._buffer, HEADER.size + offset * RECORD.size
+        )
+        return new_year, leap_month, tuple(month_starts)
+
+    def to_solar(
+        self, year: int, month: int, day: int, is_leap_month: bool = False
+    ) -> Optional[date]:
+        """음력 날짜를 양력으로 변환합니다. 존재하지 않는 날짜면 None"""
+        record = self.read_year(year)
+        if record is None or not 1 <= month <= 12 or day < 1:
+            return None
+
+        new_year, leap_month, month_starts = record
+        if is_leap_month and month != leap_month:
+            return None
+
+        # 윤달은 같은 달(평달) 바로 다음 순서
+        slot = month - 1
+        if leap_month and (month > leap_month or is_leap_month):
+            slot += 1
+
+        if day > month_starts[slot + 1] - month_starts[slot]:
+            return None
+        return date.fromordinal(new_year + month_starts[slot] + day - 1)
+
+    def to_lunar(self, target: date) -> Optional[Tuple[int, int, int, bool]]:
+        """양력 날짜를 음력 (연, 월, 일, 윤달 여부)로 변환합니다."""
+        ordinal = target.toordinal()
+        # 설날은 양력 1~2월이므로 음력 연도는 양력 연도 또는 그 전 해
+        for lunar_year in (target.year, target.year - 1):
+            record = self.read_year(lunar_year)
+            if record is None or ordinal < record[0]:
+                continue
+
+            new_year, leap_month, month_starts = record
+            days = ordinal - new_year
+            if days >= month_starts[-1]:
+                return None
+
+            slot = 0
+            while month_starts[slot + 1] <= days:
+                slot += 1
+
+            month = slot + 1
+            is_leap_month = False
+            if leap_month and slot >= leap_month:
+                month = slot
+                is_leap_month = slot == leap_month
+            return (
+                lunar_year,
+                month,
+                days - month_starts[slot] + 1,
+                is_leap_month,
+            )
+        return None
+
+
+def write_lunar_table(
+    path: Path,
+    first_year: int,
+    records: Iterable[Tuple[int, int, Sequence[int]]],
+) -> int:
+    """변환 테이블 파일을 생성하고 기록한 연도 수를 반환합니다.
+
+    records는 음력 연도 순서대로 (설날 ordinal, 윤달, 월 시작 일수)이며,
+    월 시작 일수는 마지막에 다음 설날까지의 일수를 포함합니다.
+    """
+    body = bytearray()
+    count = 0
+    for new_year, leap_month, month_starts in records:
+        # 평년(12개월)은 마지막 칸을 다음 설날 일수로 채움
+        starts = list(month_starts)
+        starts += [starts[-1]] * (MONTH_SLOTS - len(starts))
+        body += RECORD.pack(new_year, leap_month, 0, *starts)
+        count += 1
+
+    header = HEADER.pack(MAGIC, VERSION, RECORD.size, first_year, count)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    tmp_path.replace(path)
+    return count
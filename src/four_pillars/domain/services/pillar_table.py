@@ -0,0 +1,185 @@
+"""사전 계산된 사주 조회 테이블
+
+`scripts/build_pillar_table.py`로 생성한 바이너리 파일을 읽기 전용으로
+메모리 매핑하여, 날짜별 년주/월주/일주 인덱스를 한 번의 조회로 반환합니다.
+
+파일 구조 (little-endian):
+- 헤더 (16 bytes): 매직, 버전, 레코드 크기, 시작일(ordinal), 레코드 수
+- 시주 테이블 (64 bytes): [일간 % 5][시지] -> 60간지 인덱스 (60개 사용)
+- 레코드 (6 bytes x 레코드 수): 날짜 순서대로 저장
+  - year, month, day: 절입 전(또는 시간 미입력) 기준 60간지 인덱스
+  - flags: 절입 시각 이후 년주도 바뀌는지 여부 (입춘)
+  - term_minute: 해당 날짜의 절입 시각(분), 절입일이 아니면 NO_TERM
+"""
+
+import mmap
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+PILLAR_TABLE_FILE = (
+    Path(__file__).parent.parent.parent / "static" / "pillar_table.bin"
+)
+
+MAGIC = b"SJPT"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+HOUR_TABLE_SIZE = 64
+RECORD = struct.Struct("<BBBBH")
+RECORDS_OFFSET = HEADER.size + HOUR_TABLE_SIZE
+
+# 절입일이 아닌 날짜의 term_minute 값
+NO_TERM = 0xFFFF
+# 절입 시각 이후 년주가 바뀌는 날짜 (입춘)
+FLAG_YEAR_TERM = 0x01
+
+
+def get_hour_branch(hour: int) -> int:
+    """시(hour)를 지지 인덱스로 변환 (23시는 자시)"""
+    return 0 if hour == 23 else (hour + 1) // 2
+
+
+class PillarTable:
+    """메모리 매핑된 사주 조회 테이블 (싱글톤)
+
+    mmap은 읽기 전용 공유 매핑이므로 같은 파일을 여는 모든 gunicorn 워커가
+    OS 페이지 캐시의 동일한 페이지를 사용합니다.
+    """
+
+    _instance: Optional["PillarTable"] = None
+
+    path: Path
+    _buffer: Optional[mmap.mmap]
+    first_ordinal: int
+    count: int
+    hour_table: bytes
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "PillarTable":
+        if not cls._instance:
+            cls._instance = cls.load(PILLAR_TABLE_FILE)
+        return cls._instance
+
+    @classmethod
+    def load(cls, path: Path) -> "PillarTable":
+        """지정한 경로의 테이블을 엽니다. 파일이 없거나 형식이 다르면 비활성 상태입니다."""
+        table = super().__new__(cls)
+        table.path = path
+        table._buffer = None
+        table.first_ordinal = 0
+        table.count = 0
+        table.hour_table = b""
+        table._open(path)
+        return table
+
+    def _open(self, path: Path) -> None:
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+
+        if len(buffer) < RECORDS_OFFSET:
+            buffer.close()
+            return
+
+        magic, version, record_size, first_ordinal, count = (
+            HEADER.unpack_from(buffer, 0)
+        )
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or record_size != RECORD.size
+            or len(buffer) < RECORDS_OFFSET + count * RECORD.size
+        ):
+            buffer.close()
+            return
+
+        self._buffer = buffer
+        self.first_ordinal = first_ordinal
+        self.count = count
+        self.hour_table = bytes(buffer[HEADER.size : HEADER.size + 60])
+
+    @property
+    def available(self) -> bool:
+        return self._buffer is not None
+
+    @property
+    def buffer(self) -> Optional[mmap.mmap]:
+        """레코드 영역을 포함한 원본 버퍼 (배치 계산용)"""
+        return self._buffer
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self.first_ordinal)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self.first_ordinal + self.count - 1)
+
+    def contains(self, target: date) -> bool:
+        return 0 <= target.toordinal() - self.first_ordinal < self.count
+
+    def read_record(self, target: date) -> Optional[Tuple[int, int, int, int, int]]:
+        """날짜의 원본 레코드 (year, month, day, flags, term_minute)"""
+        offset = target.toordinal() - self.first_ordinal
+        if self._buffer is None or not 0 <= offset < self.count:
+            return None
+        return RECORD.unpack_from(
+            self._buffer, RECORDS_OFFSET + offset * RECORD.size
+        )
+
+    def lookup(
+        self, target: date, minute_of_day: Optional[int]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """년주/월주/일주/시주의 60간지 인덱스를 조회합니다.
+
+        minute_of_day가 None이면 시간 미입력으로 보고 시주는 -1입니다.
+        테이블 범위를 벗어나면 None을 반환합니다.
+        """
+        record = self.read_record(target)
+        if record is None:
+            return None
+
+        year_idx, month_idx, day_idx, flags, term_minute = record
+        if minute_of_day is None:
+            return year_idx, month_idx, day_idx, -1
+
+        # 절입일의 절입 시각 이후에는 다음 절기의 간지를 사용
+        if minute_of_day >= term_minute:
+            month_idx = (month_idx + 1) % 60
+            if flags & FLAG_YEAR_TERM:
+                year_idx = (year_idx + 1) % 60
+
+        hour_branch = get_hour_branch(minute_of_day // 60)
+        time_idx = self.hour_table[(day_idx % 10) % 5 * 12 + hour_branch]
+        return year_idx, month_idx, day_idx, time_idx
+
+
+def write_pillar_table(
+    path: Path,
+    first_date: date,
+    hour_table: Sequence[int],
+    records: Iterable[Tuple[int, int, int, int, int]],
+) -> int:
+    """조회 테이블 파일을 생성하고 기록한 레코드 수를 반환합니다."""
+    body = bytearray()
+    count = 0
+    for record in records:
+        body += RECORD.pack(*record)
+        count += 1
+
+    hour_bytes = bytes(hour_table).ljust(HOUR_TABLE_SIZE, b"\x00")
+    header = HEADER.pack(
+        MAGIC, VERSION, RECORD.size, first_date.toordinal(), count
+    )
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(hour_bytes)
+        f.write(body)
+    # 실행 중인 워커가 매핑한 파일을 덮어쓰지 않도록 교체
+    tmp_path.replace(path)
+    return count
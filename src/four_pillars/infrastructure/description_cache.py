@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# 프로세스별로 메모리에 유지할 설명 수
+DESCRIPTION_CACHE_SIZE = 4096
+
+
+class FourPillarDescriptionCache:
+    """사주 설명 LRU 캐시 (싱글톤)
+
+    DB 테이블(four_pillar_descriptions) 앞단의 프로세스 내 캐시이며,
+    메모리/DB 적중과 HCX 호출 횟수를 함께 집계합니다.
+    """
+
+    _instance: Optional["FourPillarDescriptionCache"] = None
+
+    max_size: int
+    # 서명 -> 설명 (오래된 순)
+    _entries: "OrderedDict[str, str]"
+    memory_hits: int
+    db_hits: int
+    misses: int
+    failures: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "FourPillarDescriptionCache":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.max_size = DESCRIPTION_CACHE_SIZE
+            cls._instance._entries = OrderedDict()
+            cls._instance.memory_hits = 0
+            cls._instance.db_hits = 0
+            cls._instance.misses = 0
+            cls._instance.failures = 0
+        return cls._instance
+
+    def get(self, signature: str) -> Optional[str]:
+        """메모리에서 설명을 조회합니다. 적중하면 최근 사용으로 갱신합니다."""
+        description = self._entries.get(signature)
+        if description is not None:
+            self._entries.move_to_end(signature)
+            self.memory_hits += 1
+        return description
+
+    def put_from_db(self, signature: str, description: str) -> None:
+        """DB에서 찾은 설명을 저장하고 DB 적중으로 집계합니다."""
+        self.db_hits += 1
+        self.put(signature, description)
+
+    def record_miss(self) -> None:
+        """메모리와 DB 모두 없어 HCX를 호출하는 경우"""
+        self.misses += 1
+
+    def record_failure(self) -> None:
+        """HCX 호출에 실패하여 기본 설명을 반환하는 경우"""
+        self.failures += 1
+
+    def put(self, signature: str, description: str) -> None:
+        """설명을 저장하고 용량을 넘으면 가장 오래된 항목을 제거합니다."""
+        self._entries[signature] = description
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/미스 통계"""
+        lookups = self.memory_hits + self.db_hits + self.misses
+        hits = self.memory_hits + self.db_hits
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "failures": self.failures,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
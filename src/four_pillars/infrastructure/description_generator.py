@@ -1,72 +1,139 @@
+from typing import Optional
+
 from src.four_pillars.api.schemas import FourPillarDetail
 from src.four_pillars.domain.entities.enums import FiveElements
+from src.four_pillars.domain.entities.models import FourPillar
+from src.four_pillars.domain.interfaces import IFourPillarDescriptionRepository
+from src.four_pillars.infrastructure.description_cache import (
+    FourPillarDescriptionCache,
+)
 from src.hcx_client.client import HCXClient
-from src.hcx_client.common.utils import HCXUtils
+from src.hcx_client.common.prompt_registry import PromptRegistry
+from src.hcx_client.entities.enums import Lane
+
+# API 호출 실패 시 기본 설명 (캐시하지 않음)
+DEFAULT_DESCRIPTION = "근심과 즐거움이 상반하니 세월의 흐름을 잘 읽어보시게"
 
 
 class FourPillarDescriptionGenerator:
-    """사주 설명 생성 클래스 (HCX API 호출)"""
+    """사주 설명 생성 클래스 (HCX API 호출)
+
+    설명은 네 기둥과 가장 강한 오행에만 의존하므로 이 조합을 키로
+    메모리 LRU -> DB 테이블 순서로 먼저 조회하고, 없을 때만 HCX를 호출합니다.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[IFourPillarDescriptionRepository] = None,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> None:
+        """
+        Args:
+            repository: 설명 캐시 리포지토리 (선택적). 없으면 메모리 캐시만 사용
+            lane: HCX 호출 우선순위 레인 (사전 생성 스크립트는 bulk)
+        """
+        self.repository = repository
+        self.lane = lane
+        self.cache = FourPillarDescriptionCache()
+
+    @staticmethod
+    def to_four_pillar(four_pillar_detail: FourPillarDetail) -> FourPillar:
+        """FourPillarDetail에서 기둥별 간지 문자열 추출 (없는 기둥은 빈 문자열)"""
+        pillars = []
+        for detail in (
+            four_pillar_detail.year_pillar_detail,
+            four_pillar_detail.month_pillar_detail,
+            four_pillar_detail.day_pillar_detail,
+            four_pillar_detail.time_pillar_detail,
+        ):
+            pillars.append(f"{detail.stem}{detail.branch}" if detail else "")
+
+        return {
+            "year_pillar": pillars[0],
+            "month_pillar": pillars[1],
+            "day_pillar": pillars[2],
+            "time_pillar": pillars[3],
+        }
+
+    @staticmethod
+    def make_signature(four_pillar: FourPillar, strong_element: str) -> str:
+        """캐시 키: 년주+월주+일주+시주+강한 오행"""
+        return (
+            f"{four_pillar['year_pillar']}{four_pillar['month_pillar']}"
+            f"{four_pillar['day_pillar']}{four_pillar.get('time_pillar') or ''}"
+            f"{strong_element}"
+        )
 
     async def generate(
         self, four_pillar_detail: FourPillarDetail, strong_element: FiveElements
     ) -> str:
-        """HCX API를 호출하여 사주 설명을 생성합니다."""
-        try:
-            hcx_client = HCXClient()
+        """사주 설명을 캐시에서 조회하거나 HCX API를 호출하여 생성합니다."""
+        return await self.generate_for(
+            self.to_four_pillar(four_pillar_detail),
+            FiveElements(strong_element),
+        )
 
-            # FourPillarDetail에서 사주 정보 추출
-            year_pillar = ""
-            month_pillar = ""
-            day_pillar = ""
-            time_pillar = ""
+    async def generate_for(
+        self, four_pillar: FourPillar, strong_element: FiveElements
+    ) -> str:
+        """기둥별 간지 문자열과 강한 오행으로 설명을 조회하거나 생성합니다."""
+        signature = self.make_signature(four_pillar, strong_element.value)
 
-            if four_pillar_detail.year_pillar_detail:
-                year_pillar = (
-                    f"{four_pillar_detail.year_pillar_detail.stem}"
-                    f"{four_pillar_detail.year_pillar_detail.branch}"
-                )
+        description = self.cache.get(signature)
+        if description is not None:
+            return description
 
-            if four_pillar_detail.month_pillar_detail:
-                month_pillar = (
-                    f"{four_pillar_detail.month_pillar_detail.stem}"
-                    f"{four_pillar_detail.month_pillar_detail.branch}"
-                )
+        if self.repository:
+            description = await self.repository.get_description(signature)
+            if description is not None:
+                self.cache.put_from_db(signature, description)
+                return description
 
-            if four_pillar_detail.day_pillar_detail:
-                day_pillar = (
-                    f"{four_pillar_detail.day_pillar_detail.stem}"
-                    f"{four_pillar_detail.day_pillar_detail.branch}"
-                )
+        self.cache.record_miss()
+        description = await self._call_hcx(four_pillar, strong_element)
+        if description is None:
+            self.cache.record_failure()
+            return DEFAULT_DESCRIPTION
 
-            if four_pillar_detail.time_pillar_detail:
-                time_pillar = (
-                    f"{four_pillar_detail.time_pillar_detail.stem}"
-                    f"{four_pillar_detail.time_pillar_detail.branch}"
+        # 빈 응답은 저장하지 않음
+        if description:
+            self.cache.put(signature, description)
+            if self.repository:
+                await self.repository.save_description(
+                    signature, four_pillar, strong_element.value, description
                 )
+        return description
+
+    async def _call_hcx(
+        self, four_pillar: FourPillar, strong_element: FiveElements
+    ) -> Optional[str]:
+        """HCX API를 호출하여 사주 설명을 생성합니다. 실패하면 None"""
+        try:
+            hcx_client = HCXClient()
 
             # 사주 정보 준비
             four_pillar_data = {
-                "year_pillar": year_pillar,
-                "month_pillar": month_pillar,
-                "day_pillar": day_pillar,
-                "time_pillar": time_pillar,
+                "year_pillar": four_pillar["year_pillar"],
+                "month_pillar": four_pillar["month_pillar"],
+                "day_pillar": four_pillar["day_pillar"],
+                "time_pillar": four_pillar.get("time_pillar") or "",
                 "strong_element": strong_element.value,
             }
 
-            # HCXUtils를 사용하여 프롬프트 가져오기
-            system_prompt, user_prompt_template = HCXUtils.get_prompt_pair(
-                "fortune.yaml", "four_pillar"
+            system_prompt, user_prompt = PromptRegistry().render(
+                "fortune.yaml", "four_pillar", **four_pillar_data
             )
 
-            user_prompt = user_prompt_template.format(**four_pillar_data)
-
             # HCX API 호출
             response = await hcx_client.call_completion(
-                system_prompt=system_prompt, user_prompt=user_prompt
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_key="four_pillar",
+                hedge=True,
+                lane=self.lane,
             )
 
             return response.strip()
 
         except Exception:
-            # API 호출 실패 시 기본 설명 반환
-            return "근심과 즐거움이 상반하니 세월의 흐름을 잘 읽어보시게"
+            return None
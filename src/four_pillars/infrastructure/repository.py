@@ -0,0 +1,57 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.four_pillars.domain.entities.models import (
+    FourPillar,
+    FourPillarDescription,
+)
+
+
+class FourPillarDescriptionRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_description(self, signature: str) -> Optional[str]:
+        """signature에 해당하는 저장된 설명을 조회합니다."""
+        query = select(FourPillarDescription.description).where(
+            FourPillarDescription.signature == signature
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def save_description(
+        self,
+        signature: str,
+        four_pillar: FourPillar,
+        strong_element: str,
+        description: str,
+    ) -> None:
+        """생성한 설명을 저장합니다. 이미 있으면 덮어씁니다."""
+        # 여러 워커가 같은 signature를 동시에 저장해도 충돌하지 않도록 upsert
+        stmt = insert(FourPillarDescription).values(
+            signature=signature,
+            year_pillar=four_pillar["year_pillar"],
+            month_pillar=four_pillar["month_pillar"],
+            day_pillar=four_pillar["day_pillar"],
+            time_pillar=four_pillar.get("time_pillar") or None,
+            strong_element=strong_element,
+            description=description,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            description=stmt.inserted.description,
+            updated_at=stmt.inserted.updated_at,
+        )
+        await self.session.execute(stmt)
+
+    async def get_existing_signatures(self, signatures: list[str]) -> set[str]:
+        """주어진 signature 중 이미 저장된 것을 조회합니다."""
+        if not signatures:
+            return set()
+        query = select(FourPillarDescription.signature).where(
+            FourPillarDescription.signature.in_(signatures)
+        )
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.hcx_client.client import HCXClient
+from src.hcx_client.completion_cache import CompletionCache
+from src.hcx_client.metrics import HCXMetrics
+
+hcx_router = APIRouter(prefix="/admin/hcx", tags=["hcx-admin"])
+
+
+@hcx_router.get("/stats", summary="HCX 클라이언트 통계 (관리자)")
+async def get_hcx_stats():
+    """현재 워커 프로세스의 HCX 커넥션 풀, 호출 및 캐시 통계를 조회합니다."""
+    return {
+        "pool": HCXClient().pool_stats(),
+        "cache": CompletionCache().stats(),
+        "prompts": HCXMetrics().snapshot(),
+    }
+
+
+@hcx_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="HCX 프롬프트별 지표 (Prometheus 형식)",
+)
+async def get_hcx_metrics():
+    """프롬프트 키별 소요 시간, 요청/응답 크기, 토큰, 상태 코드, 파싱 실패 수와
+    레인별 대기 시간"""
+    return (
+        HCXMetrics().render_prometheus()
+        + HCXClient().scheduler.render_prometheus()
+    )
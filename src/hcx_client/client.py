@@ -1,17 +1,61 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
 import httpx
 from fastapi import HTTPException
 
 from src.common.logger import logger
 from src.config.config import hcx_config
+from src.hcx_client.completion_cache import CompletionCache
+from src.hcx_client.entities.enums import Lane
 from src.hcx_client.entities.schemas import CompletionSettings
+from src.hcx_client.hedging import HedgePolicy
+from src.hcx_client.lanes import LaneScheduler
+from src.hcx_client.metrics import HCXMetrics
+from src.hcx_client.resilience import (
+    CircuitBreaker,
+    HCXRetryableError,
+    HCXUnavailableError,
+    backoff_delay,
+    latency_budget,
+)
 
 
 class HCXClient:
-    """HCX API 공용 클라이언트 (싱글톤)"""
+    """HCX API 공용 클라이언트 (싱글톤)
+
+    워커 프로세스마다 하나의 httpx.AsyncClient(커넥션 풀)를 유지하여
+    호출마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    lifespan에서 open()/close()하며, 열리지 않은 상태에서 호출되면
+    (스케줄러 작업, 스크립트 등) 처음 호출할 때 엽니다.
+
+    같은 요청(프롬프트와 설정이 모두 같은 요청)이 처리 중이면 새로 호출하지 않고
+    진행 중인 호출의 결과를 함께 받으며(single-flight), 실제 HCX 호출은
+    HCX_MAX_CONCURRENCY개까지만 동시에 보내고 나머지는 레인(lane) 우선순위에 따라
+    대기합니다(LaneScheduler).
+    prompt_key를 지정한 호출은 응답 캐시(CompletionCache)를 사용합니다.
+
+    HCX 장애 시에는 프롬프트 키별 지연 예산 안에서만 재시도하고, 연속 실패로
+    서킷이 열리면 즉시 HCXUnavailableError(503)를 발생시킵니다.
+    hedge=True인 호출은 응답이 늦어지면 같은 요청을 한 번 더 보냅니다(HedgePolicy).
+    """
+
+    _instance: Optional["HCXClient"] = None
 
-    _instance = None
+    api_key: str
+    url: str
+    headers: Dict[str, str]
+    _client: Optional[httpx.AsyncClient]
+    _inflight: Dict[str, "asyncio.Future[str]"]
+    scheduler: LaneScheduler
+    breaker: CircuitBreaker
+    hedge_policy: HedgePolicy
+    _stats: Dict[str, float]
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, *args: Any, **kwargs: Any) -> "HCXClient":
         if not cls._instance:
             cls._instance = super().__new__(cls)
             cls._instance.api_key = hcx_config.HCX_KEY
@@ -20,32 +64,529 @@ class HCXClient:
                 "Authorization": f"Bearer {cls._instance.api_key}",
                 "Content-Type": "application/json",
             }
+            cls._instance._client = None
+            # 요청 키 -> 진행 중인 HCX 호출
+            cls._instance._inflight = {}
+            cls._instance.scheduler = LaneScheduler(
+                max_concurrency=hcx_config.HCX_MAX_CONCURRENCY,
+                reserved_slots=hcx_config.HCX_INTERACTIVE_RESERVED_SLOTS,
+                rate_limits={
+                    Lane.INTERACTIVE: hcx_config.HCX_INTERACTIVE_RATE_LIMIT,
+                    Lane.BACKGROUND: hcx_config.HCX_BACKGROUND_RATE_LIMIT,
+                    Lane.BULK: hcx_config.HCX_BULK_RATE_LIMIT,
+                },
+            )
+            cls._instance.breaker = CircuitBreaker(
+                failure_threshold=hcx_config.HCX_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=hcx_config.HCX_BREAKER_RESET_TIMEOUT,
+            )
+            cls._instance.hedge_policy = HedgePolicy()
+            cls._instance._stats = {
+                "requests": 0,
+                "errors": 0,
+                "in_flight": 0,
+                "total_seconds": 0.0,
+                "coalesced": 0,
+                "retries": 0,
+                "budget_exceeded": 0,
+            }
         return cls._instance
 
-    async def call_completion(
-        self, system_prompt: str, user_prompt: str, **kwargs
-    ) -> str:
-        """HCX API 호출"""
-        settings = CompletionSettings(
+    def open(self) -> httpx.AsyncClient:
+        """커넥션 풀을 생성합니다. 이미 열려 있으면 그대로 사용합니다."""
+        if self._client is None or self._client.is_closed:
+            http2 = hcx_config.HCX_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("h2 패키지가 없어 HTTP/1.1로 연결합니다.")
+                    http2 = False
+
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=hcx_config.HCX_MAX_CONNECTIONS,
+                    max_keepalive_connections=(
+                        hcx_config.HCX_MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    keepalive_expiry=hcx_config.HCX_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    connect=hcx_config.HCX_CONNECT_TIMEOUT,
+                    read=hcx_config.HCX_READ_TIMEOUT,
+                    write=hcx_config.HCX_WRITE_TIMEOUT,
+                    pool=hcx_config.HCX_POOL_TIMEOUT,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """커넥션 풀을 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.open()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 및 호출 통계 (모니터링용)"""
+        stats: Dict[str, Any] = {
+            "open": self._client is not None and not self._client.is_closed,
+            "max_connections": hcx_config.HCX_MAX_CONNECTIONS,
+            "max_keepalive_connections": (
+                hcx_config.HCX_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            "max_concurrency": hcx_config.HCX_MAX_CONCURRENCY,
+            "coalescing_keys": len(self._inflight),
+            "breaker": self.breaker.stats(),
+            "hedge": self.hedge_policy.stats(),
+            "scheduler": self.scheduler.stats(),
+            **self._stats,
+        }
+        stats["average_seconds"] = (
+            stats["total_seconds"] / stats["requests"]
+            if stats["requests"]
+            else 0.0
+        )
+
+        # httpx는 풀 상태를 공개하지 않으므로 httpcore 풀을 직접 확인
+        pool = self._get_pool()
+        if pool is not None:
+            connections = list(pool.connections)
+            stats["connections"] = len(connections)
+            stats["idle_connections"] = sum(
+                1 for connection in connections if connection.is_idle()
+            )
+            stats["http2_connections"] = sum(
+                1 for connection in connections if "HTTP/2" in connection.info()
+            )
+            stats["queued_requests"] = len(getattr(pool, "_requests", []))
+        return stats
+
+    def _get_pool(self) -> Optional[Any]:
+        if self._client is None or self._client.is_closed:
+            return None
+        transport = getattr(self._client, "_transport", None)
+        return getattr(transport, "_pool", None)
+
+    @staticmethod
+    def _request_key(payload: Dict[str, Any]) -> str:
+        """프롬프트와 설정으로 만든 요청 키"""
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    def _prepare(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        prompt_key: Optional[str],
+        use_cache: bool,
+        cache_scope: Optional[str],
+        settings: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], str, Optional[str]]:
+        """(요청 본문, 요청 키, 캐시 키)"""
+        payload = CompletionSettings(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            **kwargs,
+            **settings,
+        ).model_dump(exclude_none=True)
+        key = self._request_key(payload)
+
+        cache_key = None
+        if prompt_key and use_cache and hcx_config.HCX_CACHE_ENABLED:
+            cache_key = f"{prompt_key}:{cache_scope or ''}:{key}"
+            CompletionCache().open()
+        return payload, key, cache_key
+
+    async def call_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        prompt_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_scope: Optional[str] = None,
+        hedge: bool = False,
+        lane: Lane = Lane.INTERACTIVE,
+        **kwargs: Any,
+    ) -> str:
+        """HCX API 호출 (같은 요청이 진행 중이면 그 결과를 함께 사용)
+
+        prompt_key: 프롬프트 템플릿 키. 지정하면 응답을 캐시합니다.
+        use_cache: False면 캐시를 조회/저장하지 않습니다.
+        cache_scope: 프롬프트에 없지만 응답을 구분해야 하는 값 (예: 운세 날짜)
+        hedge: True면 응답이 늦을 때 같은 요청을 한 번 더 보내 먼저 온 응답을 사용
+        lane: 동시 호출 슬롯을 기다릴 우선순위 레인 (사용자 요청이 아니면 background/bulk)
+        """
+        payload, key, cache_key = self._prepare(
+            system_prompt,
+            user_prompt,
+            prompt_key,
+            use_cache,
+            cache_scope,
+            kwargs,
+        )
+        # 캐시 키는 prompt_key가 있을 때만 만들어짐
+        if cache_key is not None and prompt_key is not None:
+            cached = CompletionCache().get(cache_key, prompt_key)
+            if cached is not None:
+                return cached
+            key = cache_key
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(
+                self._fetch(payload, prompt_key, cache_key, hedge, lane)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+
+        # 기다리던 요청이 취소되어도 함께 기다리는 요청을 위해 호출은 계속 진행
+        return await asyncio.shield(task)
+
+    async def call_completion_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        prompt_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_scope: Optional[str] = None,
+        lane: Lane = Lane.INTERACTIVE,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """HCX API 스트리밍 호출 (생성되는 응답 조각을 차례로 반환)
+
+        캐시된 응답이 있으면 전체 응답을 한 번에 반환하고,
+        스트림이 끝나면 전체 응답을 캐시에 저장합니다.
+        """
+        payload, _, cache_key = self._prepare(
+            system_prompt,
+            user_prompt,
+            prompt_key,
+            use_cache,
+            cache_scope,
+            kwargs,
         )
+        # 캐시 키는 prompt_key가 있을 때만 만들어짐
+        if cache_key is not None and prompt_key is not None:
+            cached = CompletionCache().get(cache_key, prompt_key)
+            if cached is not None:
+                yield cached
+                return
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        if not self.breaker.allow():
+            raise HCXUnavailableError("서킷 차단 중")
+
+        chunks: List[str] = []
+        result = None
+        try:
+            await self.scheduler.acquire(lane)
+        except BaseException:
+            self.breaker.abandon()
+            raise
+        self._stats["requests"] += 1
+        self._stats["in_flight"] += 1
+        started = time.perf_counter()
+        response = None
+        status = "cancelled"
+        try:
+            async with self.client.stream(
+                "POST",
                 self.url,
-                headers=self.headers,
-                json=settings.model_dump(exclude_none=True),
+                json=payload,
+                headers={"Accept": "text/event-stream"},
+            ) as response:
+                status = str(response.status_code)
+                if response.status_code != 200:
+                    await response.aread()
+                    self._check_status(response)
+                    self._raise_error(response.json())
+
+                async for event, data in _iter_sse_events(response):
+                    if event == "token":
+                        content = data["message"]["content"]
+                        if content:
+                            chunks.append(content)
+                            yield content
+                    elif event == "result":
+                        result = data["message"]["content"]
+                        HCXMetrics().record_usage(prompt_key, data)
+                    elif event == "error":
+                        self._raise_error(data)
+        except HTTPException:
+            # 요청 자체의 오류 (HCX는 정상 응답)
+            self._stats["errors"] += 1
+            self.breaker.record_success()
+            raise
+        except (HCXRetryableError, httpx.TransportError) as e:
+            self._stats["errors"] += 1
+            if isinstance(e, httpx.TransportError):
+                status = "transport_error"
+            self.breaker.record_failure()
+            raise HCXUnavailableError(str(e) or type(e).__name__) from e
+        except Exception:
+            self._stats["errors"] += 1
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # 클라이언트 연결 종료 등으로 스트림을 끝까지 읽지 않음
+            self.breaker.abandon()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stats["in_flight"] -= 1
+            self._stats["total_seconds"] += elapsed
+            self.scheduler.release(lane)
+            self._record_call(prompt_key, elapsed, status, response)
+
+        self.breaker.record_success()
+        if cache_key is not None and prompt_key is not None:
+            content = result if result is not None else "".join(chunks)
+            await CompletionCache().put(
+                cache_key,
+                prompt_key,
+                content,
+                CompletionCache.ttl_for(prompt_key),
             )
-            result = response.json()
-            if result["status"]["code"] != "20000":
-                logger.error(f"HCX API 호출 실패: {result['status']['message']}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"HCX API 호출 실패: {result['status']['message']}",
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 요청이 취소된 경우 예외가 회수되지 않았다는 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        payload: Dict[str, Any],
+        prompt_key: Optional[str],
+        cache_key: Optional[str],
+        hedge: bool = False,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> str:
+        if not self.breaker.allow():
+            raise HCXUnavailableError("서킷 차단 중")
+
+        budget = latency_budget(prompt_key)
+        try:
+            async with asyncio.timeout(budget):
+                content = await self._send_with_retry(
+                    payload, prompt_key, hedge, lane
+                )
+        except TimeoutError as e:
+            self._stats["budget_exceeded"] += 1
+            self.breaker.record_failure()
+            raise HCXUnavailableError(f"지연 예산 {budget}초 초과") from e
+        except HCXRetryableError as e:
+            self.breaker.record_failure()
+            raise HCXUnavailableError(str(e)) from e
+        except HTTPException:
+            # 요청 자체의 오류 (HCX는 정상 응답)
+            self.breaker.record_success()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.abandon()
+            raise
+
+        self.breaker.record_success()
+        if cache_key is not None and prompt_key is not None:
+            await CompletionCache().put(
+                cache_key,
+                prompt_key,
+                content,
+                CompletionCache.ttl_for(prompt_key),
+            )
+        return content
+
+    async def _send_with_retry(
+        self,
+        payload: Dict[str, Any],
+        prompt_key: Optional[str] = None,
+        hedge: bool = False,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> str:
+        """재시도할 수 있는 오류는 HCX_MAX_RETRIES번까지 다시 호출합니다."""
+        for attempt in range(hcx_config.HCX_MAX_RETRIES + 1):
+            try:
+                if hedge:
+                    return await self._send_hedged(payload, prompt_key, lane)
+                return await self._send(payload, prompt_key, lane)
+            except HCXRetryableError as e:
+                if attempt == hcx_config.HCX_MAX_RETRIES:
+                    raise
+                self._stats["retries"] += 1
+                logger.warning(f"HCX API 재시도 ({attempt + 1}회): {e}")
+                await asyncio.sleep(backoff_delay(attempt))
+        # 마지막 시도의 오류는 위에서 다시 발생하므로 도달하지 않음
+        raise HCXRetryableError("재시도 횟수 초과")
+
+    async def _send_hedged(
+        self,
+        payload: Dict[str, Any],
+        prompt_key: Optional[str] = None,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> str:
+        """응답이 헤지 지연 시간보다 늦으면 같은 요청을 한 번 더 보내고,
+        먼저 성공한 응답을 사용한 뒤 나머지 요청은 취소합니다."""
+        policy = self.hedge_policy
+        policy.start()
+        primary = asyncio.ensure_future(self._send(payload, prompt_key, lane))
+        done, _ = await asyncio.wait({primary}, timeout=policy.delay())
+        if done or not policy.try_fire():
+            return await primary
+
+        hedged = asyncio.ensure_future(self._send(payload, prompt_key, lane))
+        pending = {primary, hedged}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            policy.record_won()
+                        return task.result()
+                if not pending:
+                    # 둘 다 실패하면 마지막 예외를 그대로 전달
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self,
+        payload: Dict[str, Any],
+        prompt_key: Optional[str] = None,
+        lane: Lane = Lane.INTERACTIVE,
+    ) -> str:
+        """lane의 동시 호출 슬롯을 얻어 HCX API를 호출합니다."""
+        started = time.perf_counter()
+        await self.scheduler.acquire(lane)
+        try:
+            content = await self._post(payload, prompt_key)
+        finally:
+            self.scheduler.release(lane)
+        # 헤지 지연 시간은 대기 시간을 포함한 응답 시간 기준
+        self.hedge_policy.record_latency(time.perf_counter() - started)
+        return content
+
+    async def _post(
+        self, payload: Dict[str, Any], prompt_key: Optional[str] = None
+    ) -> str:
+        self._stats["requests"] += 1
+        self._stats["in_flight"] += 1
+        started = time.perf_counter()
+        response = None
+        status = "cancelled"
+        try:
+            response = await self.client.post(self.url, json=payload)
+            status = str(response.status_code)
+            self._check_status(response)
+            result = response.json()
+        except httpx.TransportError as e:
+            self._stats["errors"] += 1
+            status = "transport_error"
+            raise HCXRetryableError(f"연결 오류: {type(e).__name__}") from e
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stats["in_flight"] -= 1
+            self._stats["total_seconds"] += elapsed
+            self._record_call(prompt_key, elapsed, status, response)
+
+        if result["status"]["code"] != "20000":
+            self._stats["errors"] += 1
+            self._raise_error(result)
+
+        HCXMetrics().record_usage(prompt_key, result["result"])
+        content: str = result["result"]["message"]["content"]
+        return content
+
+    @staticmethod
+    def _record_call(
+        prompt_key: Optional[str],
+        elapsed: float,
+        status: str,
+        response: Optional[httpx.Response],
+    ) -> None:
+        request_bytes = response_bytes = 0
+        if response is not None:
+            request_bytes = len(response.request.content)
+            try:
+                response_bytes = len(response.content)
+            except httpx.ResponseNotRead:
+                # 스트리밍 응답은 본문을 보관하지 않음
+                response_bytes = response.num_bytes_downloaded
+        HCXMetrics().record_call(
+            prompt_key,
+            elapsed,
+            status,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+        )
+
+    @staticmethod
+    def _check_status(response: httpx.Response) -> None:
+        """재시도할 수 있는 HTTP 상태면 HCXRetryableError"""
+        if response.status_code == 429 or response.status_code >= 500:
+            raise HCXRetryableError(f"HTTP {response.status_code}")
+
+    @staticmethod
+    def _raise_error(result: Dict[str, Any]) -> None:
+        message = result.get("status", {}).get("message")
+        logger.error(f"HCX API 호출 실패: {message}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"HCX API 호출 실패: {message}",
+        )
+
+
+async def _iter_sse_events(
+    response: httpx.Response,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """SSE 응답을 (event, data) 단위로 읽습니다."""
+    event = "message"
+    data_lines: List[str] = []
+    async for line in response.aiter_lines():
+        if line == "":
+            if data_lines:
+                yield event, _load_sse_data(data_lines)
+            event = "message"
+            data_lines = []
+        elif line.startswith(":"):
+            continue
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data_lines.append(value)
+
+    if data_lines:
+        yield event, _load_sse_data(data_lines)
+
 
-            return result["result"]["message"]["content"]
+def _load_sse_data(data_lines: List[str]) -> Dict[str, Any]:
+    data = "\n".join(data_lines)
+    try:
+        loaded: Dict[str, Any] = json.loads(data)
+        return loaded
+    except ValueError:
+        # JSON이 아닌 신호 (예: [DONE])
+        return {"data": data}
@@ -1,40 +1,145 @@
 import json
 import re
+from typing import Any, List, Optional, Tuple
 
 from src.common.logger import logger
+from src.hcx_client.metrics import HCXMetrics
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# 구조 문자 ({, }, [, ], ")만 C 수준에서 건너뛰며 찾음
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+# 문자열 리터럴 전체 (이스케이프 포함)
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# 문자열 밖의 닫는 괄호 앞 쉼표 (문자열은 그대로 둠)
+_TRAILING_COMMA = re.compile(
+    r'("[^"\\]*(?:\\.[^"\\]*)*")|,\s*([}\]])', re.DOTALL
+)
+
+# 처음 '{'부터 시도할 후보 객체 수 (앞쪽 문장에 '{'가 있는 경우 대비)
+MAX_CANDIDATES = 4
 
 
 class Parser:
     @staticmethod
-    def parse_json(content: str):
-        try:
-            # 마크다운 JSON 블록에서 JSON 추출
-            json_match = re.search(r"```json\s*(\{.*?\})\s*```", content, re.DOTALL)
-            if json_match:
-                try:
-                    json_str = json_match.group(1)
-                    json_data = json.loads(json_str)
-                    return json_data
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"JSON 파싱 오류: {e}")
-                except Exception as e:
-                    raise ValueError(f"모델 검증 오류: {e}")
-
-            # 일반 코드 블록에서 JSON 추출 (```json이 아닌 경우)
-            code_match = re.search(r"```\s*(\{.*?\})\s*```", content, re.DOTALL)
-            if code_match:
-                try:
-                    json_str = code_match.group(1)
-                    json_data = json.loads(json_str)
-                    return json_data
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"JSON 파싱 오류: {e}")
-                except Exception as e:
-                    raise ValueError(f"모델 검증 오류: {e}")
-
-            return json.loads(content)
+    def parse_json(content: str, prompt_key: Optional[str] = None):
+        """HCX 응답에서 JSON 추출 (실패하면 prompt_key별 파싱 실패 수 기록)
 
+        응답의 첫 번째 JSON 객체를 정규식 역추적 없이 찾아 디코딩하므로
+        마크다운 코드 블록이나 앞뒤 문장은 자연히 무시됩니다.
+        디코딩에 실패하면 끝의 쉼표 제거로 복구를 시도하고, 사용한 경로(direct,
+        extracted, trailing_comma)를 기록합니다. 잘린 응답은 필수 항목이 빠진
+        결과가 저장되지 않도록 복구하지 않고 실패로 처리합니다.
+        """
+        try:
+            data, path = Parser._extract(content)
         except Exception as e:
             logger.info(f"[Parser] JSON 파싱 실패: {str(e)}")
+            HCXMetrics().record_parse_failure(prompt_key)
             raise ValueError(f"마크다운 파싱 오류: {e}")
 
+        HCXMetrics().record_parse_path(prompt_key, path)
+        return data
+
+    @staticmethod
+    def _extract(content: str) -> Tuple[Any, str]:
+        """(JSON 데이터, 복구 경로)"""
+        start = content.find("{")
+        if start < 0:
+            # 객체가 없으면 전체를 JSON으로 해석 (기존 동작)
+            return _loads(content), "direct"
+
+        # 빠른 경로: 첫 '{'부터 마지막 '}'까지가 그대로 JSON이면
+        # 그것이 곧 첫 번째 균형 잡힌 객체
+        end = content.rfind("}")
+        if end > start:
+            try:
+                data = _loads(content[start : end + 1])
+            except ValueError:
+                pass
+            else:
+                whole = not content[:start].strip() and (
+                    not content[end + 1 :].strip()
+                )
+                return data, "direct" if whole else "extracted"
+
+        # 느린 경로: 괄호 짝을 맞춰 객체를 찾고 필요하면 복구
+        error: Optional[Exception] = None
+        for _ in range(MAX_CANDIDATES):
+            text, truncated = _scan_object(content, start)
+            if truncated:
+                # 이후 '{'도 같은 잘린 객체 안에 있으므로 더 찾지 않음
+                raise ValueError("응답이 잘려 JSON 객체가 닫히지 않았습니다.")
+            if text is not None:
+                try:
+                    data, repaired = _decode(text)
+                except ValueError as e:
+                    error = error or e
+                else:
+                    if repaired:
+                        return data, "trailing_comma"
+                    whole = not content[:start].strip() and (
+                        not content[start + len(text) :].strip()
+                    )
+                    return data, "direct" if whole else "extracted"
+
+            start = content.find("{", start + 1)
+            if start < 0:
+                break
+
+        raise error or ValueError("JSON 객체를 찾을 수 없습니다.")
+
+
+def _scan_object(content: str, start: int) -> Tuple[Optional[str], bool]:
+    """start의 '{'부터 균형 잡힌 객체를 찾습니다.
+
+    반환값은 (객체 문자열, 응답이 객체 중간에서 잘렸는지)이며,
+    괄호 짝이 맞지 않으면 객체 문자열이 None입니다.
+    """
+    closers: List[str] = []
+    pos = start
+    while True:
+        match = _STRUCTURAL.search(content, pos)
+        if match is None:
+            return None, True
+
+        char = match.group()
+        index = match.start()
+        if char == '"':
+            string = _STRING.match(content, index)
+            if string is None:
+                return None, True
+            pos = string.end()
+            continue
+
+        if char == "{":
+            closers.append("}")
+        elif char == "[":
+            closers.append("]")
+        else:
+            if not closers or closers.pop() != char:
+                return None, False
+            if not closers:
+                return content[start : index + 1], False
+        pos = index + 1
+
+
+def _decode(text: str) -> Tuple[Any, bool]:
+    """객체 문자열을 디코딩하고, 실패하면 끝의 쉼표를 제거하여 다시 시도합니다.
+
+    반환값은 (JSON 데이터, 쉼표를 제거했는지)입니다.
+    """
+    try:
+        return _loads(text), False
+    except ValueError:
+        pass
+
+    repaired = _TRAILING_COMMA.sub(lambda m: m.group(1) or m.group(2), text)
+    if repaired == text:
+        raise ValueError("JSON 객체를 디코딩할 수 없습니다.")
+    return _loads(repaired), True
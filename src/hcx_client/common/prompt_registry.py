@@ -0,0 +1,270 @@
+"""HCX 프롬프트 레지스트리
+
+prompts 디렉토리의 YAML 파일을 한 번만 파싱하여 메모리에 보관합니다.
+로드할 때 각 템플릿을 (문자열, placeholder) 조각으로 미리 분석해 두므로, 형식 오류나
+누락된 placeholder를 요청 시점이 아니라 로드 시점에 발견하고, 요청마다 템플릿을
+다시 해석하지 않고 조각을 이어 붙여 렌더링합니다.
+
+파일이 수정되면(mtime 변경) 새 버전을 모두 검증한 뒤 한 번에 교체하며,
+검증에 실패하면 기존 버전을 계속 사용합니다. mtime 확인은
+RELOAD_CHECK_INTERVAL 초에 한 번만 하므로 조회는 딕셔너리 조회 비용입니다.
+"""
+
+import string
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+import yaml
+
+from src.common.logger import logger
+
+PROMPTS_DIR = Path(__file__).parents[1] / "prompts"
+
+# mtime 확인 주기 (초)
+RELOAD_CHECK_INTERVAL = 5.0
+
+# (파일, 프롬프트 키) -> 템플릿별 필수 placeholder
+# 호출하는 쪽에서 format()에 넘기는 값과 일치해야 합니다.
+_PILLAR_FIELDS = frozenset(
+    {
+        "year_pillar",
+        "month_pillar",
+        "day_pillar",
+        "time_pillar",
+        "strong_element",
+    }
+)
+REQUIRED_FIELDS: Dict[Tuple[str, str], Dict[str, FrozenSet[str]]] = {
+    ("fortune.yaml", "four_pillar"): {
+        "system_prompt": frozenset(),
+        "user_prompt": _PILLAR_FIELDS,
+    },
+    ("fortune.yaml", "lotto"): {
+        "system_prompt": frozenset({"frequent_nums", "excluded_nums"}),
+        "user_prompt": _PILLAR_FIELDS | {"weak_element"},
+    },
+    ("fortune.yaml", "daily_fortune"): {
+        "system_prompt": frozenset(),
+        "user_prompt": _PILLAR_FIELDS | {"weak_element"},
+    },
+}
+
+_formatter = string.Formatter()
+
+
+# (앞 문자열, placeholder 이름, 형식 지정자, 변환 문자)
+_Segment = Tuple[str, Optional[str], str, Optional[str]]
+
+
+class PromptTemplateError(ValueError):
+    """프롬프트 파일 형식 오류"""
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """system/user 프롬프트 한 쌍과 각 템플릿의 placeholder"""
+
+    system_prompt: str
+    user_prompt: str
+    system_fields: FrozenSet[str]
+    user_fields: FrozenSet[str]
+    system_segments: Tuple[_Segment, ...] = ()
+    user_segments: Tuple[_Segment, ...] = ()
+
+    def render(self, **kwargs: Any) -> Tuple[str, str]:
+        """placeholder를 채운 (system, user) 프롬프트 (str.format과 같은 결과)"""
+        return (
+            _render_segments(self.system_segments, kwargs),
+            _render_segments(self.user_segments, kwargs),
+        )
+
+
+def _render_segments(
+    segments: Tuple[_Segment, ...], values: Dict[str, Any]
+) -> str:
+    parts = []
+    for literal, field_name, format_spec, conversion in segments:
+        parts.append(literal)
+        if field_name is not None:
+            value = values[field_name]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+    return "".join(parts)
+
+
+def _parse_segments(template: str, where: str) -> Tuple[_Segment, ...]:
+    """템플릿을 렌더링 조각으로 분석합니다 (형식 오류면 PromptTemplateError)."""
+    try:
+        segments = tuple(
+            (literal, field_name, format_spec or "", conversion)
+            for literal, field_name, format_spec, conversion in (
+                _formatter.parse(template)
+            )
+        )
+    except ValueError as e:
+        raise PromptTemplateError(f"{where}: 템플릿 형식 오류 ({e})") from e
+
+    for _, field_name, format_spec, _ in segments:
+        if field_name is None:
+            continue
+        if not field_name.isidentifier():
+            raise PromptTemplateError(
+                f"{where}: 이름 없는 placeholder는 사용할 수 없습니다 "
+                f"('{{{field_name}}}')"
+            )
+        if "{" in format_spec:
+            raise PromptTemplateError(
+                f"{where}: 중첩 placeholder는 사용할 수 없습니다 "
+                f"('{{{field_name}:{format_spec}}}')"
+            )
+    return segments
+
+
+def _fields(segments: Tuple[_Segment, ...]) -> FrozenSet[str]:
+    return frozenset(
+        field_name for _, field_name, _, _ in segments if field_name is not None
+    )
+
+
+def compile_prompt_file(path: Path) -> Dict[str, PromptTemplate]:
+    """YAML 프롬프트 파일을 파싱하고 검증합니다."""
+    with open(path, "r", encoding="utf-8") as file:
+        prompts = yaml.safe_load(file) or {}
+    if not isinstance(prompts, dict):
+        raise PromptTemplateError(f"{path.name}: 최상위는 매핑이어야 합니다")
+
+    compiled = {}
+    for prompt_key, section in prompts.items():
+        where = f"{path.name}:{prompt_key}"
+        if not isinstance(section, dict):
+            raise PromptTemplateError(f"{where}: 매핑이어야 합니다")
+
+        system_prompt = section.get("system_prompt", "") or ""
+        user_prompt = section.get("user_prompt", "") or ""
+        system_segments = _parse_segments(
+            system_prompt, f"{where}.system_prompt"
+        )
+        user_segments = _parse_segments(user_prompt, f"{where}.user_prompt")
+        template = PromptTemplate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            system_fields=_fields(system_segments),
+            user_fields=_fields(user_segments),
+            system_segments=system_segments,
+            user_segments=user_segments,
+        )
+
+        required = REQUIRED_FIELDS.get((path.name, prompt_key))
+        if required is not None:
+            for name, fields in (
+                ("system_prompt", template.system_fields),
+                ("user_prompt", template.user_fields),
+            ):
+                missing = required[name] - fields
+                unknown = fields - required[name]
+                if missing or unknown:
+                    raise PromptTemplateError(
+                        f"{where}.{name}: placeholder 불일치 "
+                        f"(누락: {sorted(missing)}, 알 수 없음: {sorted(unknown)})"
+                    )
+        compiled[prompt_key] = template
+
+    for filename, prompt_key in REQUIRED_FIELDS:
+        if filename == path.name and prompt_key not in compiled:
+            raise PromptTemplateError(
+                f"{path.name}: '{prompt_key}' 프롬프트가 없습니다"
+            )
+    return compiled
+
+
+class PromptRegistry:
+    """프롬프트 레지스트리 (싱글톤)"""
+
+    _instance: Optional["PromptRegistry"] = None
+
+    prompts_dir: Path
+    # 파일명 -> (mtime_ns, 프롬프트 키 -> 템플릿)
+    _files: Dict[str, Tuple[int, Dict[str, PromptTemplate]]]
+    _next_check: float
+    # 검증에 실패한 파일의 mtime (같은 버전을 반복해서 로드하지 않음)
+    _failed: Dict[str, Optional[int]]
+    reloads: int
+    reload_failures: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "PromptRegistry":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.prompts_dir = PROMPTS_DIR
+            cls._instance._files = {}
+            cls._instance._next_check = 0.0
+            cls._instance._failed = {}
+            cls._instance.reloads = 0
+            cls._instance.reload_failures = 0
+            cls._instance.load_all()
+        return cls._instance
+
+    def load_all(self) -> None:
+        """모든 프롬프트 파일을 로드합니다. 형식 오류는 예외로 알립니다."""
+        files = {}
+        for path in sorted(self.prompts_dir.glob("*.yaml")):
+            files[path.name] = (
+                path.stat().st_mtime_ns,
+                compile_prompt_file(path),
+            )
+        self._files = files
+        self._next_check = time.monotonic() + RELOAD_CHECK_INTERVAL
+
+    def check_reload(self) -> None:
+        """수정된 파일을 다시 로드합니다. 실패하면 기존 버전을 유지합니다."""
+        files = self._files
+        updated = None
+        for filename, (mtime_ns, _) in files.items():
+            path = self.prompts_dir / filename
+            current = None
+            try:
+                current = path.stat().st_mtime_ns
+                if current == mtime_ns or current == self._failed.get(filename):
+                    continue
+                templates = compile_prompt_file(path)
+            except (OSError, yaml.YAMLError, PromptTemplateError) as e:
+                self._failed[filename] = current
+                self.reload_failures += 1
+                logger.error(f"프롬프트 파일 재로드 실패, 기존 버전 유지: {e}")
+                continue
+
+            if updated is None:
+                updated = dict(files)
+            updated[filename] = (current, templates)
+            self.reloads += 1
+            logger.info(f"프롬프트 파일 재로드: {filename}")
+
+        if updated is not None:
+            self._files = updated
+
+    def get(
+        self, yaml_filename: str, prompt_key: str
+    ) -> Optional[PromptTemplate]:
+        """프롬프트 템플릿 조회 (없으면 None)"""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + RELOAD_CHECK_INTERVAL
+            self.check_reload()
+
+        entry = self._files.get(yaml_filename)
+        if entry is None:
+            return None
+        return entry[1].get(prompt_key)
+
+    def render(
+        self, yaml_filename: str, prompt_key: str, **kwargs: Any
+    ) -> Tuple[str, str]:
+        """placeholder를 채운 (system, user) 프롬프트 (템플릿이 없으면 PromptTemplateError)"""
+        template = self.get(yaml_filename, prompt_key)
+        if template is None:
+            raise PromptTemplateError(
+                f"{yaml_filename}: '{prompt_key}' 프롬프트가 없습니다"
+            )
+        return template.render(**kwargs)
@@ -0,0 +1,220 @@
+"""HCX 응답 캐시
+
+(프롬프트 키, 렌더링된 프롬프트와 설정의 해시)를 키로 HCX 응답을 보관합니다.
+프롬프트 키별 TTL이 지나면 만료되고, 최대 개수를 넘으면 가장 오래 사용하지 않은
+항목부터 제거합니다(LRU).
+
+조회는 메모리에서만 하며, 저장한 항목은 SQLite 파일에도 기록하여 재시작 후
+open()에서 만료되지 않은 항목을 다시 불러옵니다. 파일 I/O는 스레드에서 처리하여
+이벤트 루프를 막지 않습니다.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.common.logger import logger
+from src.config.config import hcx_config
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+# 프롬프트 키별 TTL (초). 없는 키는 HCX_CACHE_DEFAULT_TTL을 사용합니다.
+PROMPT_CACHE_TTLS: Dict[str, float] = {
+    "four_pillar": 30 * 24 * 3600,
+    "lotto": 6 * 3600,
+    "daily_fortune": 24 * 3600,
+}
+
+# 이 횟수만큼 저장할 때마다 파일의 만료/초과 항목 정리
+PRUNE_EVERY = 256
+
+
+class _SqliteStore:
+    """캐시 항목을 기록하는 SQLite 파일"""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY,"
+                " prompt_key TEXT NOT NULL,"
+                " content TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+
+    def load(self, now: float, limit: int) -> List[Tuple[str, str, str, float]]:
+        """만료되지 않은 항목 (오래된 것부터)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, prompt_key, content, expires_at FROM completions"
+                " WHERE expires_at > ? ORDER BY rowid DESC LIMIT ?",
+                (now, limit),
+            ).fetchall()[::-1]
+
+    def put(
+        self, key: str, prompt_key: str, content: str, expires_at: float
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?)",
+                (key, prompt_key, content, expires_at),
+            )
+
+    def prune(self, now: float, limit: int) -> None:
+        """만료된 항목과 최근 limit개를 넘는 항목 삭제"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM completions WHERE expires_at <= ?", (now,)
+            )
+            self._conn.execute(
+                "DELETE FROM completions WHERE rowid NOT IN"
+                " (SELECT rowid FROM completions ORDER BY rowid DESC LIMIT ?)",
+                (limit,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM completions")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CompletionCache:
+    """HCX 응답 캐시 (싱글톤)"""
+
+    _instance: Optional["CompletionCache"] = None
+
+    max_size: int
+    # 캐시 키 -> (프롬프트 키, 응답, 만료 시각)
+    _entries: "OrderedDict[str, Tuple[str, str, float]]"
+    _store: Optional[_SqliteStore]
+    _opened: bool
+    _puts: int
+    # 프롬프트 키 -> {"hits": int, "misses": int}
+    _counters: Dict[str, Dict[str, int]]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "CompletionCache":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.max_size = hcx_config.HCX_CACHE_MAX_ENTRIES
+            cls._instance._entries = OrderedDict()
+            cls._instance._store = None
+            cls._instance._opened = False
+            cls._instance._puts = 0
+            cls._instance._counters = {}
+        return cls._instance
+
+    @staticmethod
+    def ttl_for(prompt_key: str) -> float:
+        return PROMPT_CACHE_TTLS.get(
+            prompt_key, hcx_config.HCX_CACHE_DEFAULT_TTL
+        )
+
+    def open(self) -> None:
+        """SQLite 파일을 열고 만료되지 않은 항목을 불러옵니다."""
+        if self._opened or not hcx_config.HCX_CACHE_PATH:
+            return
+        self._opened = True
+
+        path = Path(hcx_config.HCX_CACHE_PATH)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        try:
+            store = _SqliteStore(path)
+            rows = store.load(time.time(), self.max_size)
+        except sqlite3.Error as e:
+            logger.warning(
+                f"HCX 응답 캐시 파일을 열 수 없어 메모리만 사용합니다: {e}"
+            )
+            return
+
+        self._store = store
+        for key, prompt_key, content, expires_at in rows:
+            self._entries[key] = (prompt_key, content, expires_at)
+        logger.info(f"HCX 응답 캐시 {len(rows)}개 로드: {path}")
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        self._opened = False
+
+    def get(self, key: str, prompt_key: str) -> Optional[str]:
+        """캐시된 응답 조회 (없거나 만료되었으면 None)"""
+        counter = self._counters.setdefault(
+            prompt_key, {"hits": 0, "misses": 0}
+        )
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] > time.time():
+            self._entries.move_to_end(key)
+            counter["hits"] += 1
+            return entry[1]
+
+        if entry is not None:
+            del self._entries[key]
+        counter["misses"] += 1
+        return None
+
+    async def put(
+        self, key: str, prompt_key: str, content: str, ttl: float
+    ) -> None:
+        """응답을 저장합니다."""
+        expires_at = time.time() + ttl
+        self._entries[key] = (prompt_key, content, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        if self._store is None:
+            return
+        self._puts += 1
+        try:
+            await asyncio.to_thread(
+                self._store.put, key, prompt_key, content, expires_at
+            )
+            if self._puts % PRUNE_EVERY == 0:
+                await asyncio.to_thread(
+                    self._store.prune, time.time(), self.max_size
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"HCX 응답 캐시 기록 실패: {e}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._counters.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """프롬프트 키별 적중률"""
+        prompts: Dict[str, Dict[str, Any]] = {}
+        total: Tuple[int, int] = (0, 0)
+        for prompt_key, counter in self._counters.items():
+            hits, misses = counter["hits"], counter["misses"]
+            prompts[prompt_key] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            }
+            total = (total[0] + hits, total[1] + misses)
+
+        hits, misses = total
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "persistent": self._store is not None,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "prompts": prompts,
+        }
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class Lane(str, Enum):
+    """HCX 호출 우선순위 레인 (앞에 있을수록 먼저 처리)"""
+
+    INTERACTIVE = "interactive"  # 사용자 요청 처리 중인 호출
+    BACKGROUND = "background"  # 스케줄러 작업 등 사용자가 기다리지 않는 호출
+    BULK = "bulk"  # 사전 생성 스크립트 등 대량 호출
@@ -0,0 +1,74 @@
+"""HCX 헤지 요청 정책
+
+응답이 최근 지연 시간의 p90(HCX_HEDGE_PERCENTILE)보다 늦어지면 같은 요청을
+한 번 더 보내고 먼저 도착한 응답을 사용합니다(hedged request).
+
+헤지 요청은 HCX 호출량을 늘리므로 비율을 제한합니다. 헤지를 사용할 수 있는
+호출마다 HCX_HEDGE_MAX_RATE만큼 토큰이 쌓이고, 헤지 요청 한 번에 토큰 1개를
+사용합니다. 따라서 장기적으로 헤지 비율은 HCX_HEDGE_MAX_RATE를 넘지 않습니다.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict
+
+from src.config.config import hcx_config
+
+# p90 계산에 필요한 최소 표본 수 (부족하면 HCX_HEDGE_DELAY 사용)
+MIN_SAMPLES = 20
+# 누적할 수 있는 최대 토큰 (순간적으로 몰리는 헤지 수 상한)
+MAX_TOKENS = 10.0
+
+
+class HedgePolicy:
+    """헤지 지연 시간과 헤지 비율 예산"""
+
+    def __init__(self) -> None:
+        self._latencies: Deque[float] = deque(
+            maxlen=hcx_config.HCX_HEDGE_WINDOW
+        )
+        self._tokens = MAX_TOKENS
+        self._stats: Dict[str, int] = {
+            "eligible": 0,
+            "fired": 0,
+            "won": 0,
+            "throttled": 0,
+        }
+
+    def record_latency(self, seconds: float) -> None:
+        """성공한 HCX 호출의 지연 시간"""
+        self._latencies.append(seconds)
+
+    def delay(self) -> float:
+        """헤지 요청을 보내기 전 대기 시간 (최근 지연 시간의 백분위수)"""
+        if len(self._latencies) < MIN_SAMPLES:
+            return hcx_config.HCX_HEDGE_DELAY
+        ordered = sorted(self._latencies)
+        index = int(len(ordered) * hcx_config.HCX_HEDGE_PERCENTILE / 100)
+        return ordered[min(index, len(ordered) - 1)]
+
+    def start(self) -> None:
+        """헤지를 사용할 수 있는 호출 시작 (예산 적립)"""
+        self._stats["eligible"] += 1
+        self._tokens = min(
+            MAX_TOKENS, self._tokens + hcx_config.HCX_HEDGE_MAX_RATE
+        )
+
+    def try_fire(self) -> bool:
+        """예산이 남아 있으면 헤지 요청 한 번을 허용합니다."""
+        if self._tokens < 1.0:
+            self._stats["throttled"] += 1
+            return False
+        self._tokens -= 1.0
+        self._stats["fired"] += 1
+        return True
+
+    def record_won(self) -> None:
+        """헤지 요청의 응답이 먼저 도착함"""
+        self._stats["won"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "delay_seconds": self.delay(),
+            "tokens": round(self._tokens, 2),
+        }
@@ -0,0 +1,205 @@
+"""HCX 호출 우선순위 레인
+
+사용자 요청(interactive), 스케줄러 작업(background), 사전 생성 스크립트(bulk)가
+같은 동시 호출 수 제한(HCX_MAX_CONCURRENCY)을 공유합니다.
+
+- 우선순위: 슬롯이 비면 대기 중인 요청 중 우선순위가 가장 높은 레인부터 받으므로,
+  interactive 요청은 먼저 대기하던 background/bulk 요청을 앞지릅니다.
+- 예약 슬롯: background/bulk는 HCX_INTERACTIVE_RESERVED_SLOTS개를 남겨 두고만
+  사용하므로, 배치 호출이 몰려도 interactive 요청은 바로 시작할 수 있습니다.
+- 호출 수 제한: 레인별 토큰 버킷으로 초당 호출 수를 제한합니다 (슬롯 대기 전에 적용).
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List
+
+from src.hcx_client.entities.enums import Lane
+
+LANE_PRIORITIES: Dict[Lane, int] = {
+    Lane.INTERACTIVE: 0,
+    Lane.BACKGROUND: 1,
+    Lane.BULK: 2,
+}
+
+
+class _RateLimiter:
+    """토큰 버킷 (rate가 0 이하면 제한 없음)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def wait(self) -> float:
+        """토큰 하나를 얻을 때까지 기다리고 대기 시간(초)을 반환합니다."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        # 토큰을 먼저 예약하고(음수 허용) 채워질 때까지 대기
+        self.tokens -= 1.0
+        if self.tokens >= 0:
+            return 0.0
+        delay = -self.tokens / self.rate
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.tokens += 1.0
+            raise
+        return delay
+
+
+class LaneScheduler:
+    """레인별 우선순위 큐와 호출 수 제한을 가진 동시 호출 슬롯"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        reserved_slots: int,
+        rate_limits: Dict[Lane, float],
+    ):
+        self.max_concurrency = max_concurrency
+        # background/bulk가 함께 사용할 수 있는 최대 슬롯 수
+        self.batch_limit = max(1, max_concurrency - reserved_slots)
+        self._running = 0
+        self._batch_running = 0
+        # (우선순위, 순번, 레인, 슬롯을 넘겨받을 future)
+        self._waiters: List[tuple] = []
+        self._sequence = itertools.count()
+        self._limiters = {
+            lane: _RateLimiter(rate_limits.get(lane, 0.0)) for lane in Lane
+        }
+        self._stats = {
+            lane: {
+                "requests": 0,
+                "running": 0,
+                "queued": 0,
+                "max_queued": 0,
+                "wait_seconds": 0.0,
+                "max_wait_seconds": 0.0,
+                "rate_limited": 0,
+                "rate_wait_seconds": 0.0,
+            }
+            for lane in Lane
+        }
+
+    def _can_start(self, lane: Lane) -> bool:
+        if self._running >= self.max_concurrency:
+            return False
+        return (
+            lane == Lane.INTERACTIVE or self._batch_running < self.batch_limit
+        )
+
+    def _start(self, lane: Lane) -> None:
+        self._running += 1
+        if lane != Lane.INTERACTIVE:
+            self._batch_running += 1
+        self._stats[lane]["running"] += 1
+
+    def _has_waiters_ahead(self, lane: Lane) -> bool:
+        """같거나 높은 우선순위의 대기 요청이 있는지 (같은 레인 안에서는 먼저 온 순서)"""
+        while self._waiters and self._waiters[0][3].done():
+            heapq.heappop(self._waiters)
+        return bool(self._waiters) and (
+            self._waiters[0][0] <= LANE_PRIORITIES[lane]
+        )
+
+    def _dispatch(self) -> None:
+        """빈 슬롯을 우선순위가 가장 높은 대기 요청에 넘겨줍니다."""
+        while self._waiters:
+            _, _, lane, future = self._waiters[0]
+            if future.done():
+                # 대기 중 취소된 요청
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_start(lane):
+                break
+            heapq.heappop(self._waiters)
+            self._start(lane)
+            future.set_result(None)
+
+    async def acquire(self, lane: Lane = Lane.INTERACTIVE) -> None:
+        """lane의 호출 수 제한과 슬롯을 얻을 때까지 대기합니다."""
+        stats = self._stats[lane]
+        stats["requests"] += 1
+        queued_at = time.perf_counter()
+
+        rate_wait = await self._limiters[lane].wait()
+        if rate_wait:
+            stats["rate_limited"] += 1
+            stats["rate_wait_seconds"] += rate_wait
+
+        if not self._has_waiters_ahead(lane) and self._can_start(lane):
+            self._start(lane)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._waiters,
+                (LANE_PRIORITIES[lane], next(self._sequence), lane, future),
+            )
+            stats["queued"] += 1
+            stats["max_queued"] = max(stats["max_queued"], stats["queued"])
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # 슬롯을 넘겨받은 직후 취소됨
+                    self.release(lane)
+                raise
+            finally:
+                stats["queued"] -= 1
+
+        waited = time.perf_counter() - queued_at
+        stats["wait_seconds"] += waited
+        stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+
+    def release(self, lane: Lane = Lane.INTERACTIVE) -> None:
+        """acquire로 얻은 슬롯을 반납합니다."""
+        self._running -= 1
+        if lane != Lane.INTERACTIVE:
+            self._batch_running -= 1
+        self._stats[lane]["running"] -= 1
+        self._dispatch()
+
+    def stats(self) -> Dict[str, Any]:
+        lanes = {}
+        for lane, stats in self._stats.items():
+            lanes[lane.value] = {
+                **stats,
+                "average_wait_seconds": (
+                    stats["wait_seconds"] / stats["requests"]
+                    if stats["requests"]
+                    else 0.0
+                ),
+                "rate_limit": self._limiters[lane].rate,
+            }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "batch_limit": self.batch_limit,
+            "running": self._running,
+            "lanes": lanes,
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines: List[str] = []
+        for name, attribute, kind in (
+            ("hcx_lane_requests_total", "requests", "counter"),
+            ("hcx_lane_wait_seconds_total", "wait_seconds", "counter"),
+            ("hcx_lane_rate_limited_total", "rate_limited", "counter"),
+            ("hcx_lane_running", "running", "gauge"),
+            ("hcx_lane_queued", "queued", "gauge"),
+        ):
+            lines.append(f"# TYPE {name} {kind}")
+            for lane, stats in self._stats.items():
+                lines.append(
+                    f'{name}{{lane="{lane.value}"}} {stats[attribute]}'
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,195 @@
+"""HCX 호출 지표 (프롬프트 키별)
+
+HCX HTTP 호출마다 소요 시간, 요청/응답 크기, 토큰 사용량, 상태 코드를
+프롬프트 키(four_pillar, lotto, daily_fortune)별로 집계하고,
+Parser.parse_json의 파싱 실패 수와 복구 경로별 성공 수도 함께 기록합니다.
+
+워커 프로세스 단위로 메모리에 보관하며 snapshot()(JSON)과
+render_prometheus()(Prometheus 텍스트 형식)로 조회합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# 소요 시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+UNKNOWN_PROMPT_KEY = "unknown"
+
+
+class _PromptMetrics:
+    """프롬프트 키 하나의 지표"""
+
+    def __init__(self) -> None:
+        # 구간별 (누적이 아닌) 개수, 마지막 칸은 +Inf
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        # 상태 코드(또는 오류 종류) -> 개수
+        self.statuses: Dict[str, int] = {}
+        self.parse_failures = 0
+        # 파싱 경로(direct, extracted, trailing_comma) -> 개수
+        self.parse_paths: Dict[str, int] = {}
+
+    def observe(self, seconds: float) -> None:
+        index = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+        self.buckets[index] += 1
+        self.count += 1
+        self.seconds += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """히스토그램 구간 상한으로 근사한 분위수"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.count,
+            "average_seconds": self.seconds / self.count if self.count else 0.0,
+            "p50_seconds": self.quantile(0.5),
+            "p90_seconds": self.quantile(0.9),
+            "p99_seconds": self.quantile(0.99),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "statuses": dict(self.statuses),
+            "parse_failures": self.parse_failures,
+            "parse_paths": dict(self.parse_paths),
+        }
+
+
+class HCXMetrics:
+    """HCX 호출 지표 (싱글톤)"""
+
+    _instance: Optional["HCXMetrics"] = None
+
+    # 프롬프트 키 -> 지표
+    _prompts: Dict[str, _PromptMetrics]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "HCXMetrics":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance._prompts = {}
+        return cls._instance
+
+    def _get(self, prompt_key: Optional[str]) -> _PromptMetrics:
+        key = prompt_key or UNKNOWN_PROMPT_KEY
+        metrics = self._prompts.get(key)
+        if metrics is None:
+            metrics = self._prompts[key] = _PromptMetrics()
+        return metrics
+
+    def record_call(
+        self,
+        prompt_key: Optional[str],
+        seconds: float,
+        status: str,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """HCX HTTP 호출 한 건 (status는 HTTP 상태 코드 또는 오류 종류)"""
+        metrics = self._get(prompt_key)
+        metrics.observe(seconds)
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.request_bytes += request_bytes
+        metrics.response_bytes += response_bytes
+
+    def record_usage(
+        self, prompt_key: Optional[str], result: Dict[str, Any]
+    ) -> None:
+        """HCX 응답의 토큰 사용량 (응답에 있을 때만)"""
+        usage = result.get("usage") or {}
+        input_tokens = usage.get("promptTokens", result.get("inputLength"))
+        output_tokens = usage.get(
+            "completionTokens", result.get("outputLength")
+        )
+        metrics = self._get(prompt_key)
+        if isinstance(input_tokens, int):
+            metrics.input_tokens += input_tokens
+        if isinstance(output_tokens, int):
+            metrics.output_tokens += output_tokens
+
+    def record_parse_failure(self, prompt_key: Optional[str]) -> None:
+        self._get(prompt_key).parse_failures += 1
+
+    def record_parse_path(self, prompt_key: Optional[str], path: str) -> None:
+        """파싱 성공 한 건과 사용한 복구 경로"""
+        paths = self._get(prompt_key).parse_paths
+        paths[path] = paths.get(path, 0) + 1
+
+    def clear(self) -> None:
+        self._prompts.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """프롬프트 키별 지표"""
+        return {key: m.snapshot() for key, m in self._prompts.items()}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines: List[str] = [
+            "# TYPE hcx_request_duration_seconds histogram",
+        ]
+        for key, m in self._prompts.items():
+            label = f'prompt_key="{key}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, m.buckets):
+                cumulative += count
+                lines.append(
+                    f'hcx_request_duration_seconds_bucket{{{label},le="{bound}"}}'
+                    f" {cumulative}"
+                )
+            lines.append(
+                f'hcx_request_duration_seconds_bucket{{{label},le="+Inf"}}'
+                f" {m.count}"
+            )
+            lines.append(
+                f"hcx_request_duration_seconds_sum{{{label}}} {m.seconds}"
+            )
+            lines.append(
+                f"hcx_request_duration_seconds_count{{{label}}} {m.count}"
+            )
+
+        for name, attribute in (
+            ("hcx_request_bytes_total", "request_bytes"),
+            ("hcx_response_bytes_total", "response_bytes"),
+            ("hcx_input_tokens_total", "input_tokens"),
+            ("hcx_output_tokens_total", "output_tokens"),
+            ("hcx_parse_failures_total", "parse_failures"),
+        ):
+            lines.append(f"# TYPE {name} counter")
+            for key, m in self._prompts.items():
+                lines.append(
+                    f'{name}{{prompt_key="{key}"}} {getattr(m, attribute)}'
+                )
+
+        lines.append("# TYPE hcx_responses_total counter")
+        for key, m in self._prompts.items():
+            for status, count in m.statuses.items():
+                lines.append(
+                    f'hcx_responses_total{{prompt_key="{key}",status="{status}"}}'
+                    f" {count}"
+                )
+
+        lines.append("# TYPE hcx_parse_paths_total counter")
+        for key, m in self._prompts.items():
+            for path, count in m.parse_paths.items():
+                lines.append(
+                    f'hcx_parse_paths_total{{prompt_key="{key}",path="{path}"}}'
+                    f" {count}"
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,111 @@
+"""HCX 호출 장애 대응
+
+- 서킷 브레이커: 연속 실패가 임계값에 도달하면 일정 시간 호출을 차단하고
+  즉시 HCXUnavailableError를 발생시켜, 호출하는 쪽이 바로 fallback을 사용하게 합니다.
+  차단 시간이 지나면 한 건만 시험 호출(half-open)하여 성공하면 다시 엽니다.
+- 지연 예산: 프롬프트 키별로 재시도를 포함한 전체 호출 시간의 상한입니다.
+- 재시도: 연결 오류, 429, 5xx만 지수 백오프(full jitter)로 재시도합니다.
+"""
+
+import random
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from src.config.config import hcx_config
+
+# 프롬프트 키별 지연 예산 (초). 없는 키는 HCX_DEFAULT_LATENCY_BUDGET을 사용합니다.
+PROMPT_LATENCY_BUDGETS: Dict[str, float] = {
+    "four_pillar": 8.0,
+    "daily_fortune": 15.0,
+    "lotto": 20.0,
+}
+
+
+class HCXUnavailableError(HTTPException):
+    """HCX를 사용할 수 없음 (서킷 차단, 지연 예산 초과, 재시도 소진)"""
+
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"HCX API 사용 불가: {detail}",
+        )
+
+
+class HCXRetryableError(Exception):
+    """재시도할 수 있는 HCX 오류 (연결 오류, 429, 5xx)"""
+
+
+def latency_budget(prompt_key: Optional[str]) -> float:
+    if prompt_key is None:
+        return hcx_config.HCX_DEFAULT_LATENCY_BUDGET
+    return PROMPT_LATENCY_BUDGETS.get(
+        prompt_key, hcx_config.HCX_DEFAULT_LATENCY_BUDGET
+    )
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도 전 대기 시간 (full jitter)"""
+    return random.uniform(0, hcx_config.HCX_RETRY_BACKOFF * (2**attempt))
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._stats = {"opened": 0, "short_circuited": 0}
+
+    def allow(self) -> bool:
+        """호출해도 되는지 확인합니다. half-open에서는 한 건만 허용합니다."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self._stats["short_circuited"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probing = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self._stats["short_circuited"] += 1
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def abandon(self) -> None:
+        """결과 없이 끝난 호출 (취소 등). half-open 시험 호출을 다시 허용합니다."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if (
+            self.state == self.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self._stats["opened"] += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            **self._stats,
+        }
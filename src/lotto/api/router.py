@@ -1,12 +1,33 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 
 from src.common.dependencies import get_lotto_service
 from src.lotto.domain.entities.enums import SortType
-from src.lotto.api.schemas import LottoDrawList, LottoStatistic
+from src.lotto.api.schemas import (
+    LottoCooccurrence,
+    LottoDistributionAnalytics,
+    LottoDrawList,
+    LottoGapAnalytics,
+    LottoStatistic,
+)
 from src.lotto.application.service import LottoService
 
 lotto_router = APIRouter(prefix="/lotto", tags=["lotto"])
 
+# 통계/분석은 새 회차가 저장될 때만 바뀌므로 ETag로 재검증
+STATISTICS_CACHE_CONTROL = "no-cache"
+
+
+def _cached_json_response(
+    body: bytes, etag: str, if_none_match: str | None
+) -> Response:
+    """직렬화된 JSON 응답 (If-None-Match가 같으면 304)"""
+    headers = {"Cache-Control": STATISTICS_CACHE_CONTROL, "ETag": etag}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
+
 
 @lotto_router.get("/draws", response_model=LottoDrawList)
 async def get_lotto_draws(
@@ -35,9 +56,73 @@ async def get_lotto_statistics(
         description="정렬 기준: frequency(빈도순), number(번호순)",
     ),
     include_bonus: bool = Query(True, description="보너스 번호 포함 여부"),
+    window: int | None = Query(
+        None,
+        ge=1,
+        description="최근 N회차 (최신 회차 기준, from_round/to_round와 함께 사용 불가)",
+    ),
+    from_round: int | None = Query(
+        None, ge=1, description="구간 시작 회차 (포함)"
+    ),
+    to_round: int | None = Query(
+        None,
+        ge=1,
+        description="구간 끝 회차 (포함, 기본값/최댓값: 최신 회차)",
+    ),
+    if_none_match: str | None = Header(None),
+    lotto_service: LottoService = Depends(get_lotto_service),
+):
+    """로또 번호별 통계를 조회합니다.
+
+    window 또는 from_round/to_round를 지정하면 해당 회차 구간의 통계를 조회합니다.
+    window와 from_round/to_round를 함께 지정하면 400을 반환합니다.
+    """
+    body, etag = await lotto_service.get_lotto_statistics_json(
+        sort_type=sort_type,
+        include_bonus=include_bonus,
+        window=window,
+        from_round=from_round,
+        to_round=to_round,
+    )
+    return _cached_json_response(body, etag, if_none_match)
+
+
+@lotto_router.get("/analytics/co-occurrence", response_model=LottoCooccurrence)
+async def get_lotto_cooccurrence(
+    size: int = Query(2, ge=2, le=3, description="조합 번호 수 (2 또는 3)"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 조합 수"),
+    if_none_match: str | None = Header(None),
+    lotto_service: LottoService = Depends(get_lotto_service),
+):
+    """함께 가장 많이 나온 당첨 번호 조합을 조회합니다."""
+    body, etag = await lotto_service.get_lotto_cooccurrence_json(
+        size=size, limit=limit
+    )
+    return _cached_json_response(body, etag, if_none_match)
+
+
+@lotto_router.get("/analytics/gaps", response_model=LottoGapAnalytics)
+async def get_lotto_gap_analytics(
+    if_none_match: str | None = Header(None),
+    lotto_service: LottoService = Depends(get_lotto_service),
+):
+    """번호별 미출현 간격(현재, 최대, 평균)과 간격 분포를 조회합니다."""
+    body, etag = await lotto_service.get_lotto_gap_analytics_json()
+    return _cached_json_response(body, etag, if_none_match)
+
+
+@lotto_router.get(
+    "/analytics/distribution", response_model=LottoDistributionAnalytics
+)
+async def get_lotto_distribution(
+    sum_bin_width: int = Query(
+        10, ge=1, le=50, description="당첨 번호 합계 구간 너비"
+    ),
+    if_none_match: str | None = Header(None),
     lotto_service: LottoService = Depends(get_lotto_service),
 ):
-    """로또 번호별 통계를 조회합니다."""
-    return await lotto_service.get_lotto_statistics(
-        sort_type=sort_type, include_bonus=include_bonus
+    """당첨 번호의 홀짝, 합계, 연속 번호 분포를 조회합니다."""
+    body, etag = await lotto_service.get_lotto_distribution_json(
+        sum_bin_width=sum_bin_width
     )
+    return _cached_json_response(body, etag, if_none_match)
@@ -35,13 +35,21 @@ class LottoStatistic(CommonBase):
 class LottoRecommendationContent(BaseModel):
     reason: str = Field(
         description="사주 기반 로또 추천 이유",
-        examples=["화(火) 기운이 강하여, 역동적인 에너지를 가진 열정의 수를 추천해요."],
+        examples=[
+            "화(火) 기운이 강하여, 역동적인 에너지를 가진 열정의 수를 추천해요."
+        ],
     )
     num1: int = Field(
-        description="추천 번호 1 (기운과 잘 맞는 숫자)", ge=1, le=45, examples=[3]
+        description="추천 번호 1 (기운과 잘 맞는 숫자)",
+        ge=1,
+        le=45,
+        examples=[3],
     )
     num2: int = Field(
-        description="추천 번호 2 (기운과 잘 맞는 숫자)", ge=1, le=45, examples=[34]
+        description="추천 번호 2 (기운과 잘 맞는 숫자)",
+        ge=1,
+        le=45,
+        examples=[34],
     )
     num3: int = Field(
         description="추천 번호 3 (재물운 좋을 때 나오는 숫자)",
@@ -56,10 +64,16 @@ class LottoRecommendationContent(BaseModel):
         examples=[28],
     )
     num5: int = Field(
-        description="추천 번호 5 (최근 자주 나온 번호)", ge=1, le=45, examples=[15]
+        description="추천 번호 5 (최근 자주 나온 번호)",
+        ge=1,
+        le=45,
+        examples=[15],
     )
     num6: int = Field(
-        description="추천 번호 6 (최근 자주 나온 번호)", ge=1, le=45, examples=[45]
+        description="추천 번호 6 (최근 자주 나온 번호)",
+        ge=1,
+        le=45,
+        examples=[45],
     )
     cold_nums: List[int] = Field(
         description="기운과 상충하는 숫자 (1-3개)",
@@ -68,8 +82,12 @@ class LottoRecommendationContent(BaseModel):
     infrequent_nums: List[int] = Field(
         description="등장 빈도가 낮은 숫자 (1-3개)", examples=[[1, 2]]
     )
-    strong_element: FiveElements = Field(description="강한 기운", examples=["화(火)"])
-    weak_element: FiveElements = Field(description="상충되는 기운", examples=["목(木)"])
+    strong_element: FiveElements = Field(
+        description="강한 기운", examples=["화(火)"]
+    )
+    weak_element: FiveElements = Field(
+        description="상충되는 기운", examples=["목(木)"]
+    )
 
     @field_validator("strong_element", "weak_element", mode="before")
     @classmethod
@@ -119,3 +137,44 @@ class LottoResultCheckResponse(CommonBase):
     has_bonus: bool
     rank: Optional[int]  # 1~5, 낙첨이면 None
     prize_amount: Optional[int]  # 원 단위, 알 수 없으면 None
+
+
+class LottoNumberCombination(CommonBase):
+    nums: List[int]
+    count: int
+
+
+class LottoCooccurrence(CommonBase):
+    round: Optional[int] = None
+    draws: int
+    size: int
+    combinations: List[LottoNumberCombination]
+
+
+class LottoNumberGap(CommonBase):
+    num: int
+    current_gap: int  # 마지막 출현 이후 지난 회차 수
+    max_gap: int
+    average_gap: float
+
+
+class LottoGapAnalytics(CommonBase):
+    round: Optional[int] = None
+    draws: int
+    numbers: List[LottoNumberGap]
+    gap_counts: List[int]  # 인덱스: 다시 나오기까지 지난 회차 수
+
+
+class LottoSumBin(CommonBase):
+    start: int
+    end: int
+    count: int
+
+
+class LottoDistributionAnalytics(CommonBase):
+    round: Optional[int] = None
+    draws: int
+    odd_counts: List[int]  # 인덱스: 당첨 번호 6개 중 홀수 개수
+    sum_bins: List[LottoSumBin]
+    consecutive_rate: float  # 연속 번호가 포함된 회차 비율
+    consecutive_pair_counts: List[int]  # 인덱스: 연속 번호 쌍 개수
@@ -1,25 +1,43 @@
+import hashlib
 import traceback
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import httpx
+import numpy as np
 from fastapi import HTTPException
 
 from src.common.logger import logger
 from src.hcx_client.client import HCXClient
 from src.hcx_client.common.parser import Parser
-from src.hcx_client.common.utils import HCXUtils
+from src.hcx_client.common.prompt_registry import PromptRegistry
+from src.hcx_client.resilience import HCXUnavailableError
 from src.lotto.api.schemas import (
+    LottoCooccurrence,
+    LottoDistributionAnalytics,
     LottoDraw,
     LottoDrawList,
+    LottoGapAnalytics,
+    LottoNumberCombination,
+    LottoNumberGap,
     LottoRecommendation,
     LottoRecommendationContent,
     LottoResultCheckResponse,
     LottoStatistic,
+    LottoSumBin,
 )
 from src.lotto.domain.entities.enums import SortType
 from src.lotto.domain.interfaces import ILottoRepository
+from src.lotto.domain.services import analytics
+from src.lotto.domain.services.analytics import LottoDrawMatrix
+from src.lotto.infrastructure.analytics_cache import LottoAnalyticsCache
+from src.lotto.infrastructure.statistics_snapshot import (
+    EXCLUDED_NUMBERS_LIMIT,
+    FREQUENT_NUMBERS_LIMIT,
+    STATISTIC_LIST,
+    LottoStatisticsSnapshot,
+)
 from src.users.domain.interfaces import IUserRepository
 
 
@@ -110,8 +128,11 @@ class LottoService:
             # 5. 데이터베이스에 저장
             await self.lotto_repository.create_lotto_draw(lotto_data)
 
-            # 6. 통계 업데이트
-            await self.lotto_repository.update_lotto_statistics(lotto_data)
+            # 6. 통계 업데이트 (이미 반영된 회차는 건너뜀)
+            if not await self.lotto_repository.update_lotto_statistics(
+                lotto_data
+            ):
+                logger.info(f"회차 {next_round}: 이미 통계에 반영됨")
 
             logger.info(f"회차 {next_round}: 데이터 저장 완료")
             return True
@@ -150,10 +171,339 @@ class LottoService:
 
         return statistic_list
 
+    async def rebuild_lotto_statistics(self) -> int:
+        """lotto_draws로 로또 통계를 다시 만들고 반영한 회차 수를 반환합니다."""
+        rounds = await self.lotto_repository.rebuild_lotto_statistics()
+        LottoStatisticsSnapshot().invalidate()
+        return rounds
+
+    async def apply_lotto_statistics(
+        self, rounds: Optional[List[int]] = None
+    ) -> List[int]:
+        """회차(기본값: 통계에 반영되지 않은 회차)를 통계에 더하고 새로 반영한 회차를 반환합니다."""
+        if rounds is None:
+            rounds = await self.lotto_repository.get_unprocessed_rounds()
+
+        applied = []
+        for round in rounds:
+            draw = await self.lotto_repository.get_lotto_draw_by_round(round)
+            if draw is None:
+                logger.warning(f"회차 {round}: 추첨 데이터 없음")
+                continue
+            lotto_data = {
+                column: getattr(draw, column)
+                for column in (
+                    "round",
+                    "draw_date",
+                    "num1",
+                    "num2",
+                    "num3",
+                    "num4",
+                    "num5",
+                    "num6",
+                    "bonus_num",
+                )
+            }
+            if await self.lotto_repository.update_lotto_statistics(lotto_data):
+                applied.append(round)
+
+        if applied:
+            LottoStatisticsSnapshot().invalidate()
+        return applied
+
+    async def verify_lotto_statistics(self) -> Dict[str, Any]:
+        """저장된 로또 통계와 lotto_draws에서 다시 집계한 값의 차이를 조회합니다."""
+        truth = {
+            row["num"]: row
+            for row in await self.lotto_repository.get_lotto_statistics_truth()
+        }
+        stored = {
+            stat.num: stat
+            for stat in await self.lotto_repository.get_lotto_statistics(
+                sort_type=SortType.NUMBER
+            )
+        }
+
+        mismatches = []
+        for num in range(1, 46):
+            expected = truth.get(num, {})
+            stat = stored.get(num)
+            for field in (
+                "main_count",
+                "bonus_count",
+                "total_count",
+                "last_round",
+                "last_date",
+            ):
+                default = 0 if field.endswith("_count") else None
+                expected_value = expected.get(field, default)
+                # 한 번도 나오지 않은 번호는 행이 없어도 0회와 같음
+                stored_value = (
+                    getattr(stat, field) if stat is not None else default
+                )
+                if stored_value != expected_value:
+                    mismatches.append(
+                        {
+                            "num": num,
+                            "field": field,
+                            "stored": stored_value,
+                            "expected": expected_value,
+                        }
+                    )
+
+        return {
+            "mismatches": mismatches,
+            "unprocessed_rounds": (
+                await self.lotto_repository.get_unprocessed_rounds()
+            ),
+        }
+
+    async def get_lotto_statistics_json(
+        self,
+        sort_type: SortType = SortType.FREQUENCY,
+        include_bonus: bool = True,
+        window: Optional[int] = None,
+        from_round: Optional[int] = None,
+        to_round: Optional[int] = None,
+    ) -> Tuple[bytes, str]:
+        """직렬화된 통계 응답 (JSON, ETag)
+
+        회차 구간(window: 최근 N회차, from_round~to_round)이 없으면 회차별 스냅샷의
+        전체 통계를, 있으면 누적 출현 인덱스로 계산한 구간 통계를 반환합니다.
+        window는 from_round/to_round와 함께 쓸 수 없고, 최신 회차보다 큰 to_round는
+        최신 회차로 제한합니다.
+        """
+        if window is None and from_round is None and to_round is None:
+            snapshot = await self._get_statistics_snapshot()
+            return snapshot.get_json(sort_type, include_bonus)
+
+        if window is not None and (
+            from_round is not None or to_round is not None
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail="window는 from_round/to_round와 함께 사용할 수 없습니다.",
+            )
+
+        # 구간 통계는 DB 기준 최신 회차로 계산 (스냅샷/누적 출현 인덱스도 맞춰짐)
+        latest_round, _ = await self.lotto_repository.get_draws_version()
+        latest_round = latest_round or 0
+        if window is not None:
+            from_round, to_round = latest_round - window + 1, latest_round
+        else:
+            if to_round is None or to_round > latest_round:
+                to_round = latest_round
+            if from_round is None:
+                from_round = 1
+            elif from_round > latest_round:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"from_round는 최신 회차({latest_round})보다 클 수 없습니다.",
+                )
+        if from_round > to_round:
+            raise HTTPException(
+                status_code=400,
+                detail="from_round는 to_round보다 클 수 없습니다.",
+            )
+
+        (
+            main_counts,
+            bonus_counts,
+        ) = await self.lotto_repository.get_number_counts(from_round, to_round)
+        counts = main_counts + bonus_counts if include_bonus else main_counts
+        nums = np.arange(1, len(counts) + 1)
+        if sort_type == SortType.FREQUENCY:
+            order = np.lexsort((nums, -counts))
+        else:
+            order = np.argsort(nums)
+
+        body = STATISTIC_LIST.dump_json(
+            [
+                LottoStatistic(num=num, count=count)
+                for num, count in zip(
+                    nums[order].tolist(), counts[order].tolist()
+                )
+            ]
+        )
+        return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+    async def _get_statistics_snapshot(self) -> LottoStatisticsSnapshot:
+        """최신 회차/통계 버전 기준 통계 스냅샷 (바뀌었으면 다시 만듦)"""
+        snapshot = LottoStatisticsSnapshot()
+        latest_round = await self.lotto_repository.get_latest_round()
+        version = await self.lotto_repository.get_lotto_statistics_version()
+        if not snapshot.is_current(latest_round, version):
+            statistics = await self.lotto_repository.get_lotto_statistics(
+                sort_type=SortType.NUMBER
+            )
+            snapshot.rebuild(latest_round, version, statistics)
+        return snapshot
+
+    async def _get_analytics_cache(self) -> LottoAnalyticsCache:
+        """DB 기준 회차 버전의 분석 캐시 (버전이 바뀌었으면 다시 만듦)"""
+        cache = LottoAnalyticsCache()
+        version, numbers = await self.lotto_repository.get_draw_numbers()
+        if not cache.is_current(version):
+            cache.rebuild(version, numbers)
+        return cache
+
+    async def get_lotto_cooccurrence_json(
+        self, size: int = 2, limit: int = 20
+    ) -> Tuple[bytes, str]:
+        """함께 가장 많이 나온 번호 조합 응답 (JSON, ETag)"""
+        cache = await self._get_analytics_cache()
+
+        def build(matrix: LottoDrawMatrix) -> LottoCooccurrence:
+            return LottoCooccurrence(
+                round=cache.round,
+                draws=len(matrix.mains),
+                size=size,
+                combinations=[
+                    LottoNumberCombination(nums=list(nums), count=count)
+                    for nums, count in analytics.top_combinations(
+                        matrix, size, limit
+                    )
+                ],
+            )
+
+        return cache.get_json(("cooccurrence", size, limit), build)
+
+    async def get_lotto_gap_analytics_json(self) -> Tuple[bytes, str]:
+        """번호별 미출현 간격 응답 (JSON, ETag)"""
+        cache = await self._get_analytics_cache()
+
+        def build(matrix: LottoDrawMatrix) -> LottoGapAnalytics:
+            current, max_gaps, average, histogram = analytics.gap_statistics(
+                matrix
+            )
+            return LottoGapAnalytics(
+                round=cache.round,
+                draws=len(matrix.mains),
+                numbers=[
+                    LottoNumberGap(
+                        num=num,
+                        current_gap=current_gap,
+                        max_gap=max_gap,
+                        average_gap=round(average_gap, 2),
+                    )
+                    for num, current_gap, max_gap, average_gap in zip(
+                        range(1, analytics.MAX_NUMBER + 1),
+                        current.tolist(),
+                        max_gaps.tolist(),
+                        average.tolist(),
+                    )
+                ],
+                gap_counts=histogram.tolist(),
+            )
+
+        return cache.get_json(("gaps",), build)
+
+    async def get_lotto_distribution_json(
+        self, sum_bin_width: int = 10
+    ) -> Tuple[bytes, str]:
+        """홀짝, 합계, 연속 번호 분포 응답 (JSON, ETag)"""
+        cache = await self._get_analytics_cache()
+
+        def build(matrix: LottoDrawMatrix) -> LottoDistributionAnalytics:
+            consecutive = analytics.consecutive_statistics(matrix)
+            return LottoDistributionAnalytics(
+                round=cache.round,
+                draws=len(matrix.mains),
+                odd_counts=analytics.odd_even_histogram(matrix).tolist(),
+                sum_bins=[
+                    LottoSumBin(start=start, end=end, count=count)
+                    for start, end, count in analytics.sum_histogram(
+                        matrix, sum_bin_width
+                    )
+                ],
+                consecutive_rate=round(consecutive["rate"], 4),
+                consecutive_pair_counts=consecutive["histogram"],
+            )
+
+        return cache.get_json(("distribution", sum_bin_width), build)
+
     async def create_lotto_recommendation(
         self, user_id: str
     ) -> LottoRecommendation:
         """사용자별 로또 추천을 생성합니다."""
+        # 1~4. 사용자 사주와 통계 데이터로 프롬프트 구성
+        (
+            system_prompt,
+            user_prompt,
+            latest_round,
+            infrequent_nums,
+            lotto_prompt_data,
+        ) = await self._prepare_lotto_recommendation(user_id)
+
+        try:
+            response = await HCXClient().call_completion(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_key="lotto",
+            )
+        except HCXUnavailableError:
+            raise
+        except Exception as e:
+            logger.info(f"로또 추천 생성 실패: {traceback.format_exc()}")
+            raise HTTPException(
+                status_code=400, detail=f"로또 추천 생성 실패: {str(e)}"
+            )
+
+        # 5. 응답 파싱
+        content = self._parse_lotto_recommendation(
+            response, infrequent_nums, lotto_prompt_data
+        )
+
+        # 6. 데이터베이스에 저장
+        return await self._save_lotto_recommendation(
+            user_id, latest_round, content
+        )
+
+    async def stream_lotto_recommendation(
+        self, user_id: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """로또 추천을 생성하며 ("delta", 응답 조각)을 차례로 반환하고,
+        저장이 끝나면 ("result", LottoRecommendation)을 반환합니다.
+        """
+        (
+            system_prompt,
+            user_prompt,
+            latest_round,
+            infrequent_nums,
+            lotto_prompt_data,
+        ) = await self._prepare_lotto_recommendation(user_id)
+
+        chunks = []
+        try:
+            async for chunk in HCXClient().call_completion_stream(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                prompt_key="lotto",
+            ):
+                chunks.append(chunk)
+                yield "delta", chunk
+        except HCXUnavailableError:
+            raise
+        except Exception as e:
+            logger.info(f"로또 추천 생성 실패: {traceback.format_exc()}")
+            raise HTTPException(
+                status_code=400, detail=f"로또 추천 생성 실패: {str(e)}"
+            )
+
+        content = self._parse_lotto_recommendation(
+            "".join(chunks), infrequent_nums, lotto_prompt_data
+        )
+        yield (
+            "result",
+            await self._save_lotto_recommendation(
+                user_id, latest_round, content
+            ),
+        )
+
+    async def _prepare_lotto_recommendation(
+        self, user_id: str
+    ) -> Tuple[str, str, int, List[int], Dict[str, Any]]:
+        """(system 프롬프트, user 프롬프트, 최신 회차, 제외 번호, 사주 정보)"""
         # 1. 사용자 정보 조회 (사주 정보 포함)
         user = await self.user_repository.get_user_by_id(user_id)
         if not user:
@@ -168,18 +518,12 @@ class LottoService:
                 status_code=404, detail="로또 회차 정보를 찾을 수 없습니다."
             )
 
-        # 3. 통계 데이터 조회
-        frequent_nums = await self.lotto_repository.get_frequent_numbers(
-            limit=10
-        )
-        infrequent_nums = await self.lotto_repository.get_excluded_numbers(
-            limit=2
-        )
-
-        # 4. HCX API 호출하여 로또 추천 생성
-        hcx_client = HCXClient()
+        # 3. 통계 데이터 조회 (회차별 스냅샷)
+        snapshot = await self._get_statistics_snapshot()
+        frequent_nums = snapshot.frequent_numbers[:FREQUENT_NUMBERS_LIMIT]
+        infrequent_nums = snapshot.excluded_numbers[:EXCLUDED_NUMBERS_LIMIT]
 
-        # 사용자 사주 정보 사용
+        # 4. 사용자 사주 정보 사용
         four_pillar = user.four_pillar
         lotto_prompt_data = {
             "year_pillar": four_pillar.get("year_pillar"),
@@ -190,27 +534,35 @@ class LottoService:
             "weak_element": four_pillar.get("weak_element"),
         }
 
-        # HCXUtils를 사용하여 프롬프트 가져오기
-        system_prompt, user_prompt_template = HCXUtils.get_prompt_pair(
-            "fortune.yaml", "lotto"
-        )
-
         # 시스템 프롬프트에 통계 데이터 추가
-        system_prompt = system_prompt.format(
+        system_prompt, user_prompt = PromptRegistry().render(
+            "fortune.yaml",
+            "lotto",
             frequent_nums=",".join(map(str, frequent_nums)),
             excluded_nums=",".join(map(str, infrequent_nums)),
+            **lotto_prompt_data,
         )
-        user_prompt = user_prompt_template.format(**lotto_prompt_data)
 
-        try:
-            response = await hcx_client.call_completion(
-                system_prompt=system_prompt, user_prompt=user_prompt
-            )
+        return (
+            system_prompt,
+            user_prompt,
+            latest_round,
+            infrequent_nums,
+            lotto_prompt_data,
+        )
 
+    @staticmethod
+    def _parse_lotto_recommendation(
+        response: str,
+        infrequent_nums: List[int],
+        lotto_prompt_data: Dict[str, Any],
+    ) -> LottoRecommendationContent:
+        """HCX 응답을 로또 추천 내용으로 변환합니다."""
+        try:
             # JSON 응답 파싱
-            parsed_content = Parser.parse_json(response)
+            parsed_content = Parser.parse_json(response, prompt_key="lotto")
 
-            content = LottoRecommendationContent(
+            return LottoRecommendationContent(
                 reason=parsed_content["reason"],
                 num1=parsed_content["num1"],
                 num2=parsed_content["num2"],
@@ -230,7 +582,12 @@ class LottoService:
                 status_code=400, detail=f"로또 추천 생성 실패: {str(e)}"
             )
 
-        # 6. 데이터베이스에 저장
+    async def _save_lotto_recommendation(
+        self,
+        user_id: str,
+        latest_round: int,
+        content: LottoRecommendationContent,
+    ) -> LottoRecommendation:
         recommendation = (
             await self.lotto_repository.create_lotto_recommendation(
                 user_id=user_id,
@@ -30,6 +30,13 @@ class LottoStatistics(Base):
     )
 
 
+class LottoStatisticsRound(Base):
+    # lotto_statistics에 출현 횟수가 반영된 회차 (같은 회차를 두 번 더하지 않도록)
+    __tablename__ = "lotto_statistics_rounds"
+
+    round = Column(Integer, primary_key=True, autoincrement=False)
+
+
 class LottoDraws(Base):
     __tablename__ = "lotto_draws"
 
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Protocol
 
+import numpy as np
+
 from src.lotto.domain.entities.enums import SortType
 from src.lotto.domain.entities.models import (
     LottoDraws,
@@ -29,10 +31,30 @@ class ILottoRepository(Protocol):
         """로또 통계 데이터를 조회합니다."""
         ...
 
+    async def get_lotto_statistics_version(self) -> datetime | None:
+        """로또 통계의 버전(마지막 수정 시각)을 조회합니다."""
+        ...
+
     async def get_latest_round(self) -> int | None:
         """가장 최신 로또 회차를 조회합니다."""
         ...
 
+    async def get_draws_version(self) -> tuple[int | None, int]:
+        """DB 기준 회차 버전 (최신 회차, 회차 수)을 조회합니다."""
+        ...
+
+    async def get_draw_numbers(
+        self,
+    ) -> tuple[tuple[int | None, int], np.ndarray]:
+        """회차 버전과 전체 회차의 (회차 수 x 7) 번호 행렬을 조회합니다."""
+        ...
+
+    async def get_number_counts(
+        self, from_round: int, to_round: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """회차 구간의 번호별 (당첨 번호, 보너스 번호) 출현 횟수를 조회합니다."""
+        ...
+
     async def create_lotto_draw(self, lotto_data: dict) -> LottoDraws:
         """로또 추첨 데이터를 생성합니다."""
         ...
@@ -41,8 +63,20 @@ class ILottoRepository(Protocol):
         """특정 회차의 로또 추첨 데이터를 조회합니다."""
         ...
 
-    async def update_lotto_statistics(self, lotto_data: dict) -> None:
-        """로또 통계 데이터를 업데이트합니다."""
+    async def update_lotto_statistics(self, lotto_data: dict) -> bool:
+        """회차의 출현 횟수를 통계에 더합니다 (이미 반영된 회차면 False)."""
+        ...
+
+    async def rebuild_lotto_statistics(self) -> int:
+        """lotto_draws로 로또 통계를 다시 만들고 반영한 회차 수를 반환합니다."""
+        ...
+
+    async def get_lotto_statistics_truth(self) -> list[dict]:
+        """lotto_draws에서 다시 집계한 번호별 통계를 조회합니다."""
+        ...
+
+    async def get_unprocessed_rounds(self) -> list[int]:
+        """통계에 반영되지 않은 회차를 조회합니다."""
         ...
 
     async def create_lotto_recommendation(
@@ -60,14 +94,6 @@ class ILottoRepository(Protocol):
         """사용자의 최신 로또 추천을 조회합니다."""
         ...
 
-    async def get_frequent_numbers(self, limit: int = 10) -> list[int]:
-        """빈도 순으로 가장 많이 나온 번호들을 조회합니다."""
-        ...
-
-    async def get_excluded_numbers(self, limit: int = 2) -> list[int]:
-        """last_round 기준 오름차순으로 정렬했을 때 가장 마지막 2개 번호를 조회합니다."""
-        ...
-
     async def get_recommendation_by_user_and_round(
         self, user_id: str, round: int
     ) -> LottoRecommendations | None:
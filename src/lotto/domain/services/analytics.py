@@ -0,0 +1,159 @@
+"""로또 회차 분석
+
+전체 회차를 (N x 7) uint8 번호 행렬과 (N x 45) 출현 행렬로 만들어
+번호 조합 동시 출현, 미출현 간격, 홀짝/합계 분포, 연속 번호 비율을
+회차 반복 없이 벡터 연산으로 계산합니다.
+
+분석은 당첨 번호 6개(보너스 제외)를 기준으로 합니다.
+"""
+
+from itertools import combinations
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+MAX_NUMBER = 45
+MAIN_COUNT = 6
+
+# 당첨 번호 6개에서 만들 수 있는 2개/3개 조합의 열 인덱스
+_PAIR_COLUMNS = np.array(list(combinations(range(MAIN_COUNT), 2)))
+_TRIPLE_COLUMNS = np.array(list(combinations(range(MAIN_COUNT), 3)))
+
+
+class LottoDrawMatrix(NamedTuple):
+    """회차 오름차순 분석 행렬
+
+    numbers: (N x 7) num1~num6, bonus_num
+    mains: (N x 6) 당첨 번호 오름차순
+    incidence: (N x 45) 번호별 출현 여부 (열 i는 번호 i + 1)
+    bits: (N,) 출현 번호 비트마스크 (비트 i는 번호 i + 1)
+    """
+
+    numbers: np.ndarray
+    mains: np.ndarray
+    incidence: np.ndarray
+    bits: np.ndarray
+
+
+def build_draw_matrix(numbers: np.ndarray) -> LottoDrawMatrix:
+    """(N x 7) 번호 행렬로 분석 행렬을 만듭니다."""
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    mains = np.sort(numbers[:, :MAIN_COUNT], axis=1)
+
+    count = len(numbers)
+    incidence = np.zeros((count, MAX_NUMBER), dtype=bool)
+    rows = np.repeat(np.arange(count), MAIN_COUNT)
+    incidence[rows, mains.ravel().astype(np.intp) - 1] = True
+
+    weights = np.left_shift(
+        np.uint64(1), np.arange(MAX_NUMBER, dtype=np.uint64)
+    )
+    bits = np.bitwise_or.reduce(
+        np.where(incidence, weights, np.uint64(0)), axis=1
+    )
+    return LottoDrawMatrix(numbers, mains, incidence, bits)
+
+
+def pair_counts(matrix: LottoDrawMatrix) -> np.ndarray:
+    """(45 x 45) 두 번호가 같은 회차에 나온 횟수 (대각선은 번호별 출현 횟수)"""
+    incidence = matrix.incidence.astype(np.int32)
+    return incidence.T @ incidence
+
+
+def top_combinations(
+    matrix: LottoDrawMatrix, size: int, limit: int
+) -> List[Tuple[Tuple[int, ...], int]]:
+    """함께 가장 많이 나온 번호 조합 (size는 2 또는 3)"""
+    columns = _PAIR_COLUMNS if size == 2 else _TRIPLE_COLUMNS
+    # 조합을 45진수 정수 하나로 인코딩하여 bincount로 집계
+    codes = np.zeros((len(matrix.mains), len(columns)), dtype=np.int64)
+    for position in range(size):
+        codes = codes * MAX_NUMBER + (
+            matrix.mains[:, columns[:, position]].astype(np.int64) - 1
+        )
+    counts = np.bincount(codes.ravel(), minlength=MAX_NUMBER**size)
+
+    limit = min(limit, int(np.count_nonzero(counts)))
+    if limit <= 0:
+        return []
+    # 경계 횟수와 같은 조합까지 후보로 두고 (횟수 내림차순, 번호 오름차순) 정렬
+    threshold = np.partition(counts, -limit)[-limit]
+    top = np.flatnonzero(counts >= threshold)
+    top = top[np.lexsort((top, -counts[top]))][:limit]
+
+    results = []
+    for code, count in zip(top.tolist(), counts[top].tolist()):
+        numbers = []
+        for _ in range(size):
+            code, digit = divmod(code, MAX_NUMBER)
+            numbers.append(digit + 1)
+        results.append((tuple(reversed(numbers)), count))
+    return results
+
+
+def gap_statistics(
+    matrix: LottoDrawMatrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """번호별 미출현 간격
+
+    반환값은 (현재 간격, 최대 간격, 평균 간격, 전체 간격 히스토그램)이며,
+    간격은 다시 나오기까지 지난 회차 수입니다 (연속 출현이면 1).
+    현재 간격은 마지막 출현 이후 지난 회차 수이고, 한 번도 안 나왔으면 전체 회차 수입니다.
+    """
+    count = len(matrix.incidence)
+    # 번호 순서 -> 회차 순서로 정렬된 (번호 인덱스, 회차 인덱스)
+    number_index, draw_index = np.nonzero(matrix.incidence.T)
+    same_number = number_index[1:] == number_index[:-1]
+    gaps = np.diff(draw_index)[same_number]
+    gap_numbers = number_index[1:][same_number]
+
+    appearances = np.bincount(number_index, minlength=MAX_NUMBER)
+    last_seen = np.full(MAX_NUMBER, -1, dtype=np.int64)
+    np.maximum.at(last_seen, number_index, draw_index)
+    current = np.where(last_seen >= 0, count - 1 - last_seen, count)
+
+    max_gaps = np.zeros(MAX_NUMBER, dtype=np.int64)
+    np.maximum.at(max_gaps, gap_numbers, gaps)
+    gap_sums = np.bincount(gap_numbers, weights=gaps, minlength=MAX_NUMBER)
+    gap_counts = np.maximum(appearances - 1, 1)
+    average = np.where(appearances > 1, gap_sums / gap_counts, 0.0)
+
+    histogram = np.bincount(gaps) if len(gaps) else np.zeros(1, np.int64)
+    return current, max_gaps, average, histogram
+
+
+def odd_even_histogram(matrix: LottoDrawMatrix) -> np.ndarray:
+    """(7,) 당첨 번호 6개 중 홀수 개수별 회차 수"""
+    odd = np.count_nonzero(matrix.mains & 1, axis=1)
+    return np.bincount(odd, minlength=MAIN_COUNT + 1)
+
+
+def sum_histogram(
+    matrix: LottoDrawMatrix, bin_width: int
+) -> List[Tuple[int, int, int]]:
+    """당첨 번호 합계 구간별 회차 수 [(시작, 끝(포함), 회차 수)]"""
+    sums = matrix.mains.astype(np.int32).sum(axis=1)
+    if not len(sums):
+        return []
+    bins = sums // bin_width
+    counts = np.bincount(bins - bins.min())
+    first = int(bins.min())
+    return [
+        (
+            (first + i) * bin_width,
+            (first + i + 1) * bin_width - 1,
+            int(c),
+        )
+        for i, c in enumerate(counts.tolist())
+    ]
+
+
+def consecutive_statistics(matrix: LottoDrawMatrix) -> Dict[str, object]:
+    """연속 번호(예: 12, 13)가 포함된 회차 비율과 연속 쌍 개수별 회차 수"""
+    count = len(matrix.mains)
+    adjacent = np.diff(matrix.mains.astype(np.int16), axis=1) == 1
+    pairs = np.count_nonzero(adjacent, axis=1)
+    return {
+        "rate": float(np.count_nonzero(pairs) / count) if count else 0.0,
+        "histogram": np.bincount(pairs, minlength=MAIN_COUNT).tolist(),
+    }
@@ -0,0 +1,90 @@
+"""회차별 로또 분석 캐시
+
+분석 결과는 새 회차가 저장될 때만 바뀌므로, 회차 버전이 바뀔 때 분석 행렬을
+한 번 만들고 GET /lotto/analytics/* 응답을 파라미터 조합별로 직렬화하여 ETag와 함께
+보관합니다.
+
+회차 버전은 DB에서 조회한 lotto_draws의 (최신 회차, 회차 수)이므로, 다른 워커나
+스크립트가 저장한 회차도 다음 요청에서 반영됩니다. 같은 프로세스에서는 회차 저장
+작업이 끝난 뒤 invalidate()로 즉시 무효화합니다.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.lotto.domain.services.analytics import (
+    LottoDrawMatrix,
+    build_draw_matrix,
+)
+
+
+class LottoAnalyticsCache:
+    """회차별 로또 분석 캐시 (싱글톤)"""
+
+    _instance: Optional["LottoAnalyticsCache"] = None
+
+    round: Optional[int]
+    # (최신 회차, 회차 수)
+    version: Optional[Tuple[Optional[int], int]]
+    matrix: Optional[LottoDrawMatrix]
+    bodies: Dict[Hashable, Tuple[bytes, str]]
+    builds: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LottoAnalyticsCache":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.round = None
+            cls._instance.version = None
+            cls._instance.matrix = None
+            cls._instance.bodies = {}
+            cls._instance.builds = 0
+        return cls._instance
+
+    def is_current(self, version: Tuple[Optional[int], int]) -> bool:
+        return self.matrix is not None and self.version == version
+
+    def invalidate(self) -> None:
+        self.round = None
+        self.version = None
+        self.matrix = None
+        self.bodies = {}
+
+    def rebuild(
+        self, version: Tuple[Optional[int], int], numbers: np.ndarray
+    ) -> None:
+        """회차 버전 (최신 회차, 회차 수)의 (회차 수 x 7) 번호 행렬로 분석 행렬을
+        다시 만들고 응답 캐시를 비웁니다."""
+        matrix = build_draw_matrix(numbers)
+        # await 없이 교체하므로 읽는 쪽이 섞인 상태를 보지 않음
+        self.bodies = {}
+        self.matrix = matrix
+        self.round, _ = version
+        self.version = version
+        self.builds += 1
+
+    def get_json(
+        self,
+        key: Hashable,
+        build: Callable[[LottoDrawMatrix], BaseModel],
+    ) -> Tuple[bytes, str]:
+        """직렬화된 분석 응답 (JSON, ETag), 없으면 build로 만들어 보관합니다."""
+        cached = self.bodies.get(key)
+        if cached is None:
+            matrix = self.matrix
+            if matrix is None:
+                raise RuntimeError("분석 행렬이 없습니다 (rebuild 전)")
+            body = build(matrix).model_dump_json().encode()
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            cached = self.bodies[key] = (body, etag)
+        return cached
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "round": self.round,
+            "draws": len(self.matrix.mains) if self.matrix is not None else 0,
+            "responses": len(self.bodies),
+            "builds": self.builds,
+        }
@@ -0,0 +1,201 @@
+"""로또 회차 스냅샷
+
+lotto_draws 테이블(약 1,200행, 주 1회 추가되고 수정되지 않음)을 프로세스마다
+한 번 읽어 열(column)별 NumPy 배열로 보관합니다.
+기동 시 lifespan에서 로드하고, 회차 저장 작업이 끝나면(성공/실패 모두) 다시 로드합니다.
+다른 워커나 스크립트가 저장한 회차는 리포지토리가 CHECK_INTERVAL 초에 한 번
+DB의 (최신 회차, 회차 수)를 스냅샷의 version과 비교하여 다르면 다시 로드합니다.
+
+- rounds: 회차 (오름차순, int32)
+- numbers: (회차 수 x 7) num1~num6, bonus_num (uint8)
+- draw_dates: 추첨일 (date.toordinal(), int32)
+- first_prize_amounts (int64), total_winners (int32)
+
+로드 전이거나 로드에 실패하면 loaded가 False이며, 리포지토리는 DB를 조회합니다.
+"""
+
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Row, asc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lotto.domain.entities.models import LottoDraws
+
+NUMBER_COLUMNS = ("num1", "num2", "num3", "num4", "num5", "num6", "bonus_num")
+
+# DB의 lotto_draws와 같은지 확인하는 주기 (초)
+CHECK_INTERVAL = 5.0
+
+
+class LottoDrawSnapshot:
+    """로또 회차 스냅샷 (싱글톤)"""
+
+    _instance: Optional["LottoDrawSnapshot"] = None
+
+    rounds: np.ndarray
+    numbers: np.ndarray
+    draw_dates: np.ndarray
+    first_prize_amounts: np.ndarray
+    total_winners: np.ndarray
+    loaded: bool
+    loaded_at: float
+    next_check: float
+    loads: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LottoDrawSnapshot":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance._set_arrays(cls._empty_arrays())
+            cls._instance.loaded = False
+            cls._instance.loaded_at = 0.0
+            cls._instance.next_check = 0.0
+            cls._instance.loads = 0
+        return cls._instance
+
+    @staticmethod
+    def _empty_arrays() -> Dict[str, np.ndarray]:
+        return {
+            "rounds": np.empty(0, dtype=np.int32),
+            "numbers": np.empty((0, len(NUMBER_COLUMNS)), dtype=np.uint8),
+            "draw_dates": np.empty(0, dtype=np.int32),
+            "first_prize_amounts": np.empty(0, dtype=np.int64),
+            "total_winners": np.empty(0, dtype=np.int32),
+        }
+
+    def _set_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        # await 없이 모두 교체하므로 읽는 쪽이 이전/새 배열을 섞어 보지 않음
+        self.rounds = arrays["rounds"]
+        self.numbers = arrays["numbers"]
+        self.draw_dates = arrays["draw_dates"]
+        self.first_prize_amounts = arrays["first_prize_amounts"]
+        self.total_winners = arrays["total_winners"]
+
+    async def load(self, session: AsyncSession) -> None:
+        """lotto_draws 전체를 읽어 스냅샷을 교체합니다."""
+        query = select(
+            LottoDraws.round,
+            LottoDraws.draw_date,
+            *(getattr(LottoDraws, column) for column in NUMBER_COLUMNS),
+            LottoDraws.first_prize_amount,
+            LottoDraws.total_winners,
+        ).order_by(asc(LottoDraws.round))
+        rows = (await session.execute(query)).all()
+        self.replace(rows)
+
+    def replace(self, rows: Sequence[Row[Any]]) -> None:
+        """(round, draw_date, num1~num6, bonus_num, 1등 당첨금, 1등 당첨자 수)
+        행 목록(회차 오름차순)으로 스냅샷을 교체합니다."""
+        count = len(rows)
+        arrays = self._empty_arrays()
+        if count:
+            columns = list(zip(*rows))
+            arrays = {
+                "rounds": np.array(columns[0], dtype=np.int32),
+                "draw_dates": np.fromiter(
+                    (d.toordinal() for d in columns[1]),
+                    dtype=np.int32,
+                    count=count,
+                ),
+                "numbers": np.array(
+                    columns[2 : 2 + len(NUMBER_COLUMNS)], dtype=np.uint8
+                ).T.copy(),
+                "first_prize_amounts": np.array(columns[9], dtype=np.int64),
+                "total_winners": np.array(columns[10], dtype=np.int32),
+            }
+        self._set_arrays(arrays)
+        self.loaded = True
+        self.loaded_at = time.time()
+        self.next_check = time.monotonic() + CHECK_INTERVAL
+        self.loads += 1
+
+    def needs_check(self) -> bool:
+        return time.monotonic() >= self.next_check
+
+    def mark_checked(self) -> None:
+        self.next_check = time.monotonic() + CHECK_INTERVAL
+
+    def __len__(self) -> int:
+        return len(self.rounds)
+
+    @property
+    def latest_round(self) -> Optional[int]:
+        return int(self.rounds[-1]) if len(self.rounds) else None
+
+    @property
+    def version(self) -> Tuple[Optional[int], int]:
+        """(최신 회차, 회차 수), DB의 lotto_draws와 비교하는 버전"""
+        return self.latest_round, len(self.rounds)
+
+    def covers(self, round: int) -> bool:
+        """스냅샷이 round까지 반영하고 있는지 (이후 회차는 DB 확인 필요)"""
+        latest = self.latest_round
+        return self.loaded and latest is not None and round <= latest
+
+    def index_of(self, round: int) -> Optional[int]:
+        rounds = self.rounds
+        index = int(np.searchsorted(rounds, round))
+        if index < len(rounds) and rounds[index] == round:
+            return index
+        return None
+
+    def records(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """[start, end) 구간 회차의 컬럼 값 (최신 회차부터)
+
+        열마다 한 번에 파이썬 값으로 변환하여 행 단위 NumPy 접근을 피합니다.
+        """
+        window = slice(start, end)
+        numbers = self.numbers[window][::-1].tolist()
+        return [
+            {
+                "round": round,
+                "draw_date": date.fromordinal(ordinal),
+                **dict(zip(NUMBER_COLUMNS, row)),
+                "first_prize_amount": amount,
+                "total_winners": winners,
+            }
+            for round, ordinal, row, amount, winners in zip(
+                self.rounds[window][::-1].tolist(),
+                self.draw_dates[window][::-1].tolist(),
+                numbers,
+                self.first_prize_amounts[window][::-1].tolist(),
+                self.total_winners[window][::-1].tolist(),
+            )
+        ]
+
+    def get(self, round: int) -> Optional[Dict[str, Any]]:
+        """회차의 컬럼 값 (없으면 None)"""
+        index = self.index_of(round)
+        return self.records(index, index + 1)[0] if index is not None else None
+
+    def page(
+        self, cursor: Optional[int] = None, limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """최신 회차부터 cursor 미만 회차를 limit개 (DB 조회와 같은 커서 규칙)"""
+        end = len(self.rounds)
+        if cursor:
+            end = int(np.searchsorted(self.rounds, cursor))
+        records = self.records(max(0, end - limit), end)
+        next_cursor = records[-1]["round"] if len(records) == limit else None
+        return records, next_cursor
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "rounds": len(self),
+            "latest_round": self.latest_round,
+            "loaded_at": self.loaded_at,
+            "loads": self.loads,
+            "bytes": sum(
+                array.nbytes
+                for array in (
+                    self.rounds,
+                    self.numbers,
+                    self.draw_dates,
+                    self.first_prize_amounts,
+                    self.total_winners,
+                )
+            ),
+        }
@@ -0,0 +1,129 @@
+"""로또 번호 누적 출현 인덱스
+
+회차 오름차순으로 번호별 당첨 번호/보너스 번호 출현 횟수의 누적합을
+(회차 수 + 1) x 45 int32 배열로 보관합니다. prefix[i]는 앞에서 i개 회차까지의
+출현 횟수이므로, [from_round, to_round] 구간의 번호별 출현 횟수는
+searchsorted로 행 두 개를 찾아 빼는 O(45) 연산으로 구합니다.
+
+LottoDrawSnapshot의 회차 배열과 sync()로 맞추며, 이미 반영한 회차 뒤에 새 회차만
+추가된 경우 새 회차의 행만 이어 붙입니다 (용량을 두 배씩 늘려 재할당을 줄임).
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+MAX_NUMBER = 45
+MAIN_COUNT = 6
+
+
+class LottoFrequencyIndex:
+    """로또 번호 누적 출현 인덱스 (싱글톤)"""
+
+    _instance: Optional["LottoFrequencyIndex"] = None
+
+    size: int
+    _rounds: np.ndarray
+    _main_prefix: np.ndarray
+    _bonus_prefix: np.ndarray
+    builds: int
+    appends: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LottoFrequencyIndex":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance._reset()
+            cls._instance.builds = 0
+            cls._instance.appends = 0
+        return cls._instance
+
+    def _reset(self, capacity: int = 0) -> None:
+        self.size = 0
+        self._rounds = np.empty(capacity, dtype=np.int32)
+        self._main_prefix = np.zeros((capacity + 1, MAX_NUMBER), np.int32)
+        self._bonus_prefix = np.zeros((capacity + 1, MAX_NUMBER), np.int32)
+
+    @property
+    def rounds(self) -> np.ndarray:
+        return self._rounds[: self.size]
+
+    def sync(self, rounds: np.ndarray, numbers: np.ndarray) -> None:
+        """회차 오름차순 (회차 배열, (회차 수 x 7) 번호 행렬)에 맞춥니다."""
+        size = self.size
+        if (
+            size
+            and len(rounds) >= size
+            and rounds[0] == self._rounds[0]
+            and rounds[size - 1] == self._rounds[size - 1]
+        ):
+            if len(rounds) == size:
+                return
+            # 기존 회차는 바뀌지 않으므로 새 회차만 추가
+            self._append(rounds[size:], numbers[size:])
+            self.appends += 1
+            return
+
+        self._reset(len(rounds))
+        self._append(rounds, numbers)
+        self.builds += 1
+
+    def _append(self, rounds: np.ndarray, numbers: np.ndarray) -> None:
+        count = len(rounds)
+        if not count:
+            return
+        size = self.size
+        end = size + count
+        if end > len(self._rounds):
+            self._grow(max(end, 2 * len(self._rounds)))
+
+        rows = np.arange(count)
+        main = np.zeros((count, MAX_NUMBER), dtype=np.int32)
+        main[
+            np.repeat(rows, MAIN_COUNT),
+            numbers[:, :MAIN_COUNT].ravel().astype(np.intp) - 1,
+        ] = 1
+        bonus = np.zeros((count, MAX_NUMBER), dtype=np.int32)
+        bonus[rows, numbers[:, MAIN_COUNT].astype(np.intp) - 1] = 1
+
+        self._rounds[size:end] = rounds
+        np.cumsum(main, axis=0, out=main)
+        np.cumsum(bonus, axis=0, out=bonus)
+        self._main_prefix[size + 1 : end + 1] = self._main_prefix[size] + main
+        self._bonus_prefix[size + 1 : end + 1] = (
+            self._bonus_prefix[size] + bonus
+        )
+        self.size = end
+
+    def _grow(self, capacity: int) -> None:
+        size = self.size
+        rounds, main_prefix, bonus_prefix = (
+            self._rounds,
+            self._main_prefix,
+            self._bonus_prefix,
+        )
+        self._reset(capacity)
+        self._rounds[:size] = rounds[:size]
+        self._main_prefix[: size + 1] = main_prefix[: size + 1]
+        self._bonus_prefix[: size + 1] = bonus_prefix[: size + 1]
+        self.size = size
+
+    def counts(
+        self, from_round: int, to_round: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """[from_round, to_round] 구간의 번호별 (당첨 번호, 보너스 번호) 출현 횟수"""
+        rounds = self.rounds
+        start = int(np.searchsorted(rounds, from_round, side="left"))
+        end = max(start, int(np.searchsorted(rounds, to_round, side="right")))
+        return (
+            self._main_prefix[end] - self._main_prefix[start],
+            self._bonus_prefix[end] - self._bonus_prefix[start],
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rounds": self.size,
+            "capacity": len(self._rounds),
+            "builds": self.builds,
+            "appends": self.appends,
+            "bytes": self._main_prefix.nbytes + self._bonus_prefix.nbytes,
+        }
@@ -1,6 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import asc, desc, select, update
+import numpy as np
+from sqlalchemy import (
+    DateTime,
+    asc,
+    case,
+    delete,
+    desc,
+    func,
+    literal,
+    literal_column,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.lotto.domain.entities.enums import SortType
@@ -8,12 +22,56 @@ from src.lotto.domain.entities.models import (
     LottoDraws,
     LottoRecommendations,
     LottoStatistics,
+    LottoStatisticsRound,
+)
+from src.lotto.infrastructure.draw_snapshot import (
+    NUMBER_COLUMNS,
+    LottoDrawSnapshot,
 )
+from src.lotto.infrastructure.frequency_index import LottoFrequencyIndex
 
 
 class LottoRepository:
+    """로또 리포지토리
+
+    회차 조회(목록, 최신 회차, 회차별 조회)는 LottoDrawSnapshot이 로드되어 있으면
+    메모리에서 처리하고, 스냅샷 이후 회차만 DB를 조회합니다. 스냅샷은 주기적으로
+    DB의 (최신 회차, 회차 수)와 비교하여 다른 프로세스가 저장한 회차를 반영합니다.
+    회차 구간별 번호 출현 횟수는 스냅샷으로 만든 LottoFrequencyIndex로 계산합니다.
+    """
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.snapshot = LottoDrawSnapshot()
+        self.frequency_index = LottoFrequencyIndex()
+
+    async def _sync_snapshot(
+        self, load: bool = False, force: bool = False
+    ) -> bool:
+        """회차 스냅샷을 DB의 lotto_draws에 맞추고 스냅샷을 쓸 수 있는지 반환합니다.
+
+        로드되어 있으면 CHECK_INTERVAL 초에 한 번(force면 매번) DB의 (최신 회차, 회차 수)를
+        스냅샷의 version과 비교하여, 다른 워커나 스크립트가 회차를 저장했으면 다시 로드합니다.
+        로드되지 않았으면 load일 때만 로드합니다.
+        """
+        snapshot = self.snapshot
+        if not snapshot.loaded:
+            if not load:
+                return False
+            await snapshot.load(self.session)
+        elif force or snapshot.needs_check():
+            result = await self.session.execute(
+                select(func.max(LottoDraws.round), func.count(LottoDraws.round))
+            )
+            if snapshot.version != tuple(result.one()):
+                await snapshot.load(self.session)
+            snapshot.mark_checked()
+        return True
+
+    async def get_draws_version(self) -> tuple[int | None, int]:
+        """DB 기준 회차 버전 (최신 회차, 회차 수)을 조회합니다 (스냅샷도 맞춤)."""
+        await self._sync_snapshot(load=True, force=True)
+        return self.snapshot.version
 
     async def get_lotto_draws(
         self,
@@ -21,6 +79,11 @@ class LottoRepository:
         cursor: int | None = None,
         limit: int = 10,
     ) -> tuple[list[LottoDraws], int | None]:
+        if await self._sync_snapshot():
+            return await self._get_lotto_draws_from_snapshot(
+                user_id, cursor, limit
+            )
+
         if user_id:
             query = (
                 select(
@@ -58,6 +121,31 @@ class LottoRepository:
         next_cursor = draws[-1].round if len(draws) == limit else None
         return draws, next_cursor
 
+    async def _get_lotto_draws_from_snapshot(
+        self, user_id: str | None, cursor: int | None, limit: int
+    ) -> tuple[list[LottoDraws], int | None]:
+        records, next_cursor = self.snapshot.page(cursor=cursor, limit=limit)
+        draws = [LottoDraws(**record) for record in records]
+
+        if user_id and draws:
+            # 페이지 회차 중 사용자가 추천받은 회차만 조회
+            query = (
+                select(LottoRecommendations.round)
+                .where(
+                    LottoRecommendations.user_id == user_id,
+                    LottoRecommendations.round.in_(
+                        [draw.round for draw in draws]
+                    ),
+                )
+                .distinct()
+            )
+            result = await self.session.execute(query)
+            recommended = set(result.scalars().all())
+            for draw in draws:
+                draw.has_recommendation = draw.round in recommended
+
+        return draws, next_cursor
+
     async def get_lotto_statistics(
         self,
         sort_type: SortType = SortType.FREQUENCY,
@@ -81,8 +169,25 @@ class LottoRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_lotto_statistics_version(self) -> datetime | None:
+        """로또 통계의 버전(마지막 수정 시각)을 조회합니다.
+
+        통계를 바꾸는 모든 작업이 updated_at을 갱신하므로, 다른 프로세스가 통계를
+        바꿨는지 확인하는 데 사용합니다.
+        """
+        result = await self.session.execute(
+            select(func.max(LottoStatistics.updated_at))
+        )
+        return result.scalar_one_or_none()
+
     async def get_latest_round(self) -> int | None:
         """가장 최신 로또 회차를 조회합니다."""
+        if (
+            await self._sync_snapshot()
+            and self.snapshot.latest_round is not None
+        ):
+            return self.snapshot.latest_round
+
         query = (
             select(LottoDraws.round).order_by(desc(LottoDraws.round)).limit(1)
         )
@@ -90,6 +195,21 @@ class LottoRepository:
         latest = result.scalar_one_or_none()
         return latest
 
+    async def get_draw_numbers(
+        self,
+    ) -> tuple[tuple[int | None, int], np.ndarray]:
+        """DB 기준 회차 버전과 전체 회차의 (회차 수 x 7) 번호 행렬(회차 오름차순)을 조회합니다."""
+        version = await self.get_draws_version()
+        return version, self.snapshot.numbers
+
+    async def get_number_counts(
+        self, from_round: int, to_round: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """[from_round, to_round] 구간의 번호별 (당첨 번호, 보너스 번호) 출현 횟수를 조회합니다."""
+        await self._sync_snapshot(load=True)
+        self.frequency_index.sync(self.snapshot.rounds, self.snapshot.numbers)
+        return self.frequency_index.counts(from_round, to_round)
+
     async def create_lotto_draw(self, lotto_data: dict) -> LottoDraws:
         """로또 추첨 데이터를 생성합니다."""
         lotto_draw = LottoDraws(**lotto_data)
@@ -100,55 +220,184 @@ class LottoRepository:
 
     async def get_lotto_draw_by_round(self, round: int) -> LottoDraws | None:
         """특정 회차의 로또 추첨 데이터를 조회합니다."""
+        if await self._sync_snapshot() and self.snapshot.covers(round):
+            record = self.snapshot.get(round)
+            return LottoDraws(**record) if record is not None else None
+
         query = select(LottoDraws).where(LottoDraws.round == round)
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def update_lotto_statistics(self, lotto_data: dict) -> None:
-        """로또 통계 데이터를 업데이트합니다."""
-        # 메인 번호들 (1-6번)과 보너스 번호
-        main_numbers = [
-            lotto_data["num1"],
-            lotto_data["num2"],
-            lotto_data["num3"],
-            lotto_data["num4"],
-            lotto_data["num5"],
-            lotto_data["num6"],
-        ]
-        bonus_number = lotto_data["bonus_num"]
+    async def update_lotto_statistics(self, lotto_data: dict) -> bool:
+        """회차의 번호별 출현 횟수를 lotto_statistics에 더합니다.
 
-        # 당첨된 번호들만 수집 (중복 제거)
-        winning_numbers = set(main_numbers + [bonus_number])
+        lotto_statistics_rounds에 회차를 먼저 기록하고, 이미 기록된 회차면 더하지 않고
+        False를 반환합니다 (같은 트랜잭션이므로 커밋 전 실패하면 함께 롤백됨).
+        """
+        marker = (
+            mysql_insert(LottoStatisticsRound)
+            .values(round=lotto_data["round"])
+            .prefix_with("IGNORE")
+        )
+        result = await self.session.execute(marker)
+        if result.rowcount == 0:
+            return False
 
-        # 당첨된 번호들의 통계만 조회
-        stats_query = select(LottoStatistics).where(
-            LottoStatistics.num.in_(winning_numbers)
+        main_numbers = {lotto_data[column] for column in NUMBER_COLUMNS[:6]}
+        bonus_number = lotto_data["bonus_num"]
+        rows = [
+            {
+                "num": num,
+                "main_count": int(num in main_numbers),
+                "bonus_count": int(num == bonus_number),
+                "total_count": 1,
+                "last_round": lotto_data["round"],
+                "last_date": lotto_data["draw_date"],
+            }
+            for num in sorted(main_numbers | {bonus_number})
+        ]
+        upsert = mysql_insert(LottoStatistics).values(rows)
+        inserted = upsert.inserted
+        last_round = func.coalesce(LottoStatistics.last_round, 0)
+        upsert = upsert.on_duplicate_key_update(
+            [
+                # 이전 회차를 나중에 반영해도 마지막 출현 정보가 되돌아가지 않도록,
+                # last_round보다 먼저 갱신하여 갱신 전 last_round와 비교
+                (
+                    "last_date",
+                    case(
+                        (inserted.last_round >= last_round, inserted.last_date),
+                        else_=LottoStatistics.last_date,
+                    ),
+                ),
+                ("last_round", func.greatest(last_round, inserted.last_round)),
+                (
+                    "main_count",
+                    LottoStatistics.main_count + inserted.main_count,
+                ),
+                (
+                    "bonus_count",
+                    LottoStatistics.bonus_count + inserted.bonus_count,
+                ),
+                (
+                    "total_count",
+                    LottoStatistics.total_count + inserted.total_count,
+                ),
+                ("updated_at", inserted.updated_at),
+            ]
         )
-        result = await self.session.execute(stats_query)
-        existing_stats = {stat.num: stat for stat in result.scalars().all()}
-
-        # 각 당첨 번호에 대해 통계 업데이트
-        for num in winning_numbers:
-            if num in existing_stats:
-                stat = existing_stats[num]
-            else:
-                # 새로운 통계 생성
-                stat = LottoStatistics(
-                    num=num, main_count=0, bonus_count=0, total_count=0
+        await self.session.execute(upsert)
+        return True
+
+    @staticmethod
+    def _aggregate_statistics_query():
+        """lotto_draws 전체를 한 번 읽어 번호별 통계를 집계하는 쿼리"""
+        hits = union_all(
+            *(
+                select(
+                    getattr(LottoDraws, column).label("num"),
+                    literal_column("0" if column == "bonus_num" else "1").label(
+                        "is_main"
+                    ),
+                    LottoDraws.round.label("round"),
+                    LottoDraws.draw_date.label("draw_date"),
                 )
-                self.session.add(stat)
+                for column in NUMBER_COLUMNS
+            )
+        ).subquery("hits")
+        main_count = func.sum(hits.c.is_main)
+        return (
+            select(
+                hits.c.num,
+                main_count.label("main_count"),
+                (func.count() - main_count).label("bonus_count"),
+                func.count().label("total_count"),
+                func.max(hits.c.round).label("last_round"),
+                # 회차와 추첨일은 함께 증가하므로 마지막 출현 날짜는 가장 늦은 추첨일
+                func.max(hits.c.draw_date).label("last_date"),
+            )
+            .group_by(hits.c.num)
+            .order_by(hits.c.num)
+        )
+
+    async def rebuild_lotto_statistics(self) -> int:
+        """lotto_draws로 lotto_statistics와 반영 회차 기록을 다시 만들고 회차 수를 반환합니다."""
+        await self.session.execute(
+            update(LottoStatistics).values(
+                main_count=0,
+                bonus_count=0,
+                total_count=0,
+                last_round=None,
+                last_date=None,
+            )
+        )
+        now = datetime.now()
+        aggregate = self._aggregate_statistics_query().subquery("aggregate")
+        columns = [
+            "num",
+            "main_count",
+            "bonus_count",
+            "total_count",
+            "last_round",
+            "last_date",
+        ]
+        upsert = mysql_insert(LottoStatistics).from_select(
+            columns + ["created_at", "updated_at"],
+            select(
+                *(aggregate.c[column] for column in columns),
+                literal(now, DateTime),
+                literal(now, DateTime),
+            ),
+        )
+        upsert = upsert.on_duplicate_key_update(
+            {
+                column: upsert.inserted[column]
+                for column in columns[1:] + ["updated_at"]
+            }
+        )
+        await self.session.execute(upsert)
+
+        await self.session.execute(delete(LottoStatisticsRound))
+        result = await self.session.execute(
+            mysql_insert(LottoStatisticsRound).from_select(
+                ["round", "created_at", "updated_at"],
+                select(
+                    LottoDraws.round,
+                    literal(now, DateTime),
+                    literal(now, DateTime),
+                ),
+            )
+        )
+        return result.rowcount
 
-            # 카운트 업데이트
-            if num in main_numbers:
-                stat.main_count += 1
-                stat.total_count += 1
-            elif num == bonus_number:
-                stat.bonus_count += 1
-                stat.total_count += 1
+    async def get_lotto_statistics_truth(self) -> list[dict]:
+        """lotto_draws에서 다시 집계한 번호별 통계를 조회합니다."""
+        result = await self.session.execute(self._aggregate_statistics_query())
+        return [
+            {
+                "num": row.num,
+                "main_count": int(row.main_count),
+                "bonus_count": int(row.bonus_count),
+                "total_count": int(row.total_count),
+                "last_round": row.last_round,
+                "last_date": row.last_date,
+            }
+            for row in result.all()
+        ]
 
-            # 마지막 출현 정보 업데이트
-            stat.last_round = lotto_data["round"]
-            stat.last_date = lotto_data["draw_date"]
+    async def get_unprocessed_rounds(self) -> list[int]:
+        """통계에 반영되지 않은 회차를 조회합니다."""
+        query = (
+            select(LottoDraws.round)
+            .outerjoin(
+                LottoStatisticsRound,
+                LottoStatisticsRound.round == LottoDraws.round,
+            )
+            .where(LottoStatisticsRound.round.is_(None))
+            .order_by(asc(LottoDraws.round))
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
 
     async def create_lotto_recommendation(
         self, user_id: str, round: int, content: dict
@@ -185,26 +434,6 @@ class LottoRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_frequent_numbers(self, limit: int = 10) -> list[int]:
-        """빈도 순으로 가장 많이 나온 번호들을 조회합니다."""
-        query = (
-            select(LottoStatistics.num)
-            .order_by(desc(LottoStatistics.total_count))
-            .limit(limit)
-        )
-        result = await self.session.execute(query)
-        return [row[0] for row in result.fetchall()]
-
-    async def get_excluded_numbers(self, limit: int = 2) -> list[int]:
-        """last_round 기준 오름차순으로 정렬했을 때 가장 마지막 2개 번호를 조회합니다 (최근에 가장 안나온 번호)."""
-        query = (
-            select(LottoStatistics.num)
-            .order_by(asc(LottoStatistics.last_round))
-            .limit(limit)
-        )
-        result = await self.session.execute(query)
-        return [row[0] for row in result.fetchall()]
-
     async def get_recommendation_by_user_and_round(
         self, user_id: str, round: int
     ) -> LottoRecommendations | None:
@@ -0,0 +1,128 @@
+"""회차별 로또 통계 스냅샷
+
+lotto_statistics는 새 회차가 저장되거나 scripts/lotto_statistics.py로 재계산/반영할
+때만 바뀌므로, (최신 회차, 통계 버전)이 바뀔 때 한 번만 조회하여 아래 값을 만들어 둡니다.
+
+- GET /lotto/statistics 응답: SortType x include_bonus 조합별 직렬화된 JSON과 ETag
+- 로또 추천 프롬프트의 자주 나온 번호(frequent)와 오래 안 나온 번호(excluded)
+
+통계 버전은 lotto_statistics의 max(updated_at)입니다. 통계를 바꾸는 작업은 모두
+updated_at을 갱신하므로, 다른 프로세스(스크립트, 다른 워커)가 바꾼 통계도 각 워커의
+다음 요청에서 반영됩니다. 같은 프로세스에서는 커밋한 뒤 invalidate()로 즉시 무효화합니다.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+
+from src.lotto.api.schemas import LottoStatistic
+from src.lotto.domain.entities.enums import SortType
+from src.lotto.domain.entities.models import LottoStatistics
+
+# 로또 추천 프롬프트에 넣는 번호 수
+FREQUENT_NUMBERS_LIMIT = 10
+EXCLUDED_NUMBERS_LIMIT = 2
+
+STATISTIC_LIST = TypeAdapter(List[LottoStatistic])
+
+
+class LottoStatisticsSnapshot:
+    """회차별 로또 통계 스냅샷 (싱글톤)"""
+
+    _instance: Optional["LottoStatisticsSnapshot"] = None
+
+    round: Optional[int]
+    version: Optional[datetime]
+    bodies: Dict[Tuple[SortType, bool], Tuple[bytes, str]]
+    frequent_numbers: List[int]
+    excluded_numbers: List[int]
+    builds: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "LottoStatisticsSnapshot":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance.round = None
+            cls._instance.version = None
+            cls._instance.bodies = {}
+            cls._instance.frequent_numbers = []
+            cls._instance.excluded_numbers = []
+            cls._instance.builds = 0
+        return cls._instance
+
+    def is_current(
+        self, round: Optional[int], version: Optional[datetime]
+    ) -> bool:
+        return (
+            bool(self.bodies)
+            and self.round == round
+            and self.version == version
+        )
+
+    def invalidate(self) -> None:
+        self.round = None
+        self.version = None
+        self.bodies = {}
+
+    def rebuild(
+        self,
+        round: Optional[int],
+        version: Optional[datetime],
+        statistics: Sequence[LottoStatistics],
+    ) -> None:
+        """lotto_statistics 전체 행으로 스냅샷을 다시 만듭니다."""
+        # (번호, 메인 횟수, 전체 횟수, 마지막 출현 회차)
+        rows: List[Tuple[int, int, int, Optional[int]]] = [
+            (
+                int(stat.num),
+                int(stat.main_count or 0),
+                int(stat.total_count or 0),
+                int(stat.last_round) if stat.last_round is not None else None,
+            )
+            for stat in statistics
+        ]
+
+        bodies: Dict[Tuple[SortType, bool], Tuple[bytes, str]] = {}
+        for include_bonus in (True, False):
+            # (번호, 횟수)
+            counts = [(r[0], r[2] if include_bonus else r[1]) for r in rows]
+            by_frequency = sorted(counts, key=lambda c: (-c[1], c[0]))
+            by_number = sorted(counts, key=lambda c: c[0])
+            for sort_type, ordered in (
+                (SortType.FREQUENCY, by_frequency),
+                (SortType.NUMBER, by_number),
+            ):
+                body = STATISTIC_LIST.dump_json(
+                    [
+                        LottoStatistic(num=num, count=count)
+                        for num, count in ordered
+                    ]
+                )
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                bodies[(sort_type, include_bonus)] = (body, etag)
+
+        # 자주 나온 번호: 전체 횟수 내림차순, 오래 안 나온 번호: 마지막 출현 회차 오름차순(NULL 먼저)
+        frequent = sorted(rows, key=lambda r: (-r[2], r[0]))
+        excluded = sorted(
+            rows,
+            key=lambda r: (r[3] is not None, r[3] or 0, r[0]),
+        )
+
+        # await 없이 교체하므로 읽는 쪽이 섞인 상태를 보지 않음
+        self.bodies = bodies
+        self.frequent_numbers = [r[0] for r in frequent][
+            :FREQUENT_NUMBERS_LIMIT
+        ]
+        self.excluded_numbers = [r[0] for r in excluded][
+            :EXCLUDED_NUMBERS_LIMIT
+        ]
+        self.round = round
+        self.version = version
+        self.builds += 1
+
+    def get_json(
+        self, sort_type: SortType, include_bonus: bool
+    ) -> Tuple[bytes, str]:
+        """직렬화된 통계 응답 (JSON, ETag)"""
+        return self.bodies[(sort_type, include_bonus)]
@@ -5,6 +5,8 @@ from src.config.config import app_config
 from src.config.lifespan import lifespan
 from src.config.middleware import DBMiddleware
 from src.fortune.api.router import fortune_router
+from src.four_pillars.api.router import calendar_router
+from src.hcx_client.api.router import hcx_router
 from src.lotto.api.router import lotto_router
 from src.lotto_stores.api.router import lotto_store_router
 from src.users.api.router import user_router
@@ -25,4 +27,6 @@ app.include_router(user_router)
 app.include_router(lotto_router)
 app.include_router(lotto_store_router)
 app.include_router(fortune_router)
-app.include_router(atm_router)
\ No newline at end of file
+app.include_router(atm_router)
+app.include_router(calendar_router)
+app.include_router(hcx_router)
@@ -1,16 +1,24 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from src.common.dependencies import (
     get_fortune_service,
     get_lotto_service,
     get_user_service,
 )
+from src.common.sse import sse_response
 from src.four_pillars import FourPillarDetail
 from src.lotto.api.schemas import LottoRecommendation, LottoResultCheckResponse
 from src.lotto.application.service import LottoService
-from src.users.api.schemas import UserCreate, UserDetail, UserList, UserUpdate
+from src.users.api.schemas import (
+    CompatibleUserList,
+    UserCreate,
+    UserDetail,
+    UserList,
+    UserUpdate,
+)
 from src.fortune.api.schemas import (
     UserDailyFortuneSummaries,
     UserDailyFortuneDetail,
@@ -82,6 +90,26 @@ async def get_user_four_pillar(
     return await user_service.get_user_four_pillar(user_id)
 
 
+@user_router.get(
+    "/{user_id}/compatible-users", response_model=CompatibleUserList
+)
+async def get_compatible_users(
+    user_id: str,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Number of records to return"),
+    user_service: UserService = Depends(get_user_service),
+):
+    """
+    다른 사용자들과의 사주 궁합 점수를 높은 순으로 조회합니다.
+
+    - score: 궁합 점수 (0-100). 일간/일지/띠 관계와 오행 균형으로 계산
+    - total: 비교한 전체 사용자 수
+    """
+    return await user_service.get_compatible_users(
+        user_id, skip=skip, limit=limit
+    )
+
+
 @user_router.put("/{user_id}", response_model=UserDetail)
 async def update_user(
     user_id: str,
@@ -108,6 +136,25 @@ async def create_lotto_recommendation(
         )
 
 
+@user_router.post(
+    "/{user_id}/lotto-recommendation/stream", response_class=StreamingResponse
+)
+async def stream_lotto_recommendation(user_id: str, request: Request):
+    """
+    사용자별 로또 추천을 생성하며 SSE로 스트리밍합니다.
+
+    - delta: 생성 중인 응답 조각 ({"content": ...})
+    - result: 저장된 로또 추천 (POST /lotto-recommendation 응답과 동일)
+    - error: 생성 실패 ({"status_code": ..., "detail": ...})
+    """
+    return await sse_response(
+        request,
+        lambda session: get_lotto_service(session).stream_lotto_recommendation(
+            user_id
+        ),
+    )
+
+
 @user_router.get(
     "/{user_id}/lotto-recommendation", response_model=Optional[LottoRecommendation]
 )
@@ -157,6 +204,31 @@ async def get_user_daily_fortune_details(
     return await fortune_service.get_user_daily_fortune_detail(user_id, fortune_date)
 
 
+@user_router.get(
+    "/{user_id}/daily-fortune-details/stream", response_class=StreamingResponse
+)
+async def stream_user_daily_fortune_details(
+    user_id: str,
+    request: Request,
+    fortune_date: date = Query(default_factory=get_kst_date),
+):
+    """
+    사용자의 특정 날짜 운세 상세 정보를 SSE로 스트리밍합니다.
+
+    - delta: 생성 중인 응답 조각 ({"content": ...})
+    - result: 운세 상세 정보 (GET /daily-fortune-details 응답과 동일)
+    - error: 생성 실패 ({"status_code": ..., "detail": ...})
+
+    이미 생성된 운세가 있으면 result만 전송합니다.
+    """
+    return await sse_response(
+        request,
+        lambda session: get_fortune_service(
+            session
+        ).stream_user_daily_fortune_detail(user_id, fortune_date),
+    )
+
+
 @user_router.post(
     "/{user_id}/lotto-recommendation/{round}/check",
     response_model=LottoResultCheckResponse,
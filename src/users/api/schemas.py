@@ -1,10 +1,12 @@
 from datetime import date
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Self, Tuple
+
+from pydantic import model_validator
 
 from src.config.schemas import CommonBase
 from src.four_pillars import FourPillarDetail
-from src.users.common.utils import TimeUtils
-from src.users.domain.entities.enums import Gender
+from src.users.common.utils import LunarUtils, TimeUtils
+from src.users.domain.entities.enums import CalendarType, Gender
 
 
 class UserBase(CommonBase):
@@ -14,7 +16,35 @@ class UserBase(CommonBase):
     is_active: bool = True
 
 
-class UserCreate(CommonBase):
+class LunarBirthDateMixin(CommonBase):
+    """음력 birth_date 입력 (생성/수정 공통)"""
+
+    calendar_type: CalendarType = CalendarType.SOLAR  # birth_date의 달력
+    is_leap_month: bool = False  # 음력 윤달 여부
+
+    @model_validator(mode="before")
+    @classmethod
+    def convert_lunar_birth_date(cls, data: Any) -> Any:
+        """음력으로 입력한 birth_date를 양력으로 변환 (이후 birth_date는 항상 양력)"""
+        if (
+            isinstance(data, dict)
+            and data.get("calendar_type") == CalendarType.LUNAR
+            and data.get("birth_date") is not None
+        ):
+            data = dict(data)
+            data["birth_date"] = LunarUtils.to_solar_date(
+                data["birth_date"], bool(data.get("is_leap_month"))
+            )
+        return data
+
+    @model_validator(mode="after")
+    def check_leap_month(self) -> Self:
+        if self.is_leap_month and self.calendar_type != CalendarType.LUNAR:
+            raise ValueError("is_leap_month requires LUNAR calendar_type")
+        return self
+
+
+class UserCreate(LunarBirthDateMixin):
     id: str
     name: str
     birth_date: date
@@ -27,7 +57,7 @@ class UserCreate(CommonBase):
             raise ValueError("Invalid birth_time range")
 
 
-class UserUpdate(CommonBase):
+class UserUpdate(LunarBirthDateMixin):
     name: Optional[str] = None
     birth_date: Optional[date] = None
     birth_time: Optional[Tuple[str, str]] = None  # 시간 범위 (start_time, end_time)
@@ -51,3 +81,15 @@ class UserDetail(CommonBase):
 class UserList(CommonBase):
     users: List[UserDetail]
     total: int
+
+
+class CompatibleUser(CommonBase):
+    id: str
+    name: str
+    gender: Gender
+    score: int  # 궁합 점수 (0-100)
+
+
+class CompatibleUserList(CommonBase):
+    users: List[CompatibleUser]
+    total: int  # 비교한 전체 사용자 수
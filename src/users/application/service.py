@@ -6,18 +6,35 @@ from src.four_pillars import (
     FourPillarDetail,
     FourPillarDescriptionGenerator,
     FourPillarsCalculator,
+    rank_compatibility,
+    score_compatibility,
 )
+from src.four_pillars.domain.interfaces import IFourPillarDescriptionRepository
 from src.users.common.utils import TimeUtils
-from src.users.api.schemas import UserCreate, UserDetail, UserList, UserUpdate
+from src.users.api.schemas import (
+    CompatibleUser,
+    CompatibleUserList,
+    UserCreate,
+    UserDetail,
+    UserList,
+    UserUpdate,
+)
 from src.users.domain.interfaces import IUserRepository
 
 
 class UserService:
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        description_repository: IFourPillarDescriptionRepository | None = None,
+    ):
         self.repository = user_repository
         # description_generator를 주입하여 설명 생성 기능 활성화
+        # (같은 사주의 설명은 description_repository에 캐시)
         self.four_pillar_calculator = FourPillarsCalculator(
-            description_generator=FourPillarDescriptionGenerator()
+            description_generator=FourPillarDescriptionGenerator(
+                repository=description_repository
+            )
         )
 
     async def get_users(self, skip: int = 0, limit: int = 100) -> UserList:
@@ -100,6 +117,48 @@ class UserService:
 
         return self._convert_user_to_detail(updated_user)
 
+    async def get_compatible_users(
+        self, user_id: str, skip: int = 0, limit: int = 20
+    ) -> CompatibleUserList:
+        """다른 활성 사용자들과의 궁합 점수 순위 (점수 내림차순)"""
+        user = await self.repository.get_user_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        # 메모리에 보관한 후보 사주 배열로 한 번의 벡터 연산으로 점수 계산
+        repository = self.repository
+        user_ids, candidates = await repository.get_compatibility_candidates(
+            exclude_user_id=user_id
+        )
+        if not user_ids:
+            return CompatibleUserList(users=[], total=0)
+
+        scores = score_compatibility(
+            self.four_pillar_calculator.calculate_four_pillar_codes(
+                user.birth_date
+            ),
+            candidates,
+        )
+        page, total = rank_compatibility(scores, skip=skip, limit=limit)
+
+        users = await self.repository.get_users_by_ids(
+            [user_ids[index] for index in page]
+        )
+        users_by_id = {candidate.id: candidate for candidate in users}
+        return CompatibleUserList(
+            users=[
+                CompatibleUser(
+                    id=users_by_id[user_ids[index]].id,
+                    name=users_by_id[user_ids[index]].name,
+                    gender=users_by_id[user_ids[index]].gender,
+                    score=int(scores[index]),
+                )
+                for index in page
+                if user_ids[index] in users_by_id
+            ],
+            total=total,
+        )
+
     def _convert_user_to_detail(self, user) -> UserDetail:
         """User 모델을 UserDetail로 변환 (birth_time을 시간 범위로 변환)"""
         user_dict = user.__dict__.copy()
@@ -1,6 +1,8 @@
-from datetime import time
+from datetime import date, time
 from typing import Optional, Tuple
 
+from src.four_pillars import LunarTable
+
 
 class TimeUtils:
     # 시간 범위 정의 (2시간 단위)
@@ -74,3 +76,24 @@ class TimeUtils:
                 return True
 
         return False
+
+
+class LunarUtils:
+    @staticmethod
+    def to_solar_date(value: date | str, is_leap_month: bool = False) -> date:
+        """
+        음력 날짜(YYYY-MM-DD 문자열 또는 date)를 양력 date로 변환
+        음력은 2월 30일처럼 양력에 없는 날짜가 있으므로 문자열로 받습니다.
+        """
+        if isinstance(value, date):
+            year, month, day = value.year, value.month, value.day
+        else:
+            try:
+                year, month, day = (int(part) for part in str(value).split("-"))
+            except ValueError:
+                raise ValueError("Invalid lunar birth_date format")
+
+        solar_date = LunarTable().to_solar(year, month, day, is_leap_month)
+        if solar_date is None:
+            raise ValueError("Invalid lunar birth_date")
+        return solar_date
@@ -4,3 +4,10 @@ from enum import Enum
 class Gender(str, Enum):
     F = "F"
     M = "M"
+
+
+class CalendarType(str, Enum):
+    """생년월일 입력 달력"""
+
+    SOLAR = "SOLAR"  # 양력
+    LUNAR = "LUNAR"  # 음력
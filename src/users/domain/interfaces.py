@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Tuple
 
-from src.four_pillars import FourPillarDetail
+from src.four_pillars import FourPillarDetail, FourPillarsBatchResult
 from src.users.api.schemas import UserCreate, UserUpdate
 from src.users.domain.entities.models import User
 
@@ -39,3 +39,13 @@ class IUserRepository(Protocol):
     ) -> Optional[User]:
         """사용자를 업데이트합니다."""
         ...
+
+    async def get_compatibility_candidates(
+        self, exclude_user_id: Optional[str] = None
+    ) -> Tuple[List[str], FourPillarsBatchResult]:
+        """궁합 후보(활성 사용자)의 ID와 사주 배열을 조회합니다."""
+        ...
+
+    async def get_users_by_ids(self, user_ids: List[str]) -> List[User]:
+        """여러 사용자를 ID로 조회합니다."""
+        ...
@@ -0,0 +1,154 @@
+"""사용자 사주 인덱스
+
+궁합 순위는 모든 활성 사용자를 후보로 점수를 계산하므로, 요청마다 전체 사용자의
+생년월일시를 조회하여 사주를 다시 계산하지 않도록 사용자별 60간지 인덱스와
+강한/약한 오행을 (사용자 수 x 6) int8 배열로 보관합니다 (열 순서는 FourPillarsBatchResult와 같음).
+
+- 처음 조회할 때 활성 사용자 전체를 한 번 읽어 calculate_four_pillars_batch로 만듭니다.
+- 이후에는 SYNC_INTERVAL 초에 한 번, 마지막 동기화 이후 updated_at이 바뀐 사용자만
+  읽어 그 사용자의 행만 다시 계산합니다 (다른 워커의 변경 포함).
+- 이 프로세스에서 사용자를 생성/수정하면 request_sync()로 다음 조회에서 바로
+  동기화합니다. 트랜잭션이 롤백될 수 있으므로 인덱스는 커밋된 데이터로만 바꿉니다.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.four_pillars import (
+    FourPillarsBatchResult,
+    calculate_four_pillars_batch,
+)
+
+# 다른 워커의 변경을 확인하는 주기 (초)
+SYNC_INTERVAL = 5.0
+
+_COLUMNS = len(FourPillarsBatchResult._fields)
+
+
+class UserPillarIndex:
+    """사용자 사주 인덱스 (싱글톤)"""
+
+    _instance: Optional["UserPillarIndex"] = None
+
+    user_ids: List[str]
+    positions: Dict[str, int]
+    active: np.ndarray
+    pillars: np.ndarray
+    size: int
+    loaded: bool
+    synced_until: Optional[datetime]
+    next_sync: float
+    loads: int
+    updates: int
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "UserPillarIndex":
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+            cls._instance._reset()
+            cls._instance.loaded = False
+            cls._instance.synced_until = None
+            cls._instance.next_sync = 0.0
+            cls._instance.loads = 0
+            cls._instance.updates = 0
+        return cls._instance
+
+    def _reset(self, capacity: int = 0) -> None:
+        self.size = 0
+        self.user_ids = []
+        self.positions = {}
+        self.active = np.zeros(capacity, dtype=bool)
+        self.pillars = np.zeros((capacity, _COLUMNS), dtype=np.int8)
+
+    def _grow(self, capacity: int) -> None:
+        active = np.zeros(capacity, dtype=bool)
+        pillars = np.zeros((capacity, _COLUMNS), dtype=np.int8)
+        active[: self.size] = self.active[: self.size]
+        pillars[: self.size] = self.pillars[: self.size]
+        self.active, self.pillars = active, pillars
+
+    def replace(
+        self,
+        user_ids: Sequence[str],
+        birth_dates: Sequence[datetime],
+        synced_until: Optional[datetime],
+    ) -> None:
+        """활성 사용자 전체로 인덱스를 다시 만듭니다."""
+        self._reset(len(user_ids))
+        self.upsert(user_ids, birth_dates, [True] * len(user_ids))
+        self.loaded = True
+        self.synced_until = synced_until
+        self.next_sync = time.monotonic() + SYNC_INTERVAL
+        self.loads += 1
+
+    def upsert(
+        self,
+        user_ids: Sequence[str],
+        birth_dates: Sequence[datetime],
+        active: Sequence[bool],
+    ) -> None:
+        """사용자들의 행을 다시 계산합니다 (없으면 추가, 비활성이면 후보에서 제외)."""
+        if not user_ids:
+            return
+        rows = np.column_stack(
+            calculate_four_pillars_batch(
+                np.array(birth_dates, dtype="datetime64[m]")
+            )
+        )
+
+        new_ids = [uid for uid in user_ids if uid not in self.positions]
+        end = self.size + len(set(new_ids))
+        if end > len(self.active):
+            self._grow(max(end, 2 * len(self.active)))
+
+        for user_id, row, is_active in zip(user_ids, rows, active):
+            position = self.positions.get(user_id)
+            if position is None:
+                position = self.size
+                self.positions[user_id] = position
+                self.user_ids.append(user_id)
+                self.size += 1
+            self.pillars[position] = row
+            self.active[position] = is_active
+        self.updates += 1
+
+    def needs_sync(self) -> bool:
+        return time.monotonic() >= self.next_sync
+
+    def request_sync(self) -> None:
+        """다음 조회에서 동기화하도록 합니다."""
+        self.next_sync = 0.0
+
+    def mark_synced(self, synced_until: Optional[datetime]) -> None:
+        if synced_until is not None and (
+            self.synced_until is None or synced_until > self.synced_until
+        ):
+            self.synced_until = synced_until
+        self.next_sync = time.monotonic() + SYNC_INTERVAL
+
+    def candidates(
+        self, exclude_user_id: Optional[str] = None
+    ) -> Tuple[List[str], FourPillarsBatchResult]:
+        """활성 사용자(exclude_user_id 제외)의 ID와 사주 배열 (인덱스 순서)"""
+        mask = self.active[: self.size].copy()
+        excluded = self.positions.get(exclude_user_id or "")
+        if excluded is not None:
+            mask[excluded] = False
+        rows = np.flatnonzero(mask)
+        pillars = self.pillars[rows]
+        return (
+            [self.user_ids[row] for row in rows.tolist()],
+            FourPillarsBatchResult(*(pillars[:, i] for i in range(_COLUMNS))),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "users": self.size,
+            "active": int(self.active[: self.size].sum()),
+            "loads": self.loads,
+            "updates": self.updates,
+            "synced_until": self.synced_until,
+        }
@@ -1,17 +1,22 @@
-from datetime import datetime, time
-from typing import List, Optional
+from datetime import datetime, time, timedelta
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.four_pillars import FourPillarDetail
+from src.four_pillars import FourPillarDetail, FourPillarsBatchResult
 from src.users.api.schemas import UserCreate, UserUpdate
 from src.users.domain.entities.models import User
+from src.users.infrastructure.pillar_index import UserPillarIndex
+
+# 동기화 시 updated_at을 겹쳐 조회하는 구간 (늦게 커밋된 트랜잭션의 변경 대비)
+SYNC_OVERLAP = timedelta(minutes=1)
 
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.pillar_index = UserPillarIndex()
 
     async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         query = select(User).where(User.is_active).offset(skip).limit(limit)
@@ -52,6 +57,8 @@ class UserRepository:
         self.session.add(user)
         await self.session.flush()
         await self.session.refresh(user)
+        # 커밋 전이므로 인덱스는 다음 조회에서 커밋된 데이터로 동기화
+        self.pillar_index.request_sync()
 
         return user
 
@@ -66,7 +73,10 @@ class UserRepository:
         if not user:
             return None
 
-        update_data = user_update.model_dump(exclude_unset=True)
+        # calendar_type/is_leap_month는 입력 해석용이며 저장하지 않음
+        update_data = user_update.model_dump(
+            exclude_unset=True, exclude={"calendar_type", "is_leap_month"}
+        )
 
         # birth_datetime이 제공된 경우 birth_date 업데이트
         if birth_datetime is not None:
@@ -81,5 +91,54 @@ class UserRepository:
 
         await self.session.flush()
         await self.session.refresh(user)
+        # 커밋 전이므로 인덱스는 다음 조회에서 커밋된 데이터로 동기화
+        self.pillar_index.request_sync()
 
         return user
+
+    async def get_compatibility_candidates(
+        self, exclude_user_id: Optional[str] = None
+    ) -> Tuple[List[str], FourPillarsBatchResult]:
+        """궁합 후보(활성 사용자)의 ID와 사주 배열을 사주 인덱스에서 조회합니다."""
+        index = self.pillar_index
+        if not index.loaded:
+            query = select(User.id, User.birth_date).where(User.is_active)
+            result = await self.session.execute(query.order_by(User.id))
+            rows = result.all()
+            synced_until = (
+                await self.session.execute(select(func.max(User.updated_at)))
+            ).scalar_one_or_none()
+            index.replace(
+                [row.id for row in rows],
+                [row.birth_date for row in rows],
+                synced_until,
+            )
+        elif index.needs_sync():
+            await self._sync_pillar_index()
+        return index.candidates(exclude_user_id)
+
+    async def _sync_pillar_index(self) -> None:
+        """다른 워커에서 생성/수정된 사용자를 사주 인덱스에 반영합니다."""
+        index = self.pillar_index
+        query = select(
+            User.id, User.birth_date, User.is_active, User.updated_at
+        )
+        if index.synced_until is not None:
+            query = query.where(
+                User.updated_at >= index.synced_until - SYNC_OVERLAP
+            )
+        rows = (await self.session.execute(query)).all()
+        index.upsert(
+            [row.id for row in rows],
+            [row.birth_date for row in rows],
+            [bool(row.is_active) for row in rows],
+        )
+        index.mark_synced(max((row.updated_at for row in rows), default=None))
+
+    async def get_users_by_ids(self, user_ids: List[str]) -> List[User]:
+        """여러 사용자를 ID로 조회합니다."""
+        if not user_ids:
+            return []
+        query = select(User).where(User.id.in_(user_ids), User.is_active)
+        result = await self.session.execute(query)
+        return result.scalars().all()